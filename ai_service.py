@@ -7,11 +7,14 @@ import json
 import time
 from typing import Dict, List, Optional
 
-import requests
+import httpx
 
 from config import AI_SERVER_TIMEOUT, AI_SUMMARIZE_URL
-from logger import log_dict, setup_logger
+from http_client import get_http_client
+from logger import log_dict, print_progress, setup_logger
 from models import ProcessedAIResponse
+from pdf_buffer import PdfBuffer
+from rate_limiter import AI_SERVER, rate_limit
 
 logger = setup_logger("ai_service")
 
@@ -110,7 +113,7 @@ def process_ai_response(ai_response: Dict) -> ProcessedAIResponse:
             logger.debug(f"thumbnail 디코딩 완료: {len(thumbnail_bytes)} bytes")
         except Exception as e:
             logger.error(f"썸네일 디코딩 실패: {str(e)}", exc_info=True)
-            print(f"    ⚠ 경고: 썸네일 디코딩 실패: {str(e)[:50]}")
+            print_progress(f"    ⚠ 경고: 썸네일 디코딩 실패: {str(e)[:50]}")
     else:
         logger.warning("AI 응답에 'thumbnail' 없음 또는 비어있음")
     
@@ -121,12 +124,12 @@ def process_ai_response(ai_response: Dict) -> ProcessedAIResponse:
     return processed
 
 
-def summarize_paper_with_ai(pdf_content: bytes, activities: List[Dict], paper_id: str) -> Optional[ProcessedAIResponse]:
+async def summarize_paper_with_ai(pdf_content: PdfBuffer, activities: List[Dict], paper_id: str) -> Optional[ProcessedAIResponse]:
     """
     AI 서버로 PDF와 활동 정보를 전송하여 논문 요약 받기
     
     Args:
-        pdf_content: PDF 파일의 바이너리 데이터
+        pdf_content: PDF 버퍼
         activities: 사용자 활동 정보 목록
         paper_id: 논문 ID
     
@@ -155,11 +158,7 @@ def summarize_paper_with_ai(pdf_content: bytes, activities: List[Dict], paper_id
         else:
             logger.info(f"사용자 활동 정보: {activities}")
         
-        # multipart/form-data로 전송
-        files = {
-            'file': (f'{paper_id}.pdf', pdf_content, 'application/pdf')
-        }
-        
+        # multipart/form-data로 전송 (PDF 파일은 요청 직전에 스트림으로 열어 전달)
         data = {
             'id': paper_id,  # Paper ID 추가 (예: arxiv:2401.12345v1)
             'activity': json.dumps(activities)
@@ -172,15 +171,21 @@ def summarize_paper_with_ai(pdf_content: bytes, activities: List[Dict], paper_id
         logger.debug(f"  activity: {len(json.dumps(activities))} 문자")
         logger.debug(f"  file: {paper_id}.pdf ({len(pdf_content)} bytes)")
         
-        print("  → AI 서버로 요약 요청 중...", end=" ", flush=True)
+        print_progress("  → AI 서버로 요약 요청 중...")
         
+        await rate_limit(AI_SERVER)
         request_start = time.time()
-        response = requests.post(
-            AI_SUMMARIZE_URL,
-            files=files,
-            data=data,
-            timeout=AI_SERVER_TIMEOUT
-        )
+        # PDF 버퍼를 복사하지 않고 스트림으로 전달 (요청이 끝나면 닫음)
+        pdf_stream = pdf_content.open()
+        try:
+            response = await get_http_client().post(
+                AI_SUMMARIZE_URL,
+                files={'file': (f'{paper_id}.pdf', pdf_stream, 'application/pdf')},
+                data=data,
+                timeout=AI_SERVER_TIMEOUT
+            )
+        finally:
+            pdf_stream.close()
         request_time = time.time() - request_start
         
         logger.info(f"AI 서버 응답 수신 완료 (소요 시간: {request_time:.2f}초)")
@@ -208,10 +213,10 @@ def summarize_paper_with_ai(pdf_content: bytes, activities: List[Dict], paper_id
         
         logger.debug(f"응답 키: {list(ai_response.keys())}")
         
-        print("성공")
+        print_progress("  → AI 서버 요약: 성공")
         # 응답 출력 시에도 thumbnail 축약
         response_preview = response_for_log[:200] if len(response_for_log) > 200 else response_for_log
-        print(f"  → AI 서버 응답: {response_preview}...")
+        print_progress(f"  → AI 서버 응답: {response_preview}...")
         
         # AI 응답 상세 로깅
         if 'summary' in ai_response:
@@ -259,7 +264,7 @@ def summarize_paper_with_ai(pdf_content: bytes, activities: List[Dict], paper_id
             'interested_users_count': len(json.loads(processed_response.get('interestedUsers', '[]'))),
             'notifications_count': len(json.loads(processed_response.get('notifications', '[]'))) if 'notifications' in processed_response else 0
         }
-        print(f"  → AI 응답 처리 완료: {json.dumps(summary_info, ensure_ascii=False)}")
+        print_progress(f"  → AI 응답 처리 완료: {json.dumps(summary_info, ensure_ascii=False)}")
         logger.info(f"응답 처리 완료: {summary_info}")
         
         elapsed = time.time() - start_time
@@ -268,29 +273,29 @@ def summarize_paper_with_ai(pdf_content: bytes, activities: List[Dict], paper_id
         
         return processed_response
         
-    except requests.exceptions.Timeout as e:
+    except httpx.TimeoutException as e:
         elapsed = time.time() - start_time
         logger.error(f"AI 서버 타임아웃 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"타임아웃 설정: {AI_SERVER_TIMEOUT}초")
-        print(f"실패 (타임아웃: {str(e)[:100]})")
+        print_progress(f"  → AI 서버 요약: 실패 (타임아웃: {str(e)[:100]})")
         return None
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         elapsed = time.time() - start_time
         logger.error(f"AI 서버 네트워크 오류 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"실패 (네트워크 오류: {str(e)[:100]})")
+        print_progress(f"  → AI 서버 요약: 실패 (네트워크 오류: {str(e)[:100]})")
         return None
     except json.JSONDecodeError as e:
         elapsed = time.time() - start_time
         logger.error(f"AI 서버 응답 파싱 오류 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"응답 내용: {response.text[:500]}...")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"실패 (응답 파싱 오류: {str(e)[:100]})")
+        print_progress(f"  → AI 서버 요약: 실패 (응답 파싱 오류: {str(e)[:100]})")
         return None
     except Exception as e:
         elapsed = time.time() - start_time
         logger.error(f"AI 서버 처리 중 오류 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"실패 (오류: {str(e)[:100]})")
+        print_progress(f"  → AI 서버 요약: 실패 (오류: {str(e)[:100]})")
         return None
 
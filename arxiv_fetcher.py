@@ -2,21 +2,29 @@
 ArXiv 논문 가져오기 모듈
 """
 
+import asyncio
+import itertools
 import re
-import time
-from typing import Dict, List
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
 
 import arxiv
 
+from arxiv_watermark import WatermarkFilter
 from config import (
     ARXIV_QUERY, 
     MAX_RESULTS_LATEST, 
     MAX_RESULTS_SCHEDULED,
     ARXIV_MAX_RETRIES,
     ARXIV_INITIAL_DELAY,
-    ARXIV_CLIENT_DELAY
+    ARXIV_CLIENT_DELAY,
+    ARXIV_CLIENT_BACKEND,
+    ARXIV_PAGE_SIZE,
+    ARXIV_WATERMARK_MAX_RESULTS,
+    ARXIV_WATERMARK_LOOKBACK_HOURS
 )
 from logger import setup_logger
+from models import ArxivWatermark
+from rate_limiter import ARXIV_API, get_rate_limiter
 
 logger = setup_logger("arxiv_fetcher")
 
@@ -174,34 +182,91 @@ def map_category_code_to_name(category_code: str) -> str:
     return ARXIV_CATEGORY_MAPPING.get(category_code, category_code)
 
 
-def fetch_arxiv_papers(
+def arxiv_retry_delay(error: Exception, attempt: int, max_retries: int, initial_delay: float) -> Optional[float]:
+    """
+    ArXiv API 오류의 재시도 대기 시간 (재시도하지 않으면 None)
+
+    Args:
+        error: 발생한 오류
+        attempt: 현재 페이지의 시도 번호 (0부터)
+        max_retries: 최대 재시도 횟수
+        initial_delay: 초기 재시도 지연 시간 (초)
+
+    Returns:
+        대기 시간 (초) 또는 None (재시도 횟수 초과)
+    """
+    if isinstance(error, arxiv.HTTPError):
+        # 상태 코드 추출 (속성 또는 에러 메시지에서)
+        status_code = None
+        if hasattr(error, 'status_code'):
+            status_code = error.status_code
+        else:
+            # 에러 메시지에서 HTTP 상태 코드 파싱
+            error_msg = str(error)
+            match = re.search(r'HTTP (\d+)', error_msg)
+            if match:
+                status_code = int(match.group(1))
+        
+        # HTTP 429 (Too Many Requests) 오류인 경우
+        if status_code == 429:
+            if attempt < max_retries - 1:
+                # 지수 백오프: 3초, 6초, 12초, 24초, 48초
+                delay = initial_delay * (2 ** attempt)
+                logger.warning(
+                    f"HTTP 429 오류 발생 (시도 {attempt + 1}/{max_retries}). "
+                    f"{delay:.1f}초 후 재시도합니다..."
+                )
+                print(f"  ⚠ Rate limit 도달. {delay:.1f}초 후 재시도...")
+                return delay
+            logger.error(f"모든 재시도 실패. HTTP 429 오류가 계속 발생합니다.")
+            print(f"  ✗ Rate limit 오류가 계속 발생합니다.")
+            return None
+
+        # 다른 HTTP 오류인 경우
+        status_str = f"HTTP {status_code}" if status_code else "알 수 없는 HTTP 오류"
+        logger.error(f"{status_str} 발생")
+    else:
+        logger.error(f"예상치 못한 오류 발생: {error}", exc_info=True)
+
+    if attempt < max_retries - 1:
+        delay = initial_delay * (2 ** attempt)
+        logger.warning(f"{delay:.1f}초 후 재시도합니다...")
+        return delay
+    return None
+
+
+def iter_arxiv_papers(
     query: str = ARXIV_QUERY,
     max_results: int = 100,
     sort_by: arxiv.SortCriterion = arxiv.SortCriterion.SubmittedDate,
     sort_order: arxiv.SortOrder = arxiv.SortOrder.Descending,
     max_retries: int = ARXIV_MAX_RETRIES,
-    initial_delay: float = ARXIV_INITIAL_DELAY
-) -> List[arxiv.Result]:
+    initial_delay: float = ARXIV_INITIAL_DELAY,
+    stop_at: Optional[Callable[[arxiv.Result], bool]] = None,
+    page_size: int = ARXIV_PAGE_SIZE
+) -> Iterator[arxiv.Result]:
     """
-    ArXiv에서 논문 목록 가져오기 (재시도 로직 포함)
+    ArXiv 검색 결과를 페이지를 받는 대로 하나씩 내보내는 생성기 (페이지 단위 재시도)
+    
+    페이지 요청이 실패하면 이미 내보낸 결과 다음 위치(offset)부터 다시 요청하므로
+    7번째 페이지에서 429가 나도 1번째 페이지부터 다시 받지 않음. 재시도 횟수는 페이지마다 새로 셈
     
     Args:
         query: 검색 쿼리
         max_results: 가져올 최대 논문 수
         sort_by: 정렬 기준
         sort_order: 정렬 순서
-        max_retries: 최대 재시도 횟수
+        max_retries: 페이지당 최대 시도 횟수
         initial_delay: 초기 재시도 지연 시간 (초)
+        stop_at: 이 함수가 True를 반환하는 결과에서 중단 (해당 결과 제외, 이후 페이지는 요청하지 않음)
+        page_size: 페이지 크기 (요청 하나당 결과 수)
     
-    Returns:
-        ArXiv Result 객체 리스트
+    Yields:
+        ArXiv Result 객체
     
     Raises:
-        arxiv.HTTPError: 모든 재시도 실패 시
+        arxiv.HTTPError: 한 페이지의 모든 재시도 실패 시
     """
-    print(f"ArXiv에서 논문 검색 중... (쿼리: {query})")
-    logger.info(f"ArXiv 검색 시작 - 쿼리: {query}, max_results: {max_results}")
-    
     search = arxiv.Search(
         query=query,
         max_results=max_results,
@@ -209,79 +274,166 @@ def fetch_arxiv_papers(
         sort_order=sort_order
     )
     
-    # ArXiv Client 설정 (Rate limiting 고려)
+    # ArXiv Client 설정 (Rate limiting 고려, 재시도는 아래에서 페이지 단위로 처리)
     client = arxiv.Client(
-        page_size=100,
+        page_size=page_size,
         delay_seconds=ARXIV_CLIENT_DELAY,  # 기본 딜레이
-        num_retries=3
+        num_retries=0
     )
     
-    last_exception = None
+    # 재시도 대기는 arXiv API 버킷에 반영하여, 이 호출뿐 아니라 같은 목적지로 가는
+    # 다른 요청도 함께 늦춤 (이벤트 루프가 아닌 워커 스레드에서 호출되어야 함)
+    limiter = get_rate_limiter(ARXIV_API)
+    offset = 0
+    attempt = 0
     
-    for attempt in range(max_retries):
+    while True:
         try:
-            logger.info(f"ArXiv API 요청 시도 {attempt + 1}/{max_retries}")
-            results = list(client.results(search))
-            
-            logger.info(f"ArXiv 검색 성공 - 논문 {len(results)}개 발견")
-            print(f"논문 {len(results)}개 발견")
-            return results
-            
-        except arxiv.HTTPError as e:
-            last_exception = e
-            
-            # 상태 코드 추출 (속성 또는 에러 메시지에서)
-            status_code = None
-            if hasattr(e, 'status_code'):
-                status_code = e.status_code
-            else:
-                # 에러 메시지에서 HTTP 상태 코드 파싱
-                error_msg = str(e)
-                match = re.search(r'HTTP (\d+)', error_msg)
-                if match:
-                    status_code = int(match.group(1))
-            
-            # HTTP 429 (Too Many Requests) 오류인 경우
-            if status_code == 429:
-                if attempt < max_retries - 1:
-                    # 지수 백오프: 3초, 6초, 12초, 24초, 48초
-                    delay = initial_delay * (2 ** attempt)
-                    logger.warning(
-                        f"HTTP 429 오류 발생 (시도 {attempt + 1}/{max_retries}). "
-                        f"{delay:.1f}초 후 재시도합니다..."
-                    )
-                    print(f"  ⚠ Rate limit 도달. {delay:.1f}초 후 재시도...")
-                    time.sleep(delay)
-                else:
-                    logger.error(f"모든 재시도 실패. HTTP 429 오류가 계속 발생합니다.")
-                    print(f"  ✗ Rate limit 오류가 계속 발생합니다.")
-            else:
-                # 다른 HTTP 오류인 경우
-                status_str = f"HTTP {status_code}" if status_code else "알 수 없는 HTTP 오류"
-                logger.error(f"{status_str} 발생")
-                if attempt < max_retries - 1:
-                    delay = initial_delay * (2 ** attempt)
-                    logger.warning(f"{delay:.1f}초 후 재시도합니다...")
-                    time.sleep(delay)
-                else:
-                    raise
+            limiter.acquire_blocking()
+            logger.info(f"ArXiv API 요청 - offset {offset}, 시도 {attempt + 1}/{max_retries}")
+            for result in client.results(search, offset=offset):
+                if stop_at is not None and stop_at(result):
+                    return
+                offset += 1
+                # 결과를 받았으면 이 페이지는 성공이므로 재시도 횟수 초기화
+                attempt = 0
+                yield result
+            return
         
         except Exception as e:
-            last_exception = e
-            logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
-            if attempt < max_retries - 1:
-                delay = initial_delay * (2 ** attempt)
-                logger.warning(f"{delay:.1f}초 후 재시도합니다...")
-                time.sleep(delay)
-            else:
+            delay = arxiv_retry_delay(e, attempt, max_retries, initial_delay)
+            if delay is None:
+                logger.critical(f"모든 재시도 실패 (offset {offset}). ArXiv API 요청을 중단합니다.")
                 raise
+            attempt += 1
+            limiter.defer(delay)
+
+
+def fetch_arxiv_papers(
+    query: str = ARXIV_QUERY,
+    max_results: int = 100,
+    sort_by: arxiv.SortCriterion = arxiv.SortCriterion.SubmittedDate,
+    sort_order: arxiv.SortOrder = arxiv.SortOrder.Descending,
+    max_retries: int = ARXIV_MAX_RETRIES,
+    initial_delay: float = ARXIV_INITIAL_DELAY,
+    stop_at: Optional[Callable[[arxiv.Result], bool]] = None
+) -> List[arxiv.Result]:
+    """
+    ArXiv에서 논문 목록 가져오기 (재시도 로직 포함)
     
-    # 모든 재시도 실패
-    if last_exception:
-        logger.critical("모든 재시도 실패. ArXiv API 요청을 중단합니다.")
-        raise last_exception
+    Args:
+        query: 검색 쿼리
+        max_results: 가져올 최대 논문 수
+        sort_by: 정렬 기준
+        sort_order: 정렬 순서
+        max_retries: 페이지당 최대 시도 횟수
+        initial_delay: 초기 재시도 지연 시간 (초)
+        stop_at: 이 함수가 True를 반환하는 결과에서 중단 (해당 결과 제외, 이후 페이지는 요청하지 않음)
+    
+    Returns:
+        ArXiv Result 객체 리스트 (ARXIV_CLIENT_BACKEND=native이면 ArxivRecord 리스트)
+    
+    Raises:
+        arxiv.HTTPError: 모든 재시도 실패 시
+    """
+    print(f"ArXiv에서 논문 검색 중... (쿼리: {query})")
+    logger.info(f"ArXiv 검색 시작 - 쿼리: {query}, max_results: {max_results}, client: {ARXIV_CLIENT_BACKEND}")
     
-    return []
+    if ARXIV_CLIENT_BACKEND == "native":
+        # 워커 스레드에서 호출되므로 스레드 전용 이벤트 루프에서 실행
+        results = asyncio.run(_collect_native_papers(query, max_results, sort_by, sort_order, max_retries, initial_delay, stop_at))
+    else:
+        results = list(iter_arxiv_papers(query, max_results, sort_by, sort_order, max_retries, initial_delay, stop_at))
+    
+    logger.info(f"ArXiv 검색 성공 - 논문 {len(results)}개 발견")
+    print(f"논문 {len(results)}개 발견")
+    return results
+
+
+async def _collect_native_papers(
+    query: str,
+    max_results: int,
+    sort_by: arxiv.SortCriterion,
+    sort_order: arxiv.SortOrder,
+    max_retries: int,
+    initial_delay: float,
+    stop_at: Optional[Callable] = None
+) -> List:
+    """네이티브 클라이언트로 검색 결과 전체를 모음 (ArxivRecord 리스트)"""
+    from arxiv_native import iter_native_pages
+    
+    pages = iter_native_pages(query, max_results, sort_by, sort_order, max_retries, initial_delay, stop_at, ARXIV_PAGE_SIZE)
+    return [record async for page in pages for record in page]
+
+
+async def stream_arxiv_papers(
+    query: str = ARXIV_QUERY,
+    max_results: int = 100,
+    sort_by: arxiv.SortCriterion = arxiv.SortCriterion.SubmittedDate,
+    sort_order: arxiv.SortOrder = arxiv.SortOrder.Descending,
+    stop_at: Optional[Callable[[arxiv.Result], bool]] = None,
+    page_size: int = ARXIV_PAGE_SIZE
+) -> AsyncIterator[List[arxiv.Result]]:
+    """
+    ArXiv 검색 결과를 페이지가 도착하는 대로 내보내는 비동기 이터레이터
+    
+    전체 결과를 모으지 않고 페이지 단위로 처리로 넘기며, 현재 페이지를 처리하는 동안
+    다음 페이지를 워커 스레드에서 미리 받음 (요청 간격과 재시도는 iter_arxiv_papers와 같음)
+    
+    Args:
+        query: 검색 쿼리
+        max_results: 가져올 최대 논문 수
+        sort_by: 정렬 기준
+        sort_order: 정렬 순서
+        stop_at: 이 함수가 True를 반환하는 결과에서 중단
+        page_size: 페이지 크기
+    
+    Yields:
+        ArXiv Result 객체 리스트 (한 페이지, ARXIV_CLIENT_BACKEND=native이면 ArxivRecord 리스트)
+    """
+    print(f"ArXiv에서 논문 검색 중... (쿼리: {query}, 페이지 단위 처리)")
+    logger.info(
+        f"ArXiv 스트리밍 검색 시작 - 쿼리: {query}, max_results: {max_results}, "
+        f"page_size: {page_size}, client: {ARXIV_CLIENT_BACKEND}"
+    )
+    
+    native = ARXIV_CLIENT_BACKEND == "native"
+    if native:
+        from arxiv_native import iter_native_pages
+        
+        # 네이티브 클라이언트는 이벤트 루프에서 직접 요청 (API가 짧은 페이지를 줄 수 있으므로 끝까지 요청)
+        native_pages = iter_native_pages(
+            query, max_results, sort_by, sort_order, ARXIV_MAX_RETRIES, ARXIV_INITIAL_DELAY, stop_at, page_size
+        )
+        
+        async def next_page() -> List:
+            return await anext(native_pages, [])
+    else:
+        results = iter_arxiv_papers(query, max_results, sort_by, sort_order, stop_at=stop_at, page_size=page_size)
+        
+        async def next_page() -> List[arxiv.Result]:
+            return await asyncio.to_thread(lambda: list(itertools.islice(results, page_size)))
+    
+    fetched = 0
+    pending = asyncio.ensure_future(next_page())
+    try:
+        while True:
+            page = await pending
+            if not page:
+                break
+            fetched += len(page)
+            logger.info(f"ArXiv 페이지 수신 - {len(page)}개 (누적 {fetched}개)")
+            pending = asyncio.ensure_future(next_page()) if native or len(page) == page_size else None
+            yield page
+            if pending is None:
+                break
+    finally:
+        if pending is not None and not pending.done():
+            # 소비자가 중간에 멈춘 경우 미리 받던 페이지는 버림
+            pending.cancel()
+    
+    logger.info(f"ArXiv 스트리밍 검색 완료 - 논문 {fetched}개")
+    print(f"논문 {fetched}개 수신")
 
 
 def fetch_latest_papers(max_results: int = MAX_RESULTS_LATEST) -> List[arxiv.Result]:
@@ -302,17 +454,66 @@ def fetch_latest_papers(max_results: int = MAX_RESULTS_LATEST) -> List[arxiv.Res
     )
 
 
-def fetch_scheduled_papers(max_results: int = MAX_RESULTS_SCHEDULED) -> List[arxiv.Result]:
+def fetch_scheduled_papers(
+    max_results: int = MAX_RESULTS_SCHEDULED,
+    watermark: Optional[ArxivWatermark] = None
+) -> List[arxiv.Result]:
     """
     스케줄링용 논문 가져오기
     
+    워터마크가 있으면 개수 대신 워터마크에 닿을 때까지 제출일 역순으로 페이지를 넘겨
+    이전 실행 이후의 새 논문만 반환 (최대 ARXIV_WATERMARK_MAX_RESULTS개 확인)
+    
     Args:
-        max_results: 가져올 최대 논문 수
+        max_results: 워터마크가 없을 때(첫 실행) 가져올 최대 논문 수
+        watermark: 이전 실행의 워터마크
     
     Returns:
         ArXiv Result 객체 리스트
     """
-    return fetch_arxiv_papers(
+    if watermark is None:
+        return fetch_arxiv_papers(
+            query=ARXIV_QUERY,
+            max_results=max_results,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending
+        )
+    
+    watermark_filter = WatermarkFilter(watermark, ARXIV_WATERMARK_LOOKBACK_HOURS)
+    logger.info(
+        f"워터마크 이후 논문 검색 - 워터마크: {watermark['published']}, "
+        f"lookback: {ARXIV_WATERMARK_LOOKBACK_HOURS}시간"
+    )
+    results = fetch_arxiv_papers(
+        query=ARXIV_QUERY,
+        max_results=ARXIV_WATERMARK_MAX_RESULTS,
+        sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending,
+        stop_at=watermark_filter.reached
+    )
+    if len(results) >= ARXIV_WATERMARK_MAX_RESULTS:
+        logger.warning(
+            f"워터마크에 닿기 전에 최대 확인 개수({ARXIV_WATERMARK_MAX_RESULTS})에 도달했습니다. "
+            f"그 이전 논문은 처리되지 않습니다. (ARXIV_WATERMARK_MAX_RESULTS 조정)"
+        )
+    
+    new_results = [result for result in results if watermark_filter.is_new(result)]
+    logger.info(f"새 논문 {len(new_results)}개 (이미 처리한 논문 {len(results) - len(new_results)}개 제외)")
+    print(f"새 논문 {len(new_results)}개")
+    return new_results
+
+
+def stream_latest_papers(max_results: int = MAX_RESULTS_LATEST) -> AsyncIterator[List[arxiv.Result]]:
+    """
+    최신 논문을 페이지 단위로 가져오기
+    
+    Args:
+        max_results: 가져올 최대 논문 수
+    
+    Returns:
+        ArXiv Result 페이지의 비동기 이터레이터
+    """
+    return stream_arxiv_papers(
         query=ARXIV_QUERY,
         max_results=max_results,
         sort_by=arxiv.SortCriterion.SubmittedDate,
@@ -320,6 +521,48 @@ def fetch_scheduled_papers(max_results: int = MAX_RESULTS_SCHEDULED) -> List[arx
     )
 
 
+async def stream_scheduled_papers(
+    max_results: int = MAX_RESULTS_SCHEDULED,
+    watermark: Optional[ArxivWatermark] = None
+) -> AsyncIterator[List[arxiv.Result]]:
+    """
+    스케줄링용 논문을 페이지 단위로 가져오기 (fetch_scheduled_papers의 스트리밍 버전)
+    
+    Args:
+        max_results: 워터마크가 없을 때(첫 실행) 가져올 최대 논문 수
+        watermark: 이전 실행의 워터마크
+    
+    Yields:
+        ArXiv Result 객체 리스트 (한 페이지에서 이전 실행 이후의 새 논문)
+    """
+    if watermark is None:
+        async for page in stream_latest_papers(max_results):
+            yield page
+        return
+    
+    watermark_filter = WatermarkFilter(watermark, ARXIV_WATERMARK_LOOKBACK_HOURS)
+    logger.info(
+        f"워터마크 이후 논문 검색 - 워터마크: {watermark['published']}, "
+        f"lookback: {ARXIV_WATERMARK_LOOKBACK_HOURS}시간"
+    )
+    fetched = 0
+    async for page in stream_arxiv_papers(
+        query=ARXIV_QUERY,
+        max_results=ARXIV_WATERMARK_MAX_RESULTS,
+        sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending,
+        stop_at=watermark_filter.reached
+    ):
+        fetched += len(page)
+        yield [result for result in page if watermark_filter.is_new(result)]
+    
+    if fetched >= ARXIV_WATERMARK_MAX_RESULTS:
+        logger.warning(
+            f"워터마크에 닿기 전에 최대 확인 개수({ARXIV_WATERMARK_MAX_RESULTS})에 도달했습니다. "
+            f"그 이전 논문은 처리되지 않습니다. (ARXIV_WATERMARK_MAX_RESULTS 조정)"
+        )
+
+
 def extract_doi_from_result(paper: arxiv.Result) -> str:
     """
     Result 객체에서 DOI를 추출하는 함수
@@ -384,12 +627,17 @@ def transform_arxiv_to_paper_data(arxiv_result: arxiv.Result) -> Dict:
     ArXiv 결과를 PaperData 형식으로 변환
     
     Args:
-        arxiv_result: ArXiv Result 객체
+        arxiv_result: ArXiv Result 객체 또는 ArxivRecord (네이티브 클라이언트 결과)
     
     Returns:
         PaperData 딕셔너리
     """
     import json
+    from arxiv_native import ArxivRecord
+    
+    # 네이티브 클라이언트는 파싱할 때 이미 PaperData 필드로 변환해 둠
+    if isinstance(arxiv_result, ArxivRecord):
+        return arxiv_result.to_paper_data()
     
     # 논문 ID 추출
     paper_id = arxiv_result.entry_id.split('/')[-1] if arxiv_result.entry_id else None
@@ -0,0 +1,285 @@
+"""
+arXiv export API 네이티브 클라이언트 모듈
+
+arxiv 패키지는 응답 전체를 feedparser로 파싱해 무거운 arxiv.Result 객체를 만들고, 그 객체가 실행 내내 남아 있음.
+이 모듈은 httpx로 export API를 직접 호출하고 Atom XML을 받는 대로 XMLPullParser로 파싱하여
+PaperData 필드만 담은 __slots__ 레코드(ArxivRecord)를 만듦 (ARXIV_CLIENT_BACKEND=native).
+ArxivRecord는 워터마크/카탈로그가 사용하는 entry_id, published, get_short_id()를 제공하므로 arxiv.Result 대신 사용 가능
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Tuple
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+import arxiv
+import httpx
+
+from arxiv_fetcher import arxiv_retry_delay, map_category_code_to_name
+from config import ARXIV_API_TIMEOUT
+from logger import setup_logger
+from models import PaperData
+from rate_limiter import ARXIV_API, get_rate_limiter
+
+logger = setup_logger("arxiv_native")
+
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+# Atom 피드 네임스페이스
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+ISSUED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class EmptyPageError(Exception):
+    """결과가 남아 있는데 빈 페이지를 받은 경우 (arXiv API에서 가끔 발생, 재시도하면 해결됨)"""
+
+
+class ArxivRecord:
+    """
+    PaperData 필드만 담은 arXiv 검색 결과 레코드
+    """
+
+    __slots__ = ("paperId", "title", "categories", "authors", "summary", "doi", "url", "pdfUrl", "issuedAt")
+
+    def __init__(self, **fields: str):
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+
+    @property
+    def entry_id(self) -> str:
+        """arxiv.Result.entry_id와 같은 값 (예: http://arxiv.org/abs/2401.12345v1)"""
+        return self.url
+
+    @property
+    def published(self) -> datetime:
+        """제출 시각 (UTC)"""
+        return datetime.strptime(self.issuedAt, ISSUED_AT_FORMAT).replace(tzinfo=timezone.utc)
+
+    def get_short_id(self) -> str:
+        """arxiv.Result.get_short_id()와 같은 값 (예: 2401.12345v1, quant-ph/0201082v1)"""
+        return self.url.split("arxiv.org/abs/")[-1]
+
+    def to_paper_data(self) -> PaperData:
+        """PaperData 딕셔너리로 변환"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"ArxivRecord({self.paperId!r}, {self.title[:40]!r})"
+
+
+def _format_doi(doi: str, paper_id: str) -> str:
+    """DOI URL (없으면 arXiv ID, extract_doi_from_result와 같은 형식)"""
+    if not doi:
+        return f"arXiv:{paper_id}"
+    return doi if doi.startswith("http") else f"https://doi.org/{doi}"
+
+
+def parse_entry(entry: Element) -> Optional[ArxivRecord]:
+    """
+    Atom entry 요소를 레코드로 변환 (transform_arxiv_to_paper_data와 같은 값)
+
+    Args:
+        entry: Atom entry 요소
+
+    Returns:
+        ArxivRecord 또는 None (ID가 없는 불완전한 결과)
+    """
+    entry_id = (entry.findtext(f"{ATOM}id") or "").strip()
+    if not entry_id:
+        return None
+    paper_id = entry_id.split("/")[-1]
+
+    published = (entry.findtext(f"{ATOM}published") or "").strip()
+    if published:
+        published = datetime.fromisoformat(published.replace("Z", "+00:00")).astimezone(timezone.utc).strftime(ISSUED_AT_FORMAT)
+
+    category_codes = [category.get("term") for category in entry.iterfind(f"{ATOM}category") if category.get("term")]
+    authors = [(author.findtext(f"{ATOM}name") or "").strip() for author in entry.iterfind(f"{ATOM}author")]
+
+    return ArxivRecord(
+        paperId=paper_id,
+        # arxiv 패키지와 같이 제목의 줄바꿈/연속 공백은 공백 하나로
+        title=" ".join((entry.findtext(f"{ATOM}title") or "").split()),
+        categories=json.dumps([map_category_code_to_name(code) for code in category_codes]),
+        authors=json.dumps(authors),
+        summary=(entry.findtext(f"{ATOM}summary") or "").strip(),
+        doi=_format_doi((entry.findtext(f"{ARXIV}doi") or "").strip(), paper_id),
+        url=entry_id,
+        pdfUrl=entry_id.replace("/abs/", "/pdf/") + ".pdf",
+        issuedAt=published
+    )
+
+
+class AtomPageParser:
+    """
+    Atom 피드 한 페이지를 받는 대로 파싱 (entry가 끝날 때마다 레코드로 바꾸고 XML 요소는 버림)
+    """
+
+    def __init__(self):
+        self.total_results: Optional[int] = None
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._root: Optional[Element] = None
+
+    def feed(self, data: bytes) -> List[ArxivRecord]:
+        """
+        응답 데이터 조각을 파싱
+
+        Args:
+            data: 응답 바이트 조각
+
+        Returns:
+            이번 조각에서 완성된 레코드 리스트
+        """
+        self._parser.feed(data)
+        return self._read_records()
+
+    def close(self) -> List[ArxivRecord]:
+        """파싱 종료 (남은 레코드 반환, XML이 끝나지 않았으면 ParseError)"""
+        self._parser.close()
+        return self._read_records()
+
+    def _read_records(self) -> List[ArxivRecord]:
+        records = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+
+            if element.tag == f"{ATOM}entry":
+                record = parse_entry(element)
+                if record is None:
+                    logger.warning("ID가 없는 불완전한 결과 건너뜀")
+                else:
+                    records.append(record)
+                # 파싱한 entry는 트리에서 제거하여 페이지 전체가 메모리에 쌓이지 않도록 함
+                self._root.remove(element)
+            elif element.tag == f"{OPENSEARCH}totalResults":
+                self.total_results = int(element.text or 0)
+        return records
+
+
+def parse_feed(chunks: Iterable[bytes]) -> Tuple[List[ArxivRecord], Optional[int]]:
+    """
+    Atom 피드 전체를 파싱 (벤치마크 등 동기 코드용)
+
+    Args:
+        chunks: 응답 바이트 조각들
+
+    Returns:
+        (레코드 리스트, 전체 결과 수)
+    """
+    parser = AtomPageParser()
+    records = []
+    for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+    return records, parser.total_results
+
+
+async def _fetch_page(
+    client: httpx.AsyncClient,
+    params: dict,
+    start: int,
+    size: int,
+    attempt: int
+) -> Tuple[List[ArxivRecord], Optional[int]]:
+    """
+    검색 결과 한 페이지 요청 및 스트리밍 파싱
+
+    Raises:
+        arxiv.HTTPError: 200이 아닌 응답 (arxiv 패키지 경로와 같은 재시도 처리를 위해)
+    """
+    parser = AtomPageParser()
+    records = []
+    async with client.stream("GET", ARXIV_API_URL, params={**params, "start": start, "max_results": size}) as response:
+        if response.status_code != 200:
+            raise arxiv.HTTPError(str(response.url), attempt, response.status_code)
+        async for chunk in response.aiter_bytes():
+            records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+    return records, parser.total_results
+
+
+async def iter_native_pages(
+    query: str,
+    max_results: int,
+    sort_by: arxiv.SortCriterion,
+    sort_order: arxiv.SortOrder,
+    max_retries: int,
+    initial_delay: float,
+    stop_at: Optional[Callable[[ArxivRecord], bool]] = None,
+    page_size: int = 100
+) -> AsyncIterator[List[ArxivRecord]]:
+    """
+    ArXiv 검색 결과를 API 페이지 단위로 내보내는 비동기 이터레이터 (iter_arxiv_papers의 네이티브 버전)
+
+    요청 간격은 arXiv API 토큰 버킷으로 조절하고, 요청이 실패하면 같은 offset부터 다시 요청함.
+    재시도 횟수는 페이지마다 새로 셈
+
+    Args:
+        query: 검색 쿼리
+        max_results: 가져올 최대 논문 수
+        sort_by: 정렬 기준
+        sort_order: 정렬 순서
+        max_retries: 페이지당 최대 시도 횟수
+        initial_delay: 초기 재시도 지연 시간 (초)
+        stop_at: 이 함수가 True를 반환하는 결과에서 중단 (해당 결과 제외, 이후 페이지는 요청하지 않음)
+        page_size: 페이지 크기
+
+    Yields:
+        ArxivRecord 리스트 (한 페이지, 비어 있지 않음)
+
+    Raises:
+        arxiv.HTTPError: 한 페이지의 모든 재시도 실패 시
+    """
+    params = {
+        "search_query": query,
+        "id_list": "",
+        "sortBy": sort_by.value,
+        "sortOrder": sort_order.value,
+    }
+    limiter = get_rate_limiter(ARXIV_API)
+    offset = 0
+    attempt = 0
+
+    async with httpx.AsyncClient(timeout=ARXIV_API_TIMEOUT, follow_redirects=True) as client:
+        while offset < max_results:
+            size = min(page_size, max_results - offset)
+            try:
+                await limiter.acquire()
+                logger.info(f"ArXiv API 요청 (native) - offset {offset}, 시도 {attempt + 1}/{max_retries}")
+                records, total_results = await _fetch_page(client, params, offset, size, attempt)
+                if not records and offset > 0 and (total_results is None or offset < total_results):
+                    raise EmptyPageError(f"offset {offset}에서 빈 페이지 (전체 {total_results}개)")
+            except (arxiv.HTTPError, httpx.HTTPError, ParseError, EmptyPageError) as e:
+                delay = arxiv_retry_delay(e, attempt, max_retries, initial_delay)
+                if delay is None:
+                    logger.critical(f"모든 재시도 실패 (offset {offset}). ArXiv API 요청을 중단합니다.")
+                    raise
+                attempt += 1
+                limiter.defer(delay)
+                continue
+
+            attempt = 0
+            # 요청한 개수보다 많이 오더라도 max_results를 넘지 않도록
+            records = records[:size]
+            offset += len(records)
+
+            if stop_at is not None:
+                for index, record in enumerate(records):
+                    if stop_at(record):
+                        if index:
+                            yield records[:index]
+                        return
+
+            if not records:
+                return
+            yield records
+
+            if total_results is not None and offset >= total_results:
+                return
@@ -0,0 +1,170 @@
+"""
+arXiv 스케줄링 크롤링 워터마크 모듈
+
+스케줄링 크롤링은 최신 N개만 가져오면 논문이 많은 날에는 N개 이후를 놓치고 적은 날에는 같은 논문을 다시 처리하므로,
+마지막으로 처리한 논문의 제출 시각(published)과 그 근처 논문 ID를 파일에 저장해 두고
+다음 실행에서는 제출일 내림차순으로 워터마크에 닿을 때까지만 가져옴.
+발표가 늦어진 논문(보류 후 발표 등)을 위해 워터마크보다 lookback 시간만큼 더 내려가되, 이미 처리한 ID는 건너뜀
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import arxiv
+
+from models import ArxivWatermark
+from logger import setup_logger
+
+logger = setup_logger("arxiv_watermark")
+
+
+def base_paper_id(result: arxiv.Result) -> str:
+    """
+    버전을 뺀 arXiv ID (새 버전은 같은 논문으로 취급)
+
+    Args:
+        result: ArXiv Result 객체
+
+    Returns:
+        arXiv ID (예: 2401.12345)
+    """
+    return result.get_short_id().rsplit("v", 1)[0]
+
+
+def _published_utc(result: arxiv.Result) -> datetime:
+    """논문 제출 시각 (UTC)"""
+    published = result.published
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
+
+
+def watermark_key(result: arxiv.Result) -> Tuple[str, datetime]:
+    """
+    워터마크 갱신에 필요한 값만 남긴 논문 키 (스트리밍 처리 시 Result 객체를 들고 있지 않도록)
+
+    Args:
+        result: ArXiv Result 객체
+
+    Returns:
+        (버전 없는 arXiv ID, 제출 시각 UTC)
+    """
+    return base_paper_id(result), _published_utc(result)
+
+
+class WatermarkFilter:
+    """
+    워터마크 기준으로 새 논문만 통과시키는 필터 (제출일 내림차순 결과에 사용)
+    """
+
+    def __init__(self, watermark: Optional[ArxivWatermark], lookback_hours: float = 0.0):
+        """
+        Args:
+            watermark: 저장된 워터마크 (None이면 모두 새 논문)
+            lookback_hours: 워터마크보다 더 내려가서 확인할 시간 (시간)
+        """
+        self.seen_ids = set(watermark["paper_ids"]) if watermark else set()
+        self.stop_before: Optional[datetime] = None
+        if watermark:
+            published = datetime.fromisoformat(watermark["published"])
+            self.stop_before = published - timedelta(hours=max(0.0, lookback_hours))
+
+    def reached(self, result: arxiv.Result) -> bool:
+        """이 논문부터는 이전 실행에서 모두 확인한 범위인지 (이후 결과는 더 볼 필요 없음)"""
+        return self.stop_before is not None and _published_utc(result) < self.stop_before
+
+    def is_new(self, result: arxiv.Result) -> bool:
+        """이전 실행에서 처리하지 않은 논문인지"""
+        return base_paper_id(result) not in self.seen_ids
+
+
+def advance_watermark(
+    watermark: Optional[ArxivWatermark],
+    keys: Iterable[Tuple[str, datetime]],
+    lookback_hours: float = 0.0,
+    pending: Iterable[Tuple[str, datetime]] = ()
+) -> Optional[ArxivWatermark]:
+    """
+    처리를 끝낸 논문으로 워터마크 갱신
+
+    가장 최근 제출 시각으로 워터마크를 옮기고, 그 시각 - lookback 이후의 처리를 끝낸 ID만 남김.
+    처리를 끝내지 못한(실패한) 논문이 있으면 워터마크를 그중 가장 오래된 논문의 제출 시각까지만 옮겨
+    다음 실행에서 그 논문을 다시 가져오도록 함
+
+    Args:
+        watermark: 기존 워터마크 (None 가능)
+        keys: 이번 실행에서 처리를 끝낸(업로드 또는 부적절 판단) 논문의 watermark_key
+        lookback_hours: 다음 실행에서 더 내려가서 확인할 시간 (시간)
+        pending: 이번 실행에서 가져왔지만 처리를 끝내지 못한 논문의 watermark_key
+
+    Returns:
+        새 워터마크 (처리를 끝낸 논문도 기존 워터마크도 없으면 None)
+    """
+    entries = {}
+    if watermark:
+        # 기존 ID는 제출 시각을 모르므로 기존 워터마크 시각으로 취급
+        published = datetime.fromisoformat(watermark["published"])
+        entries = {paper_id: published for paper_id in watermark["paper_ids"]}
+    for paper_id, published in keys:
+        entries[paper_id] = published
+
+    oldest_pending: Optional[datetime] = None
+    for paper_id, published in pending:
+        entries.pop(paper_id, None)
+        oldest_pending = published if oldest_pending is None else min(oldest_pending, published)
+
+    if not entries:
+        return None
+
+    newest = max(entries.values())
+    if watermark:
+        newest = max(newest, datetime.fromisoformat(watermark["published"]))
+    if oldest_pending is not None:
+        # 다음 실행의 중단 시각(워터마크 - lookback)이 실패한 논문보다 앞에 오도록
+        newest = min(newest, oldest_pending)
+    keep_after = newest - timedelta(hours=max(0.0, lookback_hours))
+    return {
+        "published": newest.isoformat(),
+        "paper_ids": sorted(paper_id for paper_id, published in entries.items() if published >= keep_after),
+    }
+
+
+def load_watermark(path: str) -> Optional[ArxivWatermark]:
+    """
+    저장된 워터마크 읽기
+
+    Args:
+        path: 워터마크 파일 경로
+
+    Returns:
+        워터마크 또는 None (파일이 없거나 읽을 수 없으면)
+    """
+    watermark_path = Path(path)
+    if not watermark_path.exists():
+        return None
+    try:
+        data = json.loads(watermark_path.read_text(encoding="utf-8"))
+        datetime.fromisoformat(data["published"])
+        return {"published": data["published"], "paper_ids": list(data.get("paper_ids", []))}
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"워터마크 파일을 읽을 수 없어 무시합니다 ({path}): {e}")
+        return None
+
+
+def save_watermark(path: str, watermark: ArxivWatermark) -> None:
+    """
+    워터마크 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 종료되어도 이전 워터마크가 남음)
+
+    Args:
+        path: 워터마크 파일 경로
+        watermark: 저장할 워터마크
+    """
+    watermark_path = Path(path)
+    watermark_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = watermark_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(watermark, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, watermark_path)
+    logger.info(f"워터마크 저장: {watermark['published']} (ID {len(watermark['paper_ids'])}개)")
@@ -2,23 +2,124 @@
 백엔드 서버 통신 모듈
 """
 
+import asyncio
 import json
 import time
 from typing import Dict, List, Optional
 
-import requests
+import httpx
 
-from config import ACTIVITIES_URL, PAPERS_CREATE_URL, CRAWLER_SECRET_KEY, BACKEND_TIMEOUT
+from config import (
+    ACTIVITIES_URL,
+    PAPERS_CREATE_URL,
+    CRAWLER_SECRET_KEY,
+    BACKEND_TIMEOUT,
+    ACTIVITIES_TIMEOUT,
+    ACTIVITIES_CACHE_TTL
+)
 from models import PaperData, ProcessedAIResponse
+from pdf_buffer import PdfBuffer
 from pdf_handler import load_thumbnail
-from logger import setup_logger, log_dict
+from http_client import get_http_client
+from logger import setup_logger, log_dict, print_progress
+from rate_limiter import BACKEND, rate_limit
 
 logger = setup_logger("backend")
 
 
-def fetch_user_activities() -> Optional[List[Dict]]:
+class ActivitiesCache:
     """
-    백엔드 서버에서 사용자 활동 정보 가져오기
+    사용자 활동 정보 TTL 캐시
+
+    논문마다 전체 활동 목록을 다시 받지 않도록 ttl초 동안 재사용하고, 만료되면 한 Task만
+    갱신 요청을 보내며(single-flight) 나머지는 그 결과를 기다림. 갱신 시 ETag가 있으면
+    If-None-Match로 요청하여 변경이 없으면(304) 본문 없이 기존 값을 재사용
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl: 캐시 유지 시간 (초, 0 이하면 캐시하지 않음)
+        """
+        self.ttl = ttl
+        self.activities: Optional[List[Dict]] = None
+        self.etag: Optional[str] = None
+        self.fetched_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def is_fresh(self) -> bool:
+        """TTL 안에 가져온 값이 있는지 여부"""
+        return self.activities is not None and time.monotonic() - self.fetched_at < self.ttl
+
+    def store(self, activities: List[Dict], etag: Optional[str]) -> None:
+        """새로 받은 값 저장"""
+        self.activities = activities
+        self.etag = etag
+        self.fetched_at = time.monotonic()
+
+    def touch(self) -> None:
+        """변경 없음(304) 응답을 받은 경우 기존 값의 유효 시간 연장"""
+        self.fetched_at = time.monotonic()
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self.activities = None
+        self.etag = None
+        self.fetched_at = 0.0
+
+    def lock(self) -> asyncio.Lock:
+        """갱신용 락 (이벤트 루프마다 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+
+_activities_cache = ActivitiesCache(ACTIVITIES_CACHE_TTL)
+
+
+def clear_activities_cache() -> None:
+    """사용자 활동 정보 캐시 비우기"""
+    _activities_cache.clear()
+
+
+async def fetch_user_activities() -> Optional[List[Dict]]:
+    """
+    사용자 활동 정보 가져오기 (ACTIVITIES_CACHE_TTL 동안 캐시)
+    
+    Returns:
+        사용자 활동 목록 또는 None
+    """
+    cache = _activities_cache
+    if cache.ttl <= 0:
+        return await _request_user_activities(cache)
+    
+    if cache.is_fresh():
+        logger.debug("사용자 활동 정보 캐시 사용")
+        return cache.activities
+    
+    async with cache.lock():
+        # 락을 기다리는 동안 다른 Task가 갱신했으면 그 값을 사용
+        if cache.is_fresh():
+            logger.debug("사용자 활동 정보 캐시 사용 (다른 작업에서 갱신됨)")
+            return cache.activities
+        
+        activities = await _request_user_activities(cache)
+        if activities is None and cache.activities is not None:
+            # 갱신에 실패하면 만료된 값이라도 사용
+            logger.warning("사용자 활동 정보 갱신 실패, 이전 값 사용")
+            return cache.activities
+        return activities
+
+
+async def _request_user_activities(cache: ActivitiesCache) -> Optional[List[Dict]]:
+    """
+    백엔드 서버에서 사용자 활동 정보 가져오기 (ETag가 있으면 조건부 요청)
+    
+    Args:
+        cache: 결과를 저장할 캐시
     
     Returns:
         사용자 활동 목록 또는 None
@@ -30,21 +131,32 @@ def fetch_user_activities() -> Optional[List[Dict]]:
     
     try:
         headers = {
-            "Authorization": f"Bearer {CRAWLER_SECRET_KEY[:10]}..." # 보안을 위해 일부만 로깅
+            "Authorization": f"Bearer {CRAWLER_SECRET_KEY}"
         }
+        if cache.etag and cache.activities is not None:
+            headers["If-None-Match"] = cache.etag
         
         logger.info(f"요청 URL: {ACTIVITIES_URL}")
-        logger.debug(f"헤더: Authorization: Bearer {CRAWLER_SECRET_KEY[:10]}...")
+        logger.debug(f"헤더: Authorization: Bearer {CRAWLER_SECRET_KEY[:10]}...") # 보안을 위해 일부만 로깅
+        if "If-None-Match" in headers:
+            logger.debug(f"헤더: If-None-Match: {cache.etag}")
         
+        await rate_limit(BACKEND)
         request_start = time.time()
-        response = requests.get(ACTIVITIES_URL, headers={"Authorization": f"Bearer {CRAWLER_SECRET_KEY}"}, timeout=30)
+        response = await get_http_client().get(ACTIVITIES_URL, headers=headers, timeout=ACTIVITIES_TIMEOUT)
         request_time = time.time() - request_start
         
         logger.info(f"응답 수신 완료 (소요 시간: {request_time:.2f}초)")
         logger.info(f"응답 상태 코드: {response.status_code}")
         
+        if response.status_code == 304 and cache.activities is not None:
+            cache.touch()
+            logger.info("사용자 활동 정보 변경 없음 (304), 캐시 유지")
+            return cache.activities
+        
         response.raise_for_status()
         activities = response.json()
+        cache.store(activities, response.headers.get("ETag"))
         
         count = len(activities) if isinstance(activities, list) else 1
         logger.info(f"사용자 활동 {count}개 가져오기 성공")
@@ -58,26 +170,26 @@ def fetch_user_activities() -> Optional[List[Dict]]:
         logger.info(f"Backend Server (Activities) 총 소요 시간: {elapsed:.2f}초")
         logger.info("✓ 사용자 활동 정보 가져오기 완료")
         
-        print(f"사용자 활동 {count}개 가져오기 성공")
+        print_progress(f"  → 사용자 활동 {count}개 가져오기 성공")
         return activities
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         elapsed = time.time() - start_time
         logger.error(f"사용자 활동 가져오기 실패 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"경고: 사용자 활동 가져오기 실패: {str(e)[:100]}")
+        print_progress(f"  ⚠ 경고: 사용자 활동 가져오기 실패: {str(e)[:100]}")
         return None
     except Exception as e:
         elapsed = time.time() - start_time
         logger.error(f"사용자 활동 처리 중 오류 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"경고: 사용자 활동 처리 중 오류: {str(e)[:100]}")
+        print_progress(f"  ⚠ 경고: 사용자 활동 처리 중 오류: {str(e)[:100]}")
         return None
 
 
-def upload_paper_to_backend(
+async def upload_paper_to_backend(
     paper_data: PaperData,
-    pdf_content: bytes,
+    pdf_content: PdfBuffer,
     ai_response: Optional[ProcessedAIResponse]
 ) -> bool:
     """
@@ -85,7 +197,7 @@ def upload_paper_to_backend(
     
     Args:
         paper_data: 논문 데이터
-        pdf_content: PDF 파일의 바이너리 데이터
+        pdf_content: PDF 버퍼
         ai_response: AI 서버 응답 (처리된 데이터)
     
     Returns:
@@ -127,8 +239,7 @@ def upload_paper_to_backend(
                 else:
                     logger.debug(f"  {key}: {value_str}")
         
-        # PDF 파일 추가
-        files['pdf'] = (f'{paper_id}.pdf', pdf_content, 'application/pdf')
+        # PDF 파일은 요청 직전에 스트림으로 열어 첫 번째 파일로 전달
         logger.info(f"PDF 파일 크기: {len(pdf_content)} bytes")
         
         # AI 응답이 있으면 데이터에 추가
@@ -153,7 +264,7 @@ def upload_paper_to_backend(
                 hashtag_count = len(hashtags_array)
                 
                 # multipart/form-data에서 배열을 전달하기 위해 hashtags[] 형태로 전송
-                # requests는 리스트를 자동으로 hashtags[0], hashtags[1] 형태로 변환
+                # httpx는 리스트 값을 같은 이름의 필드 여러 개로 전송
                 data['hashtags'] = hashtags_array
                 
                 logger.debug(f"  hashtags: {hashtag_count}개 (string 배열로 전송)")
@@ -184,19 +295,25 @@ def upload_paper_to_backend(
         
         logger.info(f"요청 URL: {PAPERS_CREATE_URL}")
         logger.info(f"타임아웃: {BACKEND_TIMEOUT}초")
-        logger.info(f"전송 파일: {list(files.keys())}")
+        logger.info(f"전송 파일: {['pdf', *files.keys()]}")
         logger.info(f"전송 데이터 필드: {list(data.keys())}")
         
-        print("  → 백엔드 서버로 업로드 중...", end=" ", flush=True)
+        print_progress("  → 백엔드 서버로 업로드 중...")
         
+        await rate_limit(BACKEND)
         request_start = time.time()
-        response = requests.post(
-            PAPERS_CREATE_URL,
-            headers=headers,
-            data=data,
-            files=files,
-            timeout=BACKEND_TIMEOUT
-        )
+        # PDF 버퍼를 복사하지 않고 스트림으로 전달 (요청이 끝나면 닫음)
+        pdf_stream = pdf_content.open()
+        try:
+            response = await get_http_client().post(
+                PAPERS_CREATE_URL,
+                headers=headers,
+                data=data,
+                files={'pdf': (f'{paper_id}.pdf', pdf_stream, 'application/pdf'), **files},
+                timeout=BACKEND_TIMEOUT
+            )
+        finally:
+            pdf_stream.close()
         request_time = time.time() - request_start
         
         logger.info(f"응답 수신 완료 (소요 시간: {request_time:.2f}초)")
@@ -214,7 +331,7 @@ def upload_paper_to_backend(
             logger.info(f"Backend Server (Upload) 총 소요 시간: {elapsed:.2f}초")
             logger.info("✓ 논문 업로드 완료")
             
-            print("성공")
+            print_progress("  → 백엔드 업로드: 성공")
             return True
         else:
             logger.error(f"업로드 실패 - HTTP {response.status_code}")
@@ -223,25 +340,25 @@ def upload_paper_to_backend(
             elapsed = time.time() - start_time
             logger.error(f"소요 시간: {elapsed:.2f}초")
             
-            print(f"실패 (HTTP {response.status_code}: {response.text[:100]})")
+            print_progress(f"  → 백엔드 업로드: 실패 (HTTP {response.status_code}: {response.text[:100]})")
             return False
             
-    except requests.exceptions.Timeout as e:
+    except httpx.TimeoutException as e:
         elapsed = time.time() - start_time
         logger.error(f"백엔드 서버 타임아웃 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"타임아웃 설정: {BACKEND_TIMEOUT}초")
-        print(f"실패 (타임아웃: {str(e)[:50]})")
+        print_progress(f"  → 백엔드 업로드: 실패 (타임아웃: {str(e)[:50]})")
         return False
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         elapsed = time.time() - start_time
         logger.error(f"백엔드 서버 네트워크 오류 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"실패 (네트워크 오류: {str(e)[:50]})")
+        print_progress(f"  → 백엔드 업로드: 실패 (네트워크 오류: {str(e)[:50]})")
         return False
     except Exception as e:
         elapsed = time.time() - start_time
         logger.error(f"백엔드 서버 처리 중 오류 (소요 시간: {elapsed:.2f}초)")
         logger.error(f"오류: {str(e)}", exc_info=True)
-        print(f"실패 (오류: {str(e)[:50]})")
+        print_progress(f"  → 백엔드 업로드: 실패 (오류: {str(e)[:50]})")
         return False
 
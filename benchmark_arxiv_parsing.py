@@ -0,0 +1,225 @@
+"""
+arXiv 검색 결과 파싱 비교 벤치마크
+
+저장해 둔 export API 응답(Atom XML)으로 arxiv 패키지 경로(feedparser + arxiv.Result)와
+네이티브 경로(XMLPullParser + ArxivRecord)의 파싱 속도(entries/sec), 최대 메모리(peak RSS),
+결과를 보관할 때의 결과당 메모리, PaperData 필드 차이를 측정
+
+사용법:
+    python benchmark_arxiv_parsing.py ./feeds --fetch 1000
+    python benchmark_arxiv_parsing.py ./feeds
+    python benchmark_arxiv_parsing.py ./feeds --repeat 5 --json results.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+PARSERS = ("library", "native")
+
+# 네이티브 경로에서 응답을 나눠 넣을 조각 크기 (httpx 스트리밍과 비슷하게)
+CHUNK_SIZE = 64 * 1024
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB, Linux는 KB 단위, macOS는 byte 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _parse_library(data: bytes) -> List:
+    """arxiv 패키지와 같은 방식으로 파싱 (feedparser → arxiv.Result)"""
+    import arxiv
+    import feedparser
+
+    return [arxiv.Result._from_feed_entry(entry) for entry in feedparser.parse(data).entries]
+
+
+def _parse_native(data: bytes) -> List:
+    """네이티브 클라이언트와 같은 방식으로 파싱 (조각 단위 XMLPullParser → ArxivRecord)"""
+    from arxiv_native import parse_feed
+
+    records, _ = parse_feed(data[offset:offset + CHUNK_SIZE] for offset in range(0, len(data), CHUNK_SIZE))
+    return records
+
+
+def _run_parser(parser: str, feed_paths: List[str], repeat: int) -> Dict:
+    """
+    새 프로세스에서 하나의 파서로 응답 전체를 파싱 (RSS 측정이 파서 간에 섞이지 않도록)
+
+    Args:
+        parser: 파서 이름 (library, native)
+        feed_paths: Atom XML 파일 경로 리스트
+        repeat: 속도 측정 반복 횟수
+
+    Returns:
+        측정 결과 및 논문별 PaperData
+    """
+    from arxiv_fetcher import transform_arxiv_to_paper_data
+
+    parse = _parse_library if parser == "library" else _parse_native
+    feeds = [Path(path).read_bytes() for path in feed_paths]
+    baseline_rss = _peak_rss_mb()
+
+    # 1) 속도: 파싱만 반복 측정
+    elapsed = 0.0
+    entries = 0
+    for _ in range(repeat):
+        for data in feeds:
+            start = time.perf_counter()
+            entries += len(parse(data))
+            elapsed += time.perf_counter() - start
+
+    # 2) 메모리: 실행 중 결과를 보관하는 것처럼 모든 결과를 들고 있을 때 남는 메모리
+    tracemalloc.start()
+    retained = [result for data in feeds for result in parse(data)]
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    papers = {}
+    for result in retained:
+        paper_data = transform_arxiv_to_paper_data(result)
+        papers[paper_data["paperId"]] = paper_data
+
+    return {
+        "parser": parser,
+        "results": len(retained),
+        "entries": entries,
+        "seconds": elapsed,
+        "retained_kb_per_result": retained_bytes / 1024 / len(retained) if retained else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "rss_delta_mb": _peak_rss_mb() - baseline_rss,
+        "papers": papers,
+    }
+
+
+def compare_fields(result: Dict, reference: Dict) -> Dict[str, int]:
+    """
+    기준 파서 대비 PaperData 필드별로 값이 다른 논문 수
+
+    Args:
+        result: 비교 대상 파서 결과
+        reference: 기준 파서 결과
+
+    Returns:
+        {필드 이름: 값이 다른 논문 수} (기준에 없는 논문은 "missing")
+    """
+    mismatches: Dict[str, int] = {}
+    for paper_id, reference_data in reference["papers"].items():
+        paper_data = result["papers"].get(paper_id)
+        if paper_data is None:
+            mismatches["missing"] = mismatches.get("missing", 0) + 1
+            continue
+        for field, value in reference_data.items():
+            if paper_data.get(field) != value:
+                mismatches[field] = mismatches.get(field, 0) + 1
+    return mismatches
+
+
+def fetch_feeds(feed_dir: Path, query: str, count: int, page_size: int, delay: float) -> None:
+    """
+    벤치마크용 export API 응답을 페이지 단위로 저장 (arXiv API 이용 규칙에 맞춰 요청 간격 유지)
+
+    Args:
+        feed_dir: 저장할 디렉토리
+        query: 검색 쿼리
+        count: 가져올 논문 수
+        page_size: 페이지 크기
+        delay: 요청 간격 (초)
+    """
+    import httpx
+
+    from arxiv_native import ARXIV_API_URL
+
+    feed_dir.mkdir(parents=True, exist_ok=True)
+    with httpx.Client(timeout=60, follow_redirects=True) as client:
+        for start in range(0, count, page_size):
+            if start:
+                time.sleep(delay)
+            params = {
+                "search_query": query,
+                "sortBy": "submittedDate",
+                "sortOrder": "descending",
+                "start": start,
+                "max_results": min(page_size, count - start),
+            }
+            response = client.get(ARXIV_API_URL, params=params)
+            response.raise_for_status()
+            path = feed_dir / f"page-{start:06d}.xml"
+            path.write_bytes(response.content)
+            print(f"저장: {path} ({len(response.content) / 1024:.0f} KB)", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="arXiv 검색 결과 파싱 벤치마크 (arxiv 패키지 vs 네이티브)")
+    parser.add_argument("feeds", help="Atom XML 응답 파일(*.xml)이 들어 있는 디렉토리")
+    parser.add_argument("--fetch", type=int, default=0, help="벤치마크 전에 export API에서 이 개수만큼 응답을 받아 저장")
+    parser.add_argument("--query", default="cat:cs.AI OR cat:cs.LG OR cat:cs.CV", help="--fetch에 사용할 검색 쿼리")
+    parser.add_argument("--page-size", type=int, default=100, help="--fetch 페이지 크기 (기본: 100)")
+    parser.add_argument("--delay", type=float, default=3.0, help="--fetch 요청 간격 (초, 기본: 3.0)")
+    parser.add_argument("--repeat", type=int, default=3, help="속도 측정 반복 횟수 (기본: 3)")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    feed_dir = Path(args.feeds)
+    if args.fetch:
+        fetch_feeds(feed_dir, args.query, args.fetch, args.page_size, args.delay)
+
+    feed_paths = sorted(str(path) for path in feed_dir.glob("*.xml"))
+    if not feed_paths:
+        print(f"Atom XML 파일이 없습니다: {args.feeds} (--fetch로 받을 수 있음)")
+        sys.exit(1)
+
+    print(f"응답: {len(feed_paths)}개 파일, 반복: {args.repeat}회, 기준: library\n")
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in PARSERS:
+        print(f"==> {name} 실행 중...", flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(_run_parser, name, feed_paths, max(1, args.repeat)).result()
+
+    rows = []
+    for name in PARSERS:
+        result = results[name]
+        rows.append({
+            "parser": name,
+            "results": result["results"],
+            "seconds": result["seconds"],
+            "entries_per_sec": result["entries"] / result["seconds"] if result["seconds"] > 0 else 0.0,
+            "retained_kb_per_result": result["retained_kb_per_result"],
+            "peak_rss_mb": result["peak_rss_mb"],
+            "rss_delta_mb": result["rss_delta_mb"],
+            "mismatches": compare_fields(result, results["library"]),
+        })
+
+    print()
+    header = f"{'parser':<8} {'results':>8} {'sec':>8} {'entries/s':>10} {'KB/result':>10} {'peakMB':>8} {'ΔMB':>7}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['parser']:<8} {row['results']:>8} {row['seconds']:>8.3f} {row['entries_per_sec']:>10.0f} "
+            f"{row['retained_kb_per_result']:>10.2f} {row['peak_rss_mb']:>8.1f} {row['rss_delta_mb']:>7.1f}"
+        )
+
+    for row in rows:
+        if row["mismatches"]:
+            details = ", ".join(f"{field} {count}" for field, count in sorted(row["mismatches"].items()))
+            print(f"  [{row['parser']}] library와 다른 필드: {details}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"feeds": len(feed_paths), "repeat": args.repeat, "results": rows}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+PDF 텍스트 추출 백엔드 비교 벤치마크
+
+로컬 arXiv PDF 코퍼스에 대해 각 백엔드의 처리 속도(pages/sec), 최대 메모리(peak RSS),
+기준 백엔드 대비 텍스트 품질 차이를 측정
+
+사용법:
+    python benchmark_pdf_backends.py ./corpus
+    python benchmark_pdf_backends.py ./corpus --backends pypdf2 pypdfium2 --reference pdfminer
+    python benchmark_pdf_backends.py ./corpus --max-length 100000 --json results.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List
+
+from pdf_backends import PDF_BACKENDS, available_backends, open_pdf_pages
+
+# 품질 비교 시 사용할 최대 단어 수 (SequenceMatcher 비용 제한)
+MAX_COMPARE_WORDS = 20000
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB, Linux는 KB 단위, macOS는 byte 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_backend(backend: str, pdf_paths: List[str], max_length: int) -> Dict:
+    """
+    새 프로세스에서 하나의 백엔드로 코퍼스 전체를 추출 (RSS 측정이 백엔드 간에 섞이지 않도록)
+
+    Args:
+        backend: 백엔드 이름
+        pdf_paths: PDF 파일 경로 리스트
+        max_length: 문서당 최대 추출 문자 수 (0이면 전체)
+
+    Returns:
+        측정 결과 및 문서별 추출 텍스트
+    """
+    baseline_rss = _peak_rss_mb()
+    texts = {}
+    errors = {}
+    pages = 0
+    elapsed = 0.0
+
+    for path in pdf_paths:
+        start = time.perf_counter()
+        try:
+            with open(path, "rb") as pdf_stream:
+                _, page_iter = open_pdf_pages(pdf_stream, backend)
+                parts = []
+                length = 0
+                try:
+                    for page_text in page_iter:
+                        parts.append(page_text)
+                        length += len(page_text) + 1
+                        pages += 1
+                        if max_length and length >= max_length:
+                            break
+                finally:
+                    page_iter.close()
+            texts[path] = "\n".join(parts)
+        except Exception as e:
+            errors[path] = str(e)[:200]
+        elapsed += time.perf_counter() - start
+
+    return {
+        "backend": backend,
+        "documents": len(texts),
+        "errors": errors,
+        "pages": pages,
+        "seconds": elapsed,
+        "peak_rss_mb": _peak_rss_mb(),
+        "rss_delta_mb": _peak_rss_mb() - baseline_rss,
+        "texts": texts,
+    }
+
+
+def _garbage_ratio(text: str) -> float:
+    """제어 문자/사설 영역/대체 문자 등 깨진 문자의 비율"""
+    if not text:
+        return 0.0
+    bad = sum(
+        1 for ch in text
+        if ch == "�" or (unicodedata.category(ch) in ("Cc", "Co", "Cn") and ch not in "\n\t\r")
+    )
+    return bad / len(text)
+
+
+def _similarity(text: str, reference: str) -> float:
+    """기준 텍스트 대비 단어 시퀀스 유사도 (0~1)"""
+    words = text.split()[:MAX_COMPARE_WORDS]
+    reference_words = reference.split()[:MAX_COMPARE_WORDS]
+    if not words and not reference_words:
+        return 1.0
+    return SequenceMatcher(None, words, reference_words, autojunk=False).ratio()
+
+
+def compare_quality(result: Dict, reference: Dict) -> Dict:
+    """
+    기준 백엔드 대비 텍스트 품질 차이 계산
+
+    Args:
+        result: 비교 대상 백엔드 결과
+        reference: 기준 백엔드 결과
+
+    Returns:
+        평균 유사도, 평균 문자 수 차이(%), 깨진 문자 비율
+    """
+    similarities = []
+    length_deltas = []
+    garbage = []
+
+    for path, text in result["texts"].items():
+        garbage.append(_garbage_ratio(text))
+        reference_text = reference["texts"].get(path)
+        if reference_text is None:
+            continue
+        similarities.append(_similarity(text, reference_text))
+        if reference_text:
+            length_deltas.append((len(text) - len(reference_text)) / len(reference_text) * 100)
+
+    def mean(values: List[float]) -> float:
+        return sum(values) / len(values) if values else 0.0
+
+    return {
+        "similarity": mean(similarities),
+        "length_delta_pct": mean(length_deltas),
+        "garbage_ratio": mean(garbage),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출 백엔드 벤치마크")
+    parser.add_argument("corpus", help="PDF 파일이 들어 있는 디렉토리")
+    parser.add_argument("--backends", nargs="+", default=None, help=f"비교할 백엔드 (기본: 설치된 전체, 선택: {', '.join(PDF_BACKENDS)})")
+    parser.add_argument("--reference", default="pdfminer", help="텍스트 품질 기준 백엔드 (기본: pdfminer)")
+    parser.add_argument("--max-length", type=int, default=0, help="문서당 최대 추출 문자 수 (0이면 전체, 운영 설정과 맞추려면 MAX_PDF_TEXT_LENGTH)")
+    parser.add_argument("--limit", type=int, default=0, help="사용할 최대 PDF 수 (0이면 전체)")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    pdf_paths = sorted(str(path) for path in Path(args.corpus).glob("**/*.pdf"))
+    if args.limit:
+        pdf_paths = pdf_paths[:args.limit]
+    if not pdf_paths:
+        print(f"PDF 파일이 없습니다: {args.corpus}")
+        sys.exit(1)
+
+    installed = available_backends()
+    backends = args.backends or installed
+    missing = [backend for backend in backends if backend not in installed]
+    if missing:
+        print(f"경고: 설치되지 않았거나 알 수 없는 백엔드 제외: {', '.join(missing)}")
+        backends = [backend for backend in backends if backend in installed]
+
+    reference_backend = args.reference if args.reference in installed else None
+    if reference_backend and reference_backend not in backends:
+        backends.append(reference_backend)
+
+    print(f"코퍼스: {len(pdf_paths)}개 PDF, 백엔드: {', '.join(backends)}, 기준: {reference_backend or '없음'}\n")
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for backend in backends:
+        print(f"==> {backend} 실행 중...", flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[backend] = executor.submit(_run_backend, backend, pdf_paths, args.max_length).result()
+
+    rows = []
+    for backend in backends:
+        result = results[backend]
+        row = {
+            "backend": backend,
+            "documents": result["documents"],
+            "errors": len(result["errors"]),
+            "pages": result["pages"],
+            "seconds": result["seconds"],
+            "pages_per_sec": result["pages"] / result["seconds"] if result["seconds"] > 0 else 0.0,
+            "peak_rss_mb": result["peak_rss_mb"],
+            "rss_delta_mb": result["rss_delta_mb"],
+        }
+        if reference_backend:
+            row.update(compare_quality(result, results[reference_backend]))
+        rows.append(row)
+
+    print()
+    header = f"{'backend':<10} {'docs':>5} {'err':>4} {'pages':>6} {'sec':>8} {'pages/s':>8} {'peakMB':>8} {'ΔMB':>7}"
+    if reference_backend:
+        header += f" {'sim':>6} {'Δlen%':>7} {'garbage':>8}"
+    print(header)
+    print("-" * len(header))
+    for row in sorted(rows, key=lambda r: r["pages_per_sec"], reverse=True):
+        line = (
+            f"{row['backend']:<10} {row['documents']:>5} {row['errors']:>4} {row['pages']:>6} "
+            f"{row['seconds']:>8.2f} {row['pages_per_sec']:>8.1f} {row['peak_rss_mb']:>8.1f} {row['rss_delta_mb']:>7.1f}"
+        )
+        if reference_backend:
+            line += f" {row['similarity']:>6.3f} {row['length_delta_pct']:>+7.1f} {row['garbage_ratio']:>8.4f}"
+        print(line)
+
+    for backend in backends:
+        for path, error in results[backend]["errors"].items():
+            print(f"  [{backend}] 실패: {path}: {error}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"reference": reference_backend, "corpus_size": len(pdf_paths), "results": rows}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
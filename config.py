@@ -25,27 +25,157 @@ AI_SUMMARIZE_URL = f"{AI_SERVER_URL}/api/summarize-paper"
 # Reviewer 설정
 REVIEWER_MODEL = os.getenv("REVIEWER_MODEL", "gpt-4o-mini")
 REVIEWER_REFLECTION = int(os.getenv("REVIEWER_REFLECTION", "1"))
+# 리뷰 방식
+# - "reflection": 최초 리뷰 후 리플렉션을 순차로 진행 (점수와 추천이 바뀌지 않으면 조기 종료)
+# - "ensemble": 독립적인 최초 리뷰 REVIEWER_ENSEMBLE_SIZE개를 동시에 생성한 뒤 앙상블 (긴 순차 리플렉션 대신 사용)
+REVIEWER_MODE = os.getenv("REVIEWER_MODE", "reflection").lower()
+REVIEWER_ENSEMBLE_SIZE = int(os.getenv("REVIEWER_ENSEMBLE_SIZE", "3"))
+# 프롬프트 배치 방식
+# - "prefix": 고정 내용(시스템 프롬프트, 가이드라인, few-shot 예시)을 매번 동일한 앞부분에 두고 논문을 마지막 메시지로 분리 (프롬프트 캐시 활용)
+# - "inline": 기존처럼 모든 내용을 하나의 user 메시지로 전송
+REVIEWER_PROMPT_LAYOUT = os.getenv("REVIEWER_PROMPT_LAYOUT", "prefix").lower()
+# 응답 형식
+# - "json_schema": response_format(json_schema, strict)으로 리뷰 스키마에 맞는 JSON만 받음
+# - "text": 기존처럼 자유 형식으로 받아 JSON 추출 (json_schema를 지원하지 않는 OpenAI 호환 서버용)
+REVIEWER_OUTPUT_MODE = os.getenv("REVIEWER_OUTPUT_MODE", "json_schema").lower()
+# 리뷰용 섹션 텍스트 사용 (저자 목록, 참고문헌, 감사의 글, 부록을 빼고 리뷰)
+REVIEWER_SECTION_VIEW = os.getenv("REVIEWER_SECTION_VIEW", "true").lower() == "true"
+# 리뷰 입력 토큰 예산 (tiktoken이 있으면 정확히 계산)
+REVIEWER_CONTEXT_TOKENS = int(os.getenv("REVIEWER_CONTEXT_TOKENS", "0"))  # 0이면 모델 기본 컨텍스트 윈도우
+REVIEWER_OUTPUT_TOKENS = int(os.getenv("REVIEWER_OUTPUT_TOKENS", "4096"))  # 응답 하나당 예약 토큰
+REVIEWER_PAPER_MAX_TOKENS = int(os.getenv("REVIEWER_PAPER_MAX_TOKENS", "0"))  # 논문 텍스트 최대 토큰 (0이면 남은 윈도우 전체, 비용 제한용)
+
+# 초록 기반 1차 판단 (PDF 다운로드 전에 명백히 부적절한 논문 제외)
+TRIAGE_ENABLED = os.getenv("TRIAGE_ENABLED", "false").lower() == "true"
+TRIAGE_MODEL = os.getenv("TRIAGE_MODEL", "gpt-4o-mini")
+TRIAGE_REJECT_BELOW = float(os.getenv("TRIAGE_REJECT_BELOW", "4"))  # 이 점수 미만이면 전체 리뷰 없이 제외 (1~10)
+
+# OpenAI Batch API 리뷰 설정 (PIPELINE_MODE=batch)
+REVIEW_BATCH_DIR = os.getenv("REVIEW_BATCH_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "batches"))
+REVIEW_BATCH_POLL_INTERVAL = float(os.getenv("REVIEW_BATCH_POLL_INTERVAL", "30"))
+
+# 리뷰 결과 저장소 (같은 논문/모델/프롬프트 버전/리플렉션 횟수의 리뷰 재사용)
+REVIEW_CACHE_ENABLED = os.getenv("REVIEW_CACHE_ENABLED", "true").lower() == "true"
+REVIEW_CACHE_PATH = os.getenv("REVIEW_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "reviews.sqlite3"))
+
+# 처리한 논문 카탈로그 (업로드했거나 부적절 판단한 논문은 다운로드 전에 건너뜀)
+PAPER_CATALOG_ENABLED = os.getenv("PAPER_CATALOG_ENABLED", "true").lower() == "true"
+PAPER_CATALOG_PATH = os.getenv("PAPER_CATALOG_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "papers.sqlite3"))
+PAPER_CATALOG_BLOOM = os.getenv("PAPER_CATALOG_BLOOM", "false").lower() == "true"  # 끝난 ID를 메모리 bloom filter로 먼저 확인
+
+# 논문 처리 저널 (단계 전환과 리뷰/AI 응답을 기록, 중단된 실행은 `python main.py --resume`으로 재개)
+PAPER_JOURNAL_ENABLED = os.getenv("PAPER_JOURNAL_ENABLED", "true").lower() == "true"
+PAPER_JOURNAL_DIR = os.getenv("PAPER_JOURNAL_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "journal"))
+PAPER_JOURNAL_MAX_AGE_DAYS = float(os.getenv("PAPER_JOURNAL_MAX_AGE_DAYS", "7"))  # 재개하지 않은 저널 보관 기간 (0이면 삭제하지 않음)
 
 # 크롤링 설정
 ARXIV_QUERY = os.getenv("ARXIV_QUERY", "cat:cs.AI OR cat:cs.LG OR cat:cs.CV")
 MAX_RESULTS_LATEST = int(os.getenv("MAX_RESULTS_LATEST", "100"))
 MAX_RESULTS_SCHEDULED = int(os.getenv("MAX_RESULTS_SCHEDULED", "10"))
 
+# 스케줄링 크롤링 워터마크 (마지막으로 처리한 제출 시각 이후의 논문만 가져옴, 첫 실행은 MAX_RESULTS_SCHEDULED개)
+ARXIV_WATERMARK_ENABLED = os.getenv("ARXIV_WATERMARK_ENABLED", "true").lower() == "true"
+ARXIV_WATERMARK_PATH = os.getenv("ARXIV_WATERMARK_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "arxiv_watermark.json"))
+# 워터마크까지 내려가며 확인할 최대 논문 수 (오래 멈춰 있던 경우의 상한)
+ARXIV_WATERMARK_MAX_RESULTS = int(os.getenv("ARXIV_WATERMARK_MAX_RESULTS", "2000"))
+# 워터마크보다 더 내려가서 확인할 시간 (늦게 발표된 논문 대비, 이미 처리한 ID는 건너뜀)
+ARXIV_WATERMARK_LOOKBACK_HOURS = float(os.getenv("ARXIV_WATERMARK_LOOKBACK_HOURS", "24"))
+
 # PDF 처리 설정
+# 추출할 최대 문자 수 (리뷰 입력은 추출 후 토큰 예산으로 다시 맞춤, 0이면 리뷰어 토큰 예산에서 계산 - 거의 전체를 추출하므로 느림)
 MAX_PDF_TEXT_LENGTH = int(os.getenv("MAX_PDF_TEXT_LENGTH", "100000"))
+# PDF 텍스트 추출 백엔드 (pypdf2, pypdf, pdfminer, pypdfium2 - pypdf2 외에는 별도 설치 필요)
+PDF_TEXT_BACKEND = os.getenv("PDF_TEXT_BACKEND", "pypdf2").lower()
+# PDF 텍스트 추출 프로세스 풀 크기 (0이면 프로세스 풀 없이 워커 스레드에서 추출)
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(os.cpu_count() or 1)))
+
+# PDF 다운로드 설정 (최대 크기를 넘으면 중단, 스풀 임계값보다 크면 메모리 대신 디스크에 저장)
+PDF_MAX_DOWNLOAD_BYTES = int(float(os.getenv("PDF_MAX_DOWNLOAD_MB", "50")) * 1024 * 1024)
+PDF_SPOOL_THRESHOLD_BYTES = int(float(os.getenv("PDF_SPOOL_THRESHOLD_MB", "4")) * 1024 * 1024)
+PDF_SPOOL_DIR = os.getenv("PDF_SPOOL_DIR") or None  # None이면 시스템 임시 디렉토리
+
+# PDF 캐시 설정 (arXiv ID + 버전 기준, 크기 상한 초과 시 LRU 제거)
+PDF_CACHE_ENABLED = os.getenv("PDF_CACHE_ENABLED", "true").lower() == "true"
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "pdf"))
+PDF_CACHE_MAX_BYTES = int(float(os.getenv("PDF_CACHE_MAX_MB", "2048")) * 1024 * 1024)
 
 # 타임아웃 설정
 PDF_DOWNLOAD_TIMEOUT = int(os.getenv("PDF_DOWNLOAD_TIMEOUT", "30"))
 AI_SERVER_TIMEOUT = int(os.getenv("AI_SERVER_TIMEOUT", "120"))
 BACKEND_TIMEOUT = int(os.getenv("BACKEND_TIMEOUT", "60"))
+ACTIVITIES_TIMEOUT = int(os.getenv("ACTIVITIES_TIMEOUT", "30"))
+
+# 사용자 활동 정보 캐시 유지 시간 (초, 0이면 논문마다 새로 요청)
+ACTIVITIES_CACHE_TTL = float(os.getenv("ACTIVITIES_CACHE_TTL", "600"))
+
+# 공유 HTTP 클라이언트 커넥션 풀 설정 (PDF 다운로드, AI 서버, 백엔드 서버)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"  # h2 패키지 필요
 
 # Rate Limiting
 REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "1.0"))
 
+# 동시 처리 설정 (동시에 처리할 최대 논문 수, 1이면 순차 처리)
+MAX_CONCURRENT_PAPERS = max(1, int(os.getenv("MAX_CONCURRENT_PAPERS", "1")))
+
+# 파이프라인 설정
+# - "concurrent": 논문 단위로 MAX_CONCURRENT_PAPERS개까지 동시 처리
+# - "staged": 단계(다운로드/리뷰/요약/업로드)별 워커 풀과 bounded 큐로 처리
+# - "batch": 다운로드를 모두 마친 뒤 리뷰를 OpenAI Batch API로 한 번에 처리 (비용 절감, 지연 시간 증가)
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "concurrent").lower()
+PIPELINE_TRIAGE_WORKERS = int(os.getenv("PIPELINE_TRIAGE_WORKERS", "4"))
+PIPELINE_DOWNLOAD_WORKERS = int(os.getenv("PIPELINE_DOWNLOAD_WORKERS", "4"))
+PIPELINE_REVIEW_WORKERS = int(os.getenv("PIPELINE_REVIEW_WORKERS", "4"))
+PIPELINE_SUMMARIZE_WORKERS = int(os.getenv("PIPELINE_SUMMARIZE_WORKERS", "2"))
+PIPELINE_UPLOAD_WORKERS = int(os.getenv("PIPELINE_UPLOAD_WORKERS", "2"))
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "8"))
+
 # ArXiv API Rate Limiting
 ARXIV_MAX_RETRIES = int(os.getenv("ARXIV_MAX_RETRIES", "5"))
 ARXIV_INITIAL_DELAY = float(os.getenv("ARXIV_INITIAL_DELAY", "3.0"))
 ARXIV_CLIENT_DELAY = float(os.getenv("ARXIV_CLIENT_DELAY", "3.0"))
+# arXiv 검색 클라이언트 (library: arxiv 패키지, native: httpx로 직접 요청하고 Atom XML을 가벼운 레코드로 파싱)
+ARXIV_CLIENT_BACKEND = os.getenv("ARXIV_CLIENT_BACKEND", "library").lower()
+ARXIV_API_TIMEOUT = int(os.getenv("ARXIV_API_TIMEOUT", "30"))
+ARXIV_PAGE_SIZE = int(os.getenv("ARXIV_PAGE_SIZE", "100"))
+# 검색 결과를 모두 받은 뒤 처리하지 않고 페이지가 도착하는 대로 처리 (concurrent, staged 모드)
+ARXIV_STREAM_RESULTS = os.getenv("ARXIV_STREAM_RESULTS", "false").lower() == "true"
+
+# 목적지별 Rate Limiting (초당 요청 수, 버스트) - 초당 요청 수가 0 이하이면 제한 없음
+# 기본값은 기존 REQUEST_DELAY / ARXIV_CLIENT_DELAY 간격과 동일한 속도
+_DEFAULT_RATE = 1.0 / REQUEST_DELAY if REQUEST_DELAY > 0 else 0.0
+RATE_LIMITS = {
+    "arxiv_api": (
+        float(os.getenv("ARXIV_API_RATE", str(1.0 / ARXIV_CLIENT_DELAY if ARXIV_CLIENT_DELAY > 0 else 0.0))),
+        int(os.getenv("ARXIV_API_BURST", "1")),
+    ),
+    "arxiv_pdf": (
+        float(os.getenv("ARXIV_PDF_RATE", str(_DEFAULT_RATE))),
+        int(os.getenv("ARXIV_PDF_BURST", "1")),
+    ),
+    "openai": (
+        float(os.getenv("OPENAI_RATE", "0")),
+        int(os.getenv("OPENAI_BURST", "1")),
+    ),
+    "ai_server": (
+        float(os.getenv("AI_SERVER_RATE", str(_DEFAULT_RATE))),
+        int(os.getenv("AI_SERVER_BURST", "1")),
+    ),
+    "backend": (
+        float(os.getenv("BACKEND_RATE", "0")),
+        int(os.getenv("BACKEND_BURST", "1")),
+    ),
+}
+
+# OpenAI 모델별 분당 요청 수/토큰 수 한도 (계정 한도보다 약간 낮게 설정, 0 이하이면 제한 없음)
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "0"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "0"))
+# 429/연결 오류/5xx 재시도 (retry-after 헤더가 없으면 지수 백오프 + jitter)
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+OPENAI_RETRY_BASE_DELAY = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "1.0"))
+OPENAI_RETRY_MAX_DELAY = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "60"))
 
 
 # 환경변수 검증
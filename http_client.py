@@ -0,0 +1,78 @@
+"""
+공유 HTTP 클라이언트 모듈
+
+PDF 다운로드, AI 서버, 백엔드 서버 호출이 하나의 httpx.AsyncClient를 공유하여
+호스트별 커넥션 풀(keep-alive, 선택적으로 HTTP/2)을 재사용하도록 함.
+클라이언트는 실행(이벤트 루프)마다 한 번 생성되며 실행이 끝나면 close_http_client()로 닫음
+"""
+
+import asyncio
+import importlib.util
+from typing import Optional
+
+import httpx
+
+from config import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP2_ENABLED
+)
+from logger import setup_logger
+
+logger = setup_logger("http_client")
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용 가능 여부 (설정이 켜져 있고 h2 패키지가 설치된 경우)"""
+    if not HTTP2_ENABLED:
+        return False
+
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED=true 이지만 h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install h2)")
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트 가져오기 (없으면 생성)
+
+    커넥션 풀은 이벤트 루프에 묶여 있으므로 다른 이벤트 루프에서 호출되면 새로 생성함
+
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        http2 = _http2_available()
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            ),
+            http2=http2,
+            follow_redirects=True
+        )
+        _http_client_loop = loop
+        logger.info(
+            f"공유 HTTP 클라이언트 생성 (max_connections: {HTTP_MAX_CONNECTIONS}, "
+            f"keep-alive: {HTTP_MAX_KEEPALIVE_CONNECTIONS}, HTTP/2: {http2})"
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (열린 커넥션 정리)"""
+    global _http_client, _http_client_loop
+
+    if _http_client is not None:
+        client, _http_client, _http_client_loop = _http_client, None, None
+        await client.aclose()
+        logger.info("공유 HTTP 클라이언트 종료")
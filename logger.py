@@ -4,10 +4,23 @@
 
 import logging
 import sys
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 
 
+# 현재 처리 중인 논문 식별자 (동시 처리 시 로그 구분용, asyncio Task마다 독립적으로 유지됨)
+current_paper: ContextVar[str] = ContextVar("current_paper", default="-")
+
+
+class PaperContextFilter(logging.Filter):
+    """로그 레코드에 현재 처리 중인 논문 식별자를 추가하는 필터"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.paper = current_paper.get()
+        return True
+
+
 def setup_logger(name: str = "crawler") -> logging.Logger:
     """
     로거 설정
@@ -34,7 +47,7 @@ def setup_logger(name: str = "crawler") -> logging.Logger:
     
     # 포맷터 설정
     formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+        '%(asctime)s | %(levelname)-8s | %(name)s | %(paper)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
@@ -48,6 +61,11 @@ def setup_logger(name: str = "crawler") -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
+    # 논문 식별자 필터 (동시 처리 시 어느 논문의 로그인지 구분)
+    paper_filter = PaperContextFilter()
+    file_handler.addFilter(paper_filter)
+    console_handler.addFilter(paper_filter)
+    
     # 핸들러 추가
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
@@ -71,6 +89,23 @@ def log_section(logger: logging.Logger, title: str, level: str = "INFO"):
     log_func(separator)
 
 
+def print_progress(message: str):
+    """
+    논문 처리 진행 상황 출력
+
+    동시 처리 시 다른 논문의 출력과 섞이지 않도록 항상 한 줄을 통째로 출력하고,
+    논문을 처리 중이면 들여쓰기 뒤에 현재 논문 식별자를 붙임 (예: "  [3/10 2401.12345v1] → PDF 다운로드 성공")
+
+    Args:
+        message: 출력할 한 줄 (앞의 들여쓰기와 뒤의 빈 줄은 유지)
+    """
+    paper = current_paper.get()
+    if paper != "-":
+        body = message.lstrip(" ")
+        message = f"{message[:len(message) - len(body)]}[{paper}] {body}"
+    print(message, flush=True)
+
+
 def log_dict(logger: logging.Logger, data: dict, title: str = "Data", max_length: int = 500):
     """
     딕셔너리 데이터를 로깅
@@ -93,15 +128,22 @@ def log_dict(logger: logging.Logger, data: dict, title: str = "Data", max_length
         logger.debug(f"  {key}: {value_str}")
 
 
-def log_cost(logger: logging.Logger, model: str, prompt_tokens: int, completion_tokens: int):
+def log_cost(
+    logger: logging.Logger,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0
+):
     """
     OpenAI API 비용 로깅
     
     Args:
         logger: 로거 인스턴스
         model: 사용한 모델
-        prompt_tokens: 프롬프트 토큰 수
+        prompt_tokens: 프롬프트 토큰 수 (캐시된 토큰 포함)
         completion_tokens: 완성 토큰 수
+        cached_tokens: 프롬프트 캐시에서 처리된 토큰 수
     """
     total_tokens = prompt_tokens + completion_tokens
     
@@ -109,10 +151,12 @@ def log_cost(logger: logging.Logger, model: str, prompt_tokens: int, completion_
     pricing = {
         "gpt-4o-mini": {
             "input": 0.15,  # $0.15 per 1M input tokens
+            "cached_input": 0.075,  # $0.075 per 1M cached input tokens
             "output": 0.60  # $0.60 per 1M output tokens
         },
         "gpt-4o": {
             "input": 5.00,
+            "cached_input": 2.50,
             "output": 15.00
         },
         "gpt-4-turbo": {
@@ -129,12 +173,15 @@ def log_cost(logger: logging.Logger, model: str, prompt_tokens: int, completion_
     price = pricing.get(model, pricing["gpt-4o-mini"])
     
     # 비용 계산
-    input_cost = (prompt_tokens / 1_000_000) * price["input"]
+    uncached_tokens = prompt_tokens - cached_tokens
+    input_cost = (uncached_tokens / 1_000_000) * price["input"] + (cached_tokens / 1_000_000) * price.get("cached_input", price["input"])
     output_cost = (completion_tokens / 1_000_000) * price["output"]
     total_cost = input_cost + output_cost
     
     logger.info(f"OpenAI Usage - Model: {model}")
     logger.info(f"  Prompt Tokens: {prompt_tokens:,}")
+    cached_ratio = (cached_tokens / prompt_tokens) * 100 if prompt_tokens > 0 else 0.0
+    logger.info(f"  Cached Prompt Tokens: {cached_tokens:,} ({cached_ratio:.1f}%)")
     logger.info(f"  Completion Tokens: {completion_tokens:,}")
     logger.info(f"  Total Tokens: {total_tokens:,}")
     logger.info(f"  Cost: ${total_cost:.6f} (Input: ${input_cost:.6f} + Output: ${output_cost:.6f})")
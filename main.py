@@ -5,14 +5,35 @@ ArXiv 논문 크롤러 메인 실행 파일
 import asyncio
 import sys
 import time
+from typing import AsyncIterator, Optional, Tuple
 
-from arxiv_fetcher import fetch_latest_papers, fetch_scheduled_papers, transform_arxiv_to_paper_data
-from pdf_handler import download_pdf
-from paper_reviewer_handler import initialize_reviewer, review_paper
-from ai_service import summarize_paper_with_ai
-from backend_service import fetch_user_activities, upload_paper_to_backend
-from models import CrawlStats
-from config import REQUEST_DELAY
+import argparse
+
+from arxiv_fetcher import (
+    fetch_latest_papers,
+    fetch_scheduled_papers,
+    stream_latest_papers,
+    stream_scheduled_papers,
+    transform_arxiv_to_paper_data
+)
+from arxiv_watermark import advance_watermark, load_watermark, save_watermark, watermark_key
+from paper_reviewer_handler import initialize_reviewer
+from reviewer import PARSE_STATS
+from openai_scheduler import scheduler_metrics
+from http_client import close_http_client
+from pdf_handler import shutdown_extract_executor
+from pipeline import create_job, release_job, stage_triage, stage_download, stage_review, stage_summarize, stage_upload, run_staged_pipeline, run_batch_pipeline, iterate_papers
+from models import CrawlStats, PaperJob
+from paper_catalog import filter_new_papers, result_paper_id
+from paper_journal import TERMINAL_STAGES, PaperJournal, close_journal, open_journal
+from config import (
+    MAX_CONCURRENT_PAPERS,
+    PIPELINE_MODE,
+    ARXIV_STREAM_RESULTS,
+    ARXIV_WATERMARK_ENABLED,
+    ARXIV_WATERMARK_PATH,
+    ARXIV_WATERMARK_LOOKBACK_HOURS
+)
 from logger import setup_logger, log_section
 
 logger = setup_logger("main")
@@ -23,7 +44,7 @@ async def process_single_paper(
     reviewer,
     index: int,
     total: int
-) -> bool:
+) -> Tuple[Optional[PaperJob], bool]:
     """
     단일 논문 처리
     
@@ -34,186 +55,282 @@ async def process_single_paper(
         total: 전체 개수
     
     Returns:
-        성공 여부
+        (처리 작업 - 작업 생성 전에 실패하면 None, 성공 여부)
     """
     paper_start_time = time.time()
+    job = None
     
     try:
-        # ArXiv 결과를 PaperData 형식으로 변환
-        paper_data = transform_arxiv_to_paper_data(paper)
-        
-        # 진행률 계산
-        progress_percent = (index / total) * 100
-        
-        title_display = paper_data['title'][:50] + "..." if len(paper_data['title']) > 50 else paper_data['title']
-        print(f"[{index}/{total}] ({progress_percent:.1f}%) 처리 중: \"{title_display}\"")
+        # ArXiv 결과를 처리 작업으로 변환
+        job = create_job(paper, index, total)
         
-        logger.info("=" * 80)
-        logger.info(f"논문 처리 시작 [{index}/{total}] ({progress_percent:.1f}%)")
-        logger.info(f"Title: {paper_data['title']}")
-        logger.info(f"Paper ID: {paper_data.get('paperId', 'N/A')}")
-        logger.info("=" * 80)
+        # 0단계: 초록으로 1차 판단 (명백히 부적절하면 PDF 다운로드 없이 제외)
+        if not await stage_triage(job, reviewer):
+            return job, False
         
         # 1단계: PDF 다운로드
-        if 'pdfUrl' in paper_data and paper_data['pdfUrl']:
-            print("  → PDF 다운로드 중...", end=" ", flush=True)
-            logger.info("PDF 다운로드 시작")
-            
-            download_start = time.time()
-            pdf_content = download_pdf(paper_data['pdfUrl'])
-            download_time = time.time() - download_start
-            
-            if pdf_content:
-                logger.info(f"PDF 다운로드 완료 (크기: {len(pdf_content)} bytes, 소요 시간: {download_time:.2f}초)")
-                print("성공")
-            else:
-                logger.error(f"PDF 다운로드 실패 (소요 시간: {download_time:.2f}초)")
-                print("실패")
-                print("  ✗ 실패 (PDF 다운로드 불가)\n")
-                return False
-        else:
-            logger.error("PDF URL 없음")
-            print("  ✗ 실패 (PDF URL 없음)\n")
-            return False
+        if not await stage_download(job):
+            return job, False
         
         # 2단계: Reviewer로 논문 적절성 판단
-        review_result = None
-        if reviewer:
-            review_result = await review_paper(pdf_content, reviewer)
-            
-            if not review_result:
-                logger.warning("부적절한 논문으로 판단되어 건너뜀")
-                print("  ✗ 부적절한 논문, 건너뜀\n")
-                
-                paper_elapsed = time.time() - paper_start_time
-                logger.info(f"논문 처리 중단 (총 소요 시간: {paper_elapsed:.2f}초)")
-                return False
-        else:
-            logger.info("Reviewer 없음, 모든 논문 적절하다고 판단")
-            print("  → Reviewer 없음, 모든 논문 적절하다고 판단")
-        
-        # 3단계: 적절한 논문이므로 UserActivity 요청
-        print("  → 사용자 활동 정보 요청 중...", end=" ", flush=True)
-        activities = fetch_user_activities()
+        if not await stage_review(job, reviewer):
+            return job, False
         
-        if activities:
-            print("성공")
-        else:
-            print("실패 (계속 진행)")
-            logger.warning("사용자 활동 정보 가져오기 실패, AI 요약 없이 진행")
-        
-        # 4단계: AI 서버로 논문 요약 요청 (적절한 논문만)
-        ai_response = None
-        if activities:
-            ai_response = summarize_paper_with_ai(
-                pdf_content,
-                activities,
-                paper_data.get('paperId', f'paper_{index}')
-            )
-        else:
-            logger.warning("사용자 활동 정보 없음, AI 요약 건너뜀")
-            print("  ⚠ 경고: 사용자 활동 정보 없음, AI 요약 건너뜀")
+        # 3~4단계: UserActivity 요청 후 AI 서버로 논문 요약 요청 (적절한 논문만)
+        await stage_summarize(job)
         
         # 5단계: 백엔드 서버로 업로드
-        success = upload_paper_to_backend(paper_data, pdf_content, ai_response)
-        
-        paper_elapsed = time.time() - paper_start_time
-        
-        if success:
-            logger.info(f"논문 처리 완료 (총 소요 시간: {paper_elapsed:.2f}초)")
-            logger.info("✓ 성공")
-            print("  ✓ 완료\n")
-            return True
-        else:
-            logger.error(f"논문 처리 실패 (총 소요 시간: {paper_elapsed:.2f}초)")
-            logger.error("✗ 실패")
-            print("  ✗ 실패\n")
-            return False
+        return job, await stage_upload(job)
             
     except Exception as e:
         paper_elapsed = time.time() - paper_start_time
         logger.error(f"논문 처리 중 오류 발생 (소요 시간: {paper_elapsed:.2f}초)", exc_info=True)
         print(f"  ✗ 실패 (오류: {str(e)[:100]})\n")
-        return False
+        return job, False
+    finally:
+        if job is not None:
+            release_job(job)
+
 
+def apply_journal(journal: PaperJournal, papers: list) -> list:
+    """
+    재개한 저널 기준으로 저널에서 끝난(업로드/부적절) 논문을 제외하고 새 논문을 저널에 기록
+    
+    Args:
+        journal: 실행 저널
+        papers: ArXiv Result 객체 리스트 (한 페이지 또는 전체)
+    
+    Returns:
+        처리할 ArXiv Result 객체 리스트
+    """
+    resumed = journal.resumed
+    papers = [
+        paper for paper in papers
+        if resumed.get(result_paper_id(paper), {}).get("stage") not in TERMINAL_STAGES
+    ]
+    journal.record_fetched([
+        transform_arxiv_to_paper_data(paper) for paper in papers
+        if result_paper_id(paper) not in resumed
+    ])
+    return papers
+
+
+def journal_leftovers(journal: PaperJournal, fetched_ids: set) -> list:
+    """
+    재개한 저널에서 이번 검색 결과에 없는 끝나지 않은 논문
+    
+    Args:
+        journal: 실행 저널
+        fetched_ids: 이번 검색 결과의 논문 ID
+    
+    Returns:
+        저널의 논문 데이터 리스트
+    """
+    leftovers = [
+        entry["paper_data"] for paper_id, entry in journal.resumed.items()
+        if entry["stage"] not in TERMINAL_STAGES and paper_id not in fetched_ids
+    ]
+    if leftovers:
+        logger.info(f"저널 재개: 검색 결과에 없는 끝나지 않은 논문 {len(leftovers)}개 추가")
+    return leftovers
 
-async def process_papers(papers, mode: str = "latest") -> CrawlStats:
+
+async def prepare_papers(
+    pages: AsyncIterator[list],
+    journal: Optional[PaperJournal],
+    finished_ids: set
+) -> AsyncIterator:
+    """
+    페이지마다 카탈로그/저널 필터를 적용하며 처리할 논문을 하나씩 내보냄
+    
+    Args:
+        pages: ArXiv Result 페이지의 비동기 이터레이터
+        journal: 실행 저널 또는 None
+        finished_ids: 이전 실행에서 이미 끝나 건너뛴 논문 ID를 추가할 집합
+    
+    Yields:
+        ArXiv Result 객체 또는 저널의 논문 데이터 (재개 시 검색 결과에 없는 논문, 마지막에)
+    """
+    fetched_ids = set()
+    async for page in pages:
+        page_ids = {result_paper_id(paper) for paper in page}
+        fetched_ids.update(page_ids)
+        # 이미 업로드했거나 부적절 판단한 논문은 네트워크 요청 전에 제외
+        page = await asyncio.to_thread(filter_new_papers, page)
+        if journal is not None:
+            page = await asyncio.to_thread(apply_journal, journal, page)
+        finished_ids.update(page_ids.difference(result_paper_id(paper) for paper in page))
+        for paper in page:
+            yield paper
+    
+    if journal is not None:
+        for paper_data in journal_leftovers(journal, fetched_ids):
+            yield paper_data
+
+
+async def single_page(papers: list) -> AsyncIterator[list]:
+    """논문 리스트를 페이지 하나짜리 비동기 이터레이터로"""
+    if papers:
+        yield papers
+
+
+async def process_papers(papers, mode: str = "latest", resume: bool = False) -> CrawlStats:
     """
     논문 목록 처리
     
     Args:
-        papers: ArXiv Result 객체 리스트
+        papers: ArXiv Result 객체 리스트, 또는 페이지(리스트)의 비동기 이터레이터
+            (이터레이터이면 concurrent/staged 모드는 페이지가 도착하는 대로 처리, 전체 개수는 끝나야 알 수 있음)
         mode: 처리 모드 ("latest" 또는 "scheduled")
+        resume: 끝나지 않은 이전 실행의 저널을 이어서 처리할지 여부
     
     Returns:
-        처리 결과 통계
+        처리 결과 통계 (finished_ids에 처리가 끝난 논문 ID, 실패한 논문은 제외)
     """
     process_start_time = time.time()
+    streaming = not isinstance(papers, list)
     
     log_section(logger, f"논문 처리 시작 (모드: {mode})")
-    logger.info(f"처리할 논문 수: {len(papers) if papers else 0}")
+    logger.info("처리할 논문 수: 페이지 단위 처리" if streaming else f"처리할 논문 수: {len(papers) if papers else 0}")
     
-    if not papers:
-        print("가져올 논문이 없습니다.")
-        logger.warning("처리할 논문이 없음")
-        return {"success": 0, "fail": 0, "total": 0}
+    # 단계 전환 저널 (재개 시 각 논문을 마지막으로 끝낸 단계 다음부터 처리)
+    journal = await asyncio.to_thread(open_journal, mode, resume)
+    finished_ids = set()
+    prepared = prepare_papers(papers if streaming else single_page(papers), journal, finished_ids)
     
-    print(f"\n논문 {len(papers)}개 발견\n")
+    if streaming and PIPELINE_MODE != "batch":
+        total = 0  # 페이지를 모두 받기 전에는 알 수 없음
+        papers = prepared
+    else:
+        papers = [paper async for paper in prepared]
+        total = len(papers)
+        if not papers:
+            close_journal(journal, completed=True)
+            print("가져올 논문이 없습니다.")
+            logger.warning("처리할 논문이 없음")
+            return {"success": 0, "fail": 0, "total": 0, "finished_ids": sorted(finished_ids)}
+        
+        print(f"\n논문 {len(papers)}개 발견\n")
     
     # Reviewer 초기화
     reviewer = initialize_reviewer()
     
-    # 각 논문 처리
-    success_count = 0
-    fail_count = 0
+    stats = {"success": 0, "fail": 0}
     
-    for index, paper in enumerate(papers, start=1):
-        # 각 논문마다 적절성 판단 후 UserActivity 요청
-        result = await process_single_paper(paper, reviewer, index, len(papers))
-        
+    def record_result(job: Optional[PaperJob], result: bool) -> None:
+        # 카운터 갱신은 await 없이 이루어지므로 이벤트 루프 안에서 원자적
+        # (업로드 또는 부적절 판단으로 끝난 논문만 기록, 실패한 논문은 워터마크가 넘어가지 않도록 제외)
+        if job is not None and job.get("finished"):
+            finished_ids.add(job["paper_data"]["paperId"])
         if result:
-            success_count += 1
+            stats["success"] += 1
         else:
-            fail_count += 1
+            stats["fail"] += 1
         
-        # 진행률 계산
-        current_progress = success_count + fail_count
-        progress_percent = (current_progress / len(papers)) * 100
+        # 진행률 계산 (페이지 단위 처리 중에는 전체 개수를 모름)
+        current_progress = stats["success"] + stats["fail"]
+        progress = f"{current_progress}/{total} ({(current_progress / total) * 100:.1f}%)" if total else f"{current_progress}"
         
         logger.info(
-            f"진행 상황: {current_progress}/{len(papers)} ({progress_percent:.1f}%) "
-            f"(성공: {success_count}, 실패: {fail_count})"
+            f"진행 상황: {progress} "
+            f"(성공: {stats['success']}, 실패: {stats['fail']})"
         )
-        
-        # Rate limiting: 요청 간 딜레이 추가
-        if index < len(papers):
-            time.sleep(REQUEST_DELAY)
+    
+    completed = False
+    try:
+        if PIPELINE_MODE == "staged":
+            # 단계별 워커 풀 + bounded 큐로 처리
+            await run_staged_pipeline(papers, reviewer, record_result)
+        elif PIPELINE_MODE == "batch":
+            # 리뷰를 OpenAI Batch API로 모아서 처리 (비용 절감, 완료까지 최대 24시간)
+            await run_batch_pipeline(papers, reviewer, record_result)
+        else:
+            # 각 논문 처리 (최대 MAX_CONCURRENT_PAPERS개 동시 처리)
+            concurrency = min(MAX_CONCURRENT_PAPERS, total) if total else MAX_CONCURRENT_PAPERS
+            semaphore = asyncio.Semaphore(concurrency)
+            
+            logger.info(f"동시 처리 한도: {concurrency}")
+            
+            async def run_paper(index: int, paper) -> None:
+                try:
+                    # 각 논문마다 적절성 판단 후 UserActivity 요청
+                    # (Rate limiting은 목적지별 토큰 버킷이 각 요청 직전에 적용)
+                    job, result = await process_single_paper(paper, reviewer, index, total)
+                    record_result(job, result)
+                finally:
+                    semaphore.release()
+            
+            # 빈 자리가 있을 때만 다음 논문을 꺼내므로 페이지 단위 처리에서도 한 번에 최대 concurrency개만 보유
+            tasks = []
+            try:
+                index = 0
+                async for paper in iterate_papers(papers):
+                    index += 1
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(run_paper(index, paper)))
+            finally:
+                # 검색이 중간에 실패해도 이미 시작한 논문은 끝까지 처리
+                await asyncio.gather(*tasks, return_exceptions=True)
+            for task in tasks:
+                if task.exception() is not None:
+                    raise task.exception()
+        completed = True
+    finally:
+        # 텍스트 추출 프로세스 풀 및 공유 HTTP 클라이언트 정리
+        shutdown_extract_executor()
+        await close_http_client()
+        # 끝까지 진행했으면 저널 삭제 (중단되었으면 남겨서 --resume으로 재개)
+        close_journal(journal, completed)
+    
+    success_count = stats["success"]
+    fail_count = stats["fail"]
+    total = success_count + fail_count
     
     process_elapsed = time.time() - process_start_time
     
+    if total == 0:
+        print("가져올 논문이 없습니다.")
+        logger.warning("처리할 논문이 없음")
+        return {"success": 0, "fail": 0, "total": 0, "finished_ids": sorted(finished_ids)}
+    
     # 최종 진행률 및 성공률 계산
     final_progress_percent = 100.0  # 모든 논문 처리 완료
-    success_rate = (success_count / len(papers)) * 100 if len(papers) > 0 else 0.0
+    success_rate = (success_count / total) * 100
     
     logger.info("=" * 80)
     logger.info("논문 처리 완료")
-    logger.info(f"진행률: {final_progress_percent:.1f}% ({len(papers)}/{len(papers)})")
-    logger.info(f"성공: {success_count}/{len(papers)} ({success_rate:.1f}%)")
-    logger.info(f"실패: {fail_count}/{len(papers)} ({(100-success_rate):.1f}%)")
+    logger.info(f"진행률: {final_progress_percent:.1f}% ({total}/{total})")
+    logger.info(f"성공: {success_count}/{total} ({success_rate:.1f}%)")
+    logger.info(f"실패: {fail_count}/{total} ({(100-success_rate):.1f}%)")
     logger.info(f"총 소요 시간: {process_elapsed:.2f}초 ({process_elapsed/60:.2f}분)")
-    logger.info(f"논문당 평균 소요 시간: {process_elapsed/len(papers):.2f}초")
+    logger.info(f"논문당 평균 소요 시간: {process_elapsed/total:.2f}초")
+    if reviewer:
+        logger.info(
+            f"리뷰 응답 파싱: 스키마 {PARSE_STATS['schema']}회, "
+            f"정규식 fallback {PARSE_STATS['fallback']}회, 실패 {PARSE_STATS['failed']}회"
+        )
+        for model, metrics in scheduler_metrics().items():
+            logger.info(
+                f"OpenAI 스케줄러 [{model}]: 전송 {metrics['sent']}회, 재시도 {metrics['retries']}회, "
+                f"429 {metrics['rate_limited']}회, 실패 {metrics['failed']}회, "
+                f"최대 대기열 {metrics['max_queue_depth']}, 누적 대기 {metrics['wait_seconds']:.1f}초"
+            )
     logger.info("=" * 80)
     
     return {
         "success": success_count,
         "fail": fail_count,
-        "total": len(papers)
+        "total": total,
+        "finished_ids": sorted(finished_ids)
     }
 
 
-async def main_async():
+async def main_async(resume: bool = False):
     """
     메인 함수 - 최신 100개 논문 크롤링 (async)
+    
+    Args:
+        resume: 중단된 이전 실행을 저널에서 이어서 처리할지 여부
     """
     start_time = time.time()
     
@@ -224,11 +341,15 @@ async def main_async():
     log_section(logger, "ArXiv 크롤링 시작 (최신 100개)")
     
     try:
-        # 1. 최신 논문 가져오기
-        papers = fetch_latest_papers()
+        # 1. 최신 논문 가져오기 (재시도 대기가 이벤트 루프를 막지 않도록 워커 스레드에서 실행)
+        #    ARXIV_STREAM_RESULTS이면 전체를 기다리지 않고 페이지가 도착하는 대로 처리
+        if ARXIV_STREAM_RESULTS:
+            papers = stream_latest_papers()
+        else:
+            papers = await asyncio.to_thread(fetch_latest_papers)
         
         # 2. 논문 처리
-        results = await process_papers(papers, mode="latest")
+        results = await process_papers(papers, mode="latest", resume=resume)
         
         elapsed = time.time() - start_time
         
@@ -264,24 +385,54 @@ async def main_async():
         sys.exit(1)
 
 
-async def scheduled_crawl_async():
+async def scheduled_crawl_async(resume: bool = False):
     """
-    스케줄링용 크롤링 함수 - 최신 10개 논문 크롤링 (async)
+    스케줄링용 크롤링 함수 - 워터마크 이후 새 논문 크롤링 (async)
+    
+    Args:
+        resume: 중단된 이전 실행을 저널에서 이어서 처리할지 여부
     """
     start_time = time.time()
     
     print("=" * 60)
-    print("ArXiv 스케줄링 크롤링 시작 (최신 10개)")
+    print("ArXiv 스케줄링 크롤링 시작 (워터마크 이후 새 논문)")
     print("=" * 60)
     
-    log_section(logger, "ArXiv 스케줄링 크롤링 시작 (최신 10개)")
+    log_section(logger, "ArXiv 스케줄링 크롤링 시작 (워터마크 이후 새 논문)")
     
     try:
-        # 1. 최신 논문 가져오기
-        papers = fetch_scheduled_papers()
+        # 1. 워터마크 이후 논문 가져오기 (재시도 대기가 이벤트 루프를 막지 않도록 워커 스레드에서 실행)
+        watermark = load_watermark(ARXIV_WATERMARK_PATH) if ARXIV_WATERMARK_ENABLED else None
+        # 논문 ID(PaperData의 paperId 형식) → 워터마크 키
+        fetched_keys = {}
+        if ARXIV_STREAM_RESULTS:
+            async def tap_pages(pages):
+                # 워터마크 갱신용 키만 남기고 Result 객체는 처리 후 해제
+                async for page in pages:
+                    fetched_keys.update((result_paper_id(paper), watermark_key(paper)) for paper in page)
+                    yield page
+            
+            papers = tap_pages(stream_scheduled_papers(watermark=watermark))
+        else:
+            papers = await asyncio.to_thread(fetch_scheduled_papers, watermark=watermark)
+            fetched_keys = {result_paper_id(paper): watermark_key(paper) for paper in papers}
         
         # 2. 논문 처리
-        results = await process_papers(papers, mode="scheduled")
+        results = await process_papers(papers, mode="scheduled", resume=resume)
+        
+        # 처리가 끝난 뒤에만 워터마크를 옮김 (도중에 종료되면 다음 실행에서 다시 가져옴)
+        # 실패한 논문은 다음 실행에서 다시 가져오도록 워터마크가 그 논문을 넘지 않게 함
+        if ARXIV_WATERMARK_ENABLED:
+            finished_ids = set(results["finished_ids"])
+            finished_keys = [key for paper_id, key in fetched_keys.items() if paper_id in finished_ids]
+            pending_keys = [key for paper_id, key in fetched_keys.items() if paper_id not in finished_ids]
+            if pending_keys:
+                logger.info(f"처리를 끝내지 못한 논문 {len(pending_keys)}개는 다음 실행에서 다시 가져옴")
+            new_watermark = advance_watermark(
+                watermark, finished_keys, ARXIV_WATERMARK_LOOKBACK_HOURS, pending=pending_keys
+            )
+            if new_watermark is not None and new_watermark != watermark:
+                save_watermark(ARXIV_WATERMARK_PATH, new_watermark)
         
         elapsed = time.time() - start_time
         
@@ -317,16 +468,24 @@ async def scheduled_crawl_async():
         sys.exit(1)
 
 
-def main():
+def main(resume: bool = False):
     """메인 함수 - 최신 100개 논문 크롤링"""
-    asyncio.run(main_async())
+    asyncio.run(main_async(resume))
 
 
-def scheduled_crawl():
-    """스케줄링용 크롤링 함수 - 최신 10개 논문 크롤링"""
-    asyncio.run(scheduled_crawl_async())
+def scheduled_crawl(resume: bool = False):
+    """스케줄링용 크롤링 함수 - 워터마크 이후 새 논문 크롤링"""
+    asyncio.run(scheduled_crawl_async(resume))
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="ArXiv 논문 크롤러")
+    parser.add_argument("--resume", action="store_true", help="중단된 이전 실행을 마지막으로 끝낸 단계부터 이어서 처리")
+    parser.add_argument("--scheduled", action="store_true", help="스케줄링용 크롤링 (워터마크 이후 새 논문)")
+    args = parser.parse_args()
+    
+    if args.scheduled:
+        scheduled_crawl(resume=args.resume)
+    else:
+        main(resume=args.resume)
 
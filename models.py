@@ -4,6 +4,8 @@
 
 from typing import Dict, List, Optional, TypedDict
 
+from pdf_buffer import PdfBuffer
+
 
 class PaperData(TypedDict):
     """논문 데이터 타입"""
@@ -41,6 +43,37 @@ class ProcessedAIResponse(TypedDict, total=False):
     thumbnail_bytes: bytes
 
 
+class PdfTextExtraction(TypedDict):
+    """PDF 텍스트 추출 결과 타입"""
+    text: str
+    backend: str  # 사용한 텍스트 추출 백엔드
+    total_pages: int
+    pages_read: int
+    pages_skipped: int  # 최대 길이 도달로 추출하지 않은 페이지 수
+    truncated: bool
+
+
+class PaperSection(TypedDict):
+    """논문 섹션 타입"""
+    kind: str  # front, abstract, introduction, method, experiments, conclusion, references, appendix, other 등
+    title: str  # 섹션 제목 (front는 빈 문자열)
+    text: str  # 제목 줄을 포함한 섹션 텍스트
+
+
+class ArxivWatermark(TypedDict):
+    """스케줄링 크롤링 워터마크 타입"""
+    published: str  # 마지막으로 처리한 논문 중 가장 최근 제출 시각 (ISO 8601, UTC)
+    paper_ids: List[str]  # published - lookback 이후에 처리한 논문 ID (버전 제외)
+
+
+class JournalEntry(TypedDict, total=False):
+    """처리 저널에서 복원한 논문 상태 타입"""
+    paper_data: PaperData
+    stage: str  # 마지막으로 끝낸 단계 (fetched, downloaded, reviewed, summarized, uploaded, rejected)
+    review_result: Optional[Dict]  # reviewed 이후
+    ai_response: ProcessedAIResponse  # summarized 이후
+
+
 class ReviewResult(TypedDict, total=False):
     """리뷰 결과 타입"""
     rating: int
@@ -50,9 +83,23 @@ class ReviewResult(TypedDict, total=False):
     questions: List[str]
 
 
+class PaperJob(TypedDict, total=False):
+    """파이프라인 단계 사이에서 전달되는 논문 처리 작업 타입"""
+    index: int
+    total: int
+    start_time: float
+    paper_data: PaperData
+    pdf_content: PdfBuffer
+    review_result: Optional[Dict]
+    ai_response: Optional[ProcessedAIResponse]
+    resumed_stage: str  # 저널에서 재개한 경우 마지막으로 끝낸 단계
+    finished: bool  # 업로드 또는 부적절 판단으로 처리가 끝났는지 (실패와 구분)
+
+
 class CrawlStats(TypedDict):
     """크롤링 통계 타입"""
     success: int
     fail: int
     total: int
+    finished_ids: List[str]  # 업로드 또는 부적절 판단으로 처리가 끝난 논문 ID (이전 실행에서 끝난 논문 포함, 실패 제외)
 
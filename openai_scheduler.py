@@ -0,0 +1,307 @@
+"""
+OpenAI 요청 스케줄러 모듈
+
+리뷰를 동시에 실행하면 OpenAI의 분당 요청 수(RPM)/분당 토큰 수(TPM) 한도에 걸려 429가 발생하므로,
+모델별로 두 한도를 토큰 버킷으로 추적하여 보내기 전에 예상 토큰만큼 예약하고 한도 안에서만 전송함.
+429/일시적 오류는 retry-after 헤더(없으면 지수 백오프 + jitter)만큼 같은 모델의 모든 요청을 보류한 뒤 재시도.
+요청은 도착 순서(FIFO)대로 전송되며 대기열 길이 등 지표는 metrics()로 확인
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import openai
+
+from config import (
+    OPENAI_RPM,
+    OPENAI_TPM,
+    OPENAI_MAX_RETRIES,
+    OPENAI_RETRY_BASE_DELAY,
+    OPENAI_RETRY_MAX_DELAY
+)
+from logger import setup_logger
+
+logger = setup_logger("openai_scheduler")
+
+T = TypeVar("T")
+
+# 재시도하는 오류 (429, 연결/타임아웃, 5xx)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+class MinuteBudget:
+    """
+    분당 한도 버킷 (최대 limit만큼 쌓이고 초당 limit/60씩 충전)
+    """
+
+    def __init__(self, limit: int):
+        """
+        Args:
+            limit: 분당 한도 (0 이하이면 제한 없음)
+        """
+        self.limit = limit
+        self.available = float(limit)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.limit, self.available + (now - self._updated) * self.limit / 60.0)
+        self._updated = now
+
+    def wait_time(self, amount: int) -> float:
+        """
+        amount만큼 쓸 수 있을 때까지 기다려야 하는 시간 (초)
+
+        한도보다 큰 요청은 버킷이 가득 찼을 때 보냄
+        """
+        if self.limit <= 0:
+            return 0.0
+        self._refill()
+        needed = min(amount, self.limit)
+        if self.available >= needed:
+            return 0.0
+        return (needed - self.available) * 60.0 / self.limit
+
+    def consume(self, amount: int) -> None:
+        """amount만큼 사용 (음수 잔량 허용)"""
+        if self.limit > 0:
+            self._refill()
+            self.available -= amount
+
+    def refund(self, amount: int) -> None:
+        """예약했지만 쓰지 않은 만큼 반환 (음수이면 추가 사용)"""
+        if self.limit > 0:
+            self._refill()
+            self.available = min(self.limit, self.available + amount)
+
+
+class OpenAIScheduler:
+    """
+    모델 하나에 대한 RPM/TPM 예산 스케줄러
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rpm: int,
+        tpm: int,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ):
+        """
+        Args:
+            name: 스케줄러 이름 (모델 이름, 로깅용)
+            rpm: 분당 요청 수 한도 (0 이하이면 제한 없음)
+            tpm: 분당 토큰 수 한도 (0 이하이면 제한 없음)
+            max_retries: 재시도 가능한 오류의 최대 재시도 횟수
+            base_delay: 지수 백오프 시작 대기 시간 (초)
+            max_delay: 지수 백오프 최대 대기 시간 (초)
+        """
+        self.name = name
+        self.requests = MinuteBudget(rpm)
+        self.tokens = MinuteBudget(tpm)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._blocked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._metrics = {
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "in_flight": 0,
+            "sent": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def _queue_lock(self) -> asyncio.Lock:
+        """전송 순서용 락 (이벤트 루프마다 새로 생성, 대기 순서대로 획득)"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        스케줄러 지표
+
+        Returns:
+            대기열 길이, 전송 중 요청 수, 전송/성공/실패/재시도/429 횟수, 누적 대기 시간 등
+        """
+        return dict(self._metrics)
+
+    def defer(self, seconds: float) -> None:
+        """
+        이 모델로 가는 모든 요청을 지정한 시간만큼 보류 (429 응답 시)
+
+        Args:
+            seconds: 보류할 시간 (초)
+        """
+        if seconds > 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def _acquire(self, estimated_tokens: int) -> None:
+        """도착 순서대로 RPM/TPM 예산과 보류 시간을 기다린 뒤 예약"""
+        self._metrics["queue_depth"] += 1
+        self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], self._metrics["queue_depth"])
+        start = time.monotonic()
+        try:
+            async with self._queue_lock():
+                while True:
+                    wait = max(
+                        self._blocked_until - time.monotonic(),
+                        self.requests.wait_time(1),
+                        self.tokens.wait_time(estimated_tokens),
+                    )
+                    if wait <= 0:
+                        break
+                    logger.debug(f"[{self.name}] 예산 대기: {wait:.2f}초 (예상 토큰: {estimated_tokens})")
+                    await asyncio.sleep(wait)
+                self.requests.consume(1)
+                self.tokens.consume(estimated_tokens)
+        finally:
+            self._metrics["queue_depth"] -= 1
+            self._metrics["wait_seconds"] += time.monotonic() - start
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        재시도 전 대기 시간 (retry-after 헤더가 있으면 그 값, 없으면 지수 백오프) + jitter
+        """
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return retry_after + random.uniform(0, min(1.0, retry_after * 0.1 + 0.1))
+        # full jitter: 0 ~ min(max_delay, base * 2^attempt)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def run(
+        self,
+        request: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        actual_tokens: Optional[Callable[[T], Optional[int]]] = None
+    ) -> T:
+        """
+        예산 안에서 요청 실행 (재시도 가능한 오류는 대기 후 재시도)
+
+        Args:
+            request: 요청 함수 (호출할 때마다 새 요청)
+            estimated_tokens: 예상 토큰 수 (입력 + 예상 출력)
+            actual_tokens: 응답에서 실제 사용 토큰 수를 꺼내는 함수 (예약분과의 차이를 TPM 예산에 반영)
+
+        Returns:
+            요청 결과
+
+        Raises:
+            재시도 횟수를 넘긴 오류 또는 재시도하지 않는 오류
+        """
+        attempt = 0
+        while True:
+            await self._acquire(estimated_tokens)
+            self._metrics["sent"] += 1
+            self._metrics["in_flight"] += 1
+            try:
+                result = await request()
+            except RETRYABLE_ERRORS as e:
+                if isinstance(e, openai.RateLimitError):
+                    self._metrics["rate_limited"] += 1
+                if attempt >= self.max_retries:
+                    self._metrics["failed"] += 1
+                    logger.error(f"[{self.name}] 재시도 {attempt}회 후 실패: {type(e).__name__}")
+                    raise
+
+                delay = self._retry_delay(e, attempt)
+                attempt += 1
+                self._metrics["retries"] += 1
+                logger.warning(
+                    f"[{self.name}] {type(e).__name__}, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})"
+                )
+                if isinstance(e, openai.RateLimitError):
+                    # 한도 초과는 이 모델의 모든 요청에 해당하므로 전체를 보류
+                    self.defer(delay)
+                    continue
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                self._metrics["failed"] += 1
+                raise
+            finally:
+                self._metrics["in_flight"] -= 1
+
+            self._metrics["succeeded"] += 1
+            if actual_tokens is not None:
+                used = actual_tokens(result)
+                if used is not None:
+                    self.tokens.refund(estimated_tokens - used)
+            return result
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """오류 응답의 retry-after-ms / retry-after 헤더 (초, 없으면 None)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return max(0.0, float(retry_after))
+    except ValueError:
+        return None
+    return None
+
+
+_schedulers: Dict[str, OpenAIScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_openai_scheduler(model: str) -> OpenAIScheduler:
+    """
+    모델별 스케줄러 가져오기 (없으면 OPENAI_RPM/OPENAI_TPM 설정으로 생성)
+
+    Args:
+        model: 모델 이름
+
+    Returns:
+        해당 모델의 OpenAIScheduler
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(model)
+        if scheduler is None:
+            scheduler = OpenAIScheduler(
+                model,
+                OPENAI_RPM,
+                OPENAI_TPM,
+                max_retries=OPENAI_MAX_RETRIES,
+                base_delay=OPENAI_RETRY_BASE_DELAY,
+                max_delay=OPENAI_RETRY_MAX_DELAY
+            )
+            _schedulers[model] = scheduler
+            logger.debug(f"[{model}] OpenAI 스케줄러 생성 (RPM: {OPENAI_RPM}, TPM: {OPENAI_TPM})")
+        return scheduler
+
+
+def scheduler_metrics() -> Dict[str, Dict[str, float]]:
+    """
+    모든 모델의 스케줄러 지표
+
+    Returns:
+        {모델: 지표}
+    """
+    with _schedulers_lock:
+        return {model: scheduler.metrics() for model, scheduler in _schedulers.items()}
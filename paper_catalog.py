@@ -0,0 +1,340 @@
+"""
+처리한 논문 카탈로그 모듈
+
+이미 업로드했거나 부적절하다고 판단한 논문을 실행마다 다시 다운로드/리뷰/업로드하지 않도록
+arXiv ID별로 버전, 마지막으로 끝낸 단계, 리뷰 판단, 업로드 여부를 SQLite에 기록하고
+process_papers가 네트워크 요청 전에 조회하여 건너뜀 (arXiv ID가 기본 키이므로 인덱스 조회).
+PAPER_CATALOG_BLOOM=true이면 끝난 논문 ID를 메모리의 bloom filter에 올려 두고,
+filter에 없는 ID(대부분의 새 논문)는 SQLite 조회 없이 바로 새 논문으로 판단
+
+사용법:
+    python paper_catalog.py --stats
+    python paper_catalog.py --forget-rejected          # 부적절 판단 기록 삭제 (프롬프트 변경 후 다시 리뷰)
+    python paper_catalog.py --forget 2401.12345
+"""
+
+import argparse
+import hashlib
+import math
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import PAPER_CATALOG_ENABLED, PAPER_CATALOG_PATH, PAPER_CATALOG_BLOOM
+from logger import setup_logger
+
+logger = setup_logger("paper_catalog")
+
+
+# 리뷰 판단
+DECISION_ACCEPTED = "accepted"
+DECISION_REJECTED = "rejected"
+
+# bloom filter 오탐률 / 최소 용량
+BLOOM_ERROR_RATE = 0.01
+BLOOM_MIN_CAPACITY = 100_000
+
+_VERSION_PATTERN = re.compile(r'^(?P<base>.+?)v(?P<version>\d+)$')
+
+
+def split_paper_id(paper_id: str) -> Tuple[str, int]:
+    """
+    arXiv ID를 (버전 없는 ID, 버전)으로 분리
+
+    Args:
+        paper_id: arXiv ID (예: 2401.12345v2)
+
+    Returns:
+        (버전 없는 ID, 버전) - 버전이 없으면 0
+    """
+    match = _VERSION_PATTERN.match(paper_id)
+    if match:
+        return match.group("base"), int(match.group("version"))
+    return paper_id, 0
+
+
+def result_paper_id(paper) -> str:
+    """ArXiv Result의 논문 ID (PaperData의 paperId와 같은 형식)"""
+    return paper.entry_id.split('/')[-1] if paper.entry_id else ""
+
+
+class BloomFilter:
+    """
+    문자열 키 bloom filter (없다고 하면 확실히 없음, 있다고 하면 오탐 가능)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        """
+        Args:
+            capacity: 예상 키 수 (넘으면 오탐률이 올라감)
+            error_rate: 목표 오탐률
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        # double hashing: h1 + i * h2
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class PaperCatalog:
+    """
+    처리한 논문 SQLite 카탈로그
+
+    SQLite(WAL)를 사용하므로 여러 스레드/프로세스에서 공유 가능
+    """
+
+    def __init__(self, db_path: str, use_bloom: bool = False):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            use_bloom: 끝난 논문 ID를 bloom filter로 먼저 확인할지 여부
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS papers (
+                    arxiv_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    stage TEXT NOT NULL,
+                    decision TEXT,
+                    uploaded INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+
+        self.bloom: Optional[BloomFilter] = None
+        if use_bloom:
+            self._build_bloom()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """DB 연결 (블록이 끝나면 커밋 후 닫음)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _build_bloom(self) -> None:
+        """끝난 논문 ID로 bloom filter 생성"""
+        with self._connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM papers WHERE uploaded = 1 OR decision = ?", (DECISION_REJECTED,)).fetchone()[0]
+            self.bloom = BloomFilter(max(BLOOM_MIN_CAPACITY, count * 2))
+            for (arxiv_id,) in conn.execute("SELECT arxiv_id FROM papers WHERE uploaded = 1 OR decision = ?", (DECISION_REJECTED,)):
+                self.bloom.add(arxiv_id)
+        logger.info(f"카탈로그 bloom filter 생성: 끝난 논문 {count}개")
+
+    def finished_ids(self, paper_ids: Iterable[str]) -> set:
+        """
+        이미 끝난(업로드 또는 부적절 판단) 논문 ID 찾기
+
+        카탈로그의 버전보다 새 버전이면 끝나지 않은 것으로 봄
+
+        Args:
+            paper_ids: 버전이 포함된 arXiv ID 목록
+
+        Returns:
+            끝난 논문 ID 집합 (입력과 같은 형식)
+        """
+        candidates = {}
+        for paper_id in paper_ids:
+            arxiv_id, version = split_paper_id(paper_id)
+            if self.bloom is not None and arxiv_id not in self.bloom:
+                continue
+            candidates[paper_id] = (arxiv_id, version)
+        if not candidates:
+            return set()
+
+        finished = set()
+        with self._lock, self._connect() as conn:
+            for paper_id, (arxiv_id, version) in candidates.items():
+                row = conn.execute(
+                    "SELECT version, decision, uploaded FROM papers WHERE arxiv_id = ?", (arxiv_id,)
+                ).fetchone()
+                if row and row[0] >= version and (row[2] or row[1] == DECISION_REJECTED):
+                    finished.add(paper_id)
+        return finished
+
+    def record(
+        self,
+        paper_id: str,
+        stage: str,
+        decision: Optional[str] = None,
+        uploaded: bool = False
+    ) -> None:
+        """
+        논문 처리 단계 기록 (같은 논문은 덮어쓰되 판단/업로드 여부는 같은 버전이면 유지)
+
+        Args:
+            paper_id: 버전이 포함된 arXiv ID
+            stage: 마지막으로 끝낸 단계 (triage, download, review, summarize, upload)
+            decision: 리뷰 판단 (accepted, rejected, None이면 기존 값 유지)
+            uploaded: 업로드 완료 여부
+        """
+        arxiv_id, version = split_paper_id(paper_id)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO papers (arxiv_id, version, stage, decision, uploaded, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(arxiv_id) DO UPDATE SET
+                    stage = excluded.stage,
+                    decision = CASE WHEN excluded.version > papers.version OR excluded.decision IS NOT NULL
+                                    THEN excluded.decision ELSE papers.decision END,
+                    uploaded = CASE WHEN excluded.version > papers.version
+                                    THEN excluded.uploaded ELSE MAX(papers.uploaded, excluded.uploaded) END,
+                    version = MAX(papers.version, excluded.version),
+                    updated_at = excluded.updated_at
+                WHERE excluded.version >= papers.version
+                """,
+                (arxiv_id, version, stage, decision, int(uploaded), time.time())
+            )
+        if self.bloom is not None and (uploaded or decision == DECISION_REJECTED):
+            self.bloom.add(arxiv_id)
+
+    def forget(self, arxiv_id: Optional[str] = None, rejected_only: bool = False) -> int:
+        """
+        기록 삭제 (다음 실행에서 다시 처리)
+
+        Args:
+            arxiv_id: 지정하면 이 논문만 삭제 (버전 무시)
+            rejected_only: 부적절 판단 기록만 삭제
+
+        Returns:
+            삭제된 기록 수
+        """
+        conditions = []
+        params = []
+        if arxiv_id is not None:
+            conditions.append("arxiv_id = ?")
+            params.append(split_paper_id(arxiv_id)[0])
+        if rejected_only:
+            conditions.append("decision = ? AND uploaded = 0")
+            params.append(DECISION_REJECTED)
+
+        query = "DELETE FROM papers"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        with self._lock, self._connect() as conn:
+            deleted = conn.execute(query, params).rowcount
+        if self.bloom is not None:
+            self._build_bloom()
+        return deleted
+
+    def stats(self) -> Dict[str, int]:
+        """
+        단계/판단별 기록 수
+
+        Returns:
+            {"업로드", "부적절", 단계 이름: 기록 수}
+        """
+        with self._connect() as conn:
+            uploaded = conn.execute("SELECT COUNT(*) FROM papers WHERE uploaded = 1").fetchone()[0]
+            rejected = conn.execute("SELECT COUNT(*) FROM papers WHERE decision = ? AND uploaded = 0", (DECISION_REJECTED,)).fetchone()[0]
+            stages = conn.execute("SELECT stage, COUNT(*) FROM papers GROUP BY stage").fetchall()
+        result = {"업로드": uploaded, "부적절": rejected}
+        result.update({f"단계 {stage}": count for stage, count in stages})
+        return result
+
+
+_paper_catalog: Optional[PaperCatalog] = None
+_paper_catalog_lock = threading.Lock()
+
+
+def get_paper_catalog() -> Optional[PaperCatalog]:
+    """
+    공유 논문 카탈로그 가져오기 (없으면 생성)
+
+    Returns:
+        PaperCatalog 인스턴스 또는 None (비활성화 또는 초기화 실패 시)
+    """
+    global _paper_catalog
+
+    if not PAPER_CATALOG_ENABLED:
+        return None
+
+    with _paper_catalog_lock:
+        if _paper_catalog is None:
+            try:
+                _paper_catalog = PaperCatalog(PAPER_CATALOG_PATH, use_bloom=PAPER_CATALOG_BLOOM)
+                logger.info(f"논문 카탈로그 사용: {PAPER_CATALOG_PATH}")
+            except Exception as e:
+                logger.error(f"논문 카탈로그 초기화 실패, 카탈로그 없이 진행: {e}", exc_info=True)
+                return None
+        return _paper_catalog
+
+
+def filter_new_papers(papers: List) -> List:
+    """
+    카탈로그에서 이미 끝난 논문을 뺀 목록 (네트워크 요청 전에 호출)
+
+    Args:
+        papers: ArXiv Result 객체 리스트
+
+    Returns:
+        처리할 ArXiv Result 객체 리스트 (순서 유지)
+    """
+    catalog = get_paper_catalog()
+    if catalog is None or not papers:
+        return papers
+
+    try:
+        finished = catalog.finished_ids(result_paper_id(paper) for paper in papers)
+    except Exception as e:
+        logger.error(f"논문 카탈로그 조회 실패, 모든 논문 처리: {e}", exc_info=True)
+        return papers
+
+    if finished:
+        logger.info(f"이미 처리한 논문 {len(finished)}개 건너뜀 (카탈로그)")
+        print(f"이미 처리한 논문 {len(finished)}개 건너뜀")
+    return [paper for paper in papers if result_paper_id(paper) not in finished]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="처리한 논문 카탈로그 관리")
+    parser.add_argument("--stats", action="store_true", help="단계/판단별 기록 수 출력")
+    parser.add_argument("--forget", default=None, help="이 arXiv ID의 기록 삭제 (다음 실행에서 다시 처리)")
+    parser.add_argument("--forget-rejected", action="store_true", help="부적절 판단 기록 삭제 (다시 리뷰)")
+    args = parser.parse_args()
+
+    catalog = PaperCatalog(PAPER_CATALOG_PATH)
+    print(f"논문 카탈로그: {PAPER_CATALOG_PATH}")
+
+    if args.forget or args.forget_rejected:
+        deleted = catalog.forget(arxiv_id=args.forget, rejected_only=args.forget_rejected)
+        print(f"삭제된 기록: {deleted}개")
+        logger.info(f"논문 카탈로그 삭제: {deleted}개 (paper: {args.forget or '전체'}, rejected_only: {args.forget_rejected})")
+
+    if args.stats or not (args.forget or args.forget_rejected):
+        for name, count in catalog.stats().items():
+            print(f"  {name}: {count}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""
+논문 처리 저널 모듈 (crash-safe 재개)
+
+실행마다 저널 파일(JSONL)에 논문별 단계 전환(fetched → downloaded → reviewed → summarized → uploaded,
+또는 rejected)을 한 줄씩 추가하고 매번 fsync하므로, 프로세스가 도중에 종료되어도 마지막으로 끝낸 단계가 남음.
+리뷰 결과와 처리된 AI 응답은 단계 기록보다 먼저 artifact 파일로 저장(write-ahead)하여
+`python main.py --resume`으로 다시 실행하면 각 논문을 마지막으로 끝낸 단계 다음부터 이어서 처리.
+PDF는 저장하지 않음 (PDF 캐시가 켜져 있으면 다시 다운로드하지 않고 캐시에서 읽음).
+실행이 끝까지 진행되면 저널과 artifact는 삭제됨.
+사용 중인 저널 파일은 flock으로 잠가 두므로 동시에 실행 중인 다른 실행의 저널은 재개하거나 삭제하지 않고,
+끝나지 않은 저널은 PAPER_JOURNAL_MAX_AGE_DAYS가 지나면 정리
+"""
+
+import base64
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import PAPER_JOURNAL_ENABLED, PAPER_JOURNAL_DIR, PAPER_JOURNAL_MAX_AGE_DAYS
+from logger import setup_logger
+from models import JournalEntry, PaperData, ProcessedAIResponse
+
+try:
+    import fcntl
+except ImportError:  # Windows (잠금 없이 동작)
+    fcntl = None
+
+logger = setup_logger("paper_journal")
+
+
+# 단계 (순서대로 진행, rejected와 uploaded는 끝난 상태)
+STAGE_FETCHED = "fetched"
+STAGE_DOWNLOADED = "downloaded"
+STAGE_REVIEWED = "reviewed"
+STAGE_SUMMARIZED = "summarized"
+STAGE_UPLOADED = "uploaded"
+STAGE_REJECTED = "rejected"
+
+STAGE_ORDER = [STAGE_FETCHED, STAGE_DOWNLOADED, STAGE_REVIEWED, STAGE_SUMMARIZED, STAGE_UPLOADED]
+TERMINAL_STAGES = (STAGE_UPLOADED, STAGE_REJECTED)
+
+
+class JournalLockedError(Exception):
+    """다른 실행이 사용 중인 저널 (저널 파일이 잠겨 있거나 그 사이 삭제됨)"""
+
+
+def _try_lock(file) -> bool:
+    """열린 저널 파일에 배타적 잠금 시도 (다른 실행이 잠그고 있으면 False, 파일을 닫거나 프로세스가 종료되면 해제됨)"""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _safe_name(paper_id: str) -> str:
+    """논문 ID를 파일 이름으로 (구버전 ID의 '/' 등 치환)"""
+    return "".join(char if char.isalnum() or char in ".-_" else "_" for char in paper_id)
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """임시 파일에 쓰고 fsync한 뒤 교체 (중간에 종료되어도 이전 파일 또는 새 파일만 남음)"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _encode_ai_response(ai_response: ProcessedAIResponse) -> Dict:
+    """처리된 AI 응답을 JSON으로 저장할 수 있게 변환 (썸네일 bytes는 base64)"""
+    encoded = {key: value for key, value in ai_response.items() if key != "thumbnail_bytes"}
+    if ai_response.get("thumbnail_bytes"):
+        encoded["thumbnail_base64"] = base64.b64encode(ai_response["thumbnail_bytes"]).decode("ascii")
+    return encoded
+
+
+def _decode_ai_response(encoded: Dict) -> ProcessedAIResponse:
+    """_encode_ai_response의 역변환"""
+    ai_response = {key: value for key, value in encoded.items() if key != "thumbnail_base64"}
+    if encoded.get("thumbnail_base64"):
+        ai_response["thumbnail_bytes"] = base64.b64decode(encoded["thumbnail_base64"])
+    return ai_response
+
+
+class PaperJournal:
+    """
+    실행 하나의 논문 처리 저널 (저널 파일 + artifact 디렉토리)
+    """
+
+    def __init__(self, journal_dir: str, run_id: str, mode: str):
+        """
+        Args:
+            journal_dir: 저널 디렉토리
+            run_id: 실행 ID (저널 파일 이름)
+            mode: 처리 모드 (latest, scheduled)
+        """
+        self.run_id = run_id
+        self.mode = mode
+        self.path = Path(journal_dir) / f"{run_id}.jsonl"
+        self.artifacts_dir = Path(journal_dir) / run_id
+        self.resumed: Dict[str, JournalEntry] = {}
+        self._lock = threading.Lock()
+
+        self._file = open(self.path, "a", encoding="utf-8")
+        try:
+            # 잠그기 전에 다른 실행이 저널을 삭제했으면 열어 둔 파일은 경로에서 떨어져 있음
+            if not _try_lock(self._file) or not os.path.samestat(os.fstat(self._file.fileno()), os.stat(self.path)):
+                raise JournalLockedError(f"다른 실행이 사용 중인 저널: {run_id}")
+        except (JournalLockedError, OSError):
+            self._file.close()
+            raise
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+    def _append(self, record: Dict) -> None:
+        """저널에 한 줄 추가 후 fsync"""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record_fetched(self, papers: List[PaperData]) -> None:
+        """
+        처리할 논문 기록 (재개 시 arXiv 검색 결과에 없어도 이 데이터로 처리)
+
+        Args:
+            papers: 논문 데이터 리스트
+        """
+        lines = "".join(
+            json.dumps({"paper": paper["paperId"], "stage": STAGE_FETCHED, "time": time.time(), "paper_data": paper}, ensure_ascii=False) + "\n"
+            for paper in papers
+        )
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record(
+        self,
+        paper_id: str,
+        stage: str,
+        review_result: Optional[Dict] = None,
+        ai_response: Optional[ProcessedAIResponse] = None
+    ) -> None:
+        """
+        단계 전환 기록 (artifact가 있으면 먼저 저장한 뒤 기록)
+
+        Args:
+            paper_id: 논문 ID
+            stage: 끝낸 단계
+            review_result: reviewed 단계의 리뷰 결과
+            ai_response: summarized 단계의 처리된 AI 응답
+        """
+        record = {"paper": paper_id, "stage": stage, "time": time.time()}
+        artifact = None
+        if stage == STAGE_REVIEWED and review_result is not None:
+            artifact = {"review_result": review_result}
+        elif stage == STAGE_SUMMARIZED and ai_response is not None:
+            artifact = {"ai_response": _encode_ai_response(ai_response)}
+
+        if artifact is not None:
+            artifact_name = f"{_safe_name(paper_id)}.{stage}.json"
+            _write_atomic(self.artifacts_dir / artifact_name, json.dumps(artifact, ensure_ascii=False))
+            record["artifact"] = artifact_name
+        self._append(record)
+
+    def replay(self) -> Dict[str, JournalEntry]:
+        """
+        저널을 읽어 논문별 마지막으로 끝낸 단계와 artifact 복원
+
+        마지막 줄이 쓰다가 끊긴 경우 그 줄은 무시
+
+        Returns:
+            {논문 ID: 저널 항목}
+        """
+        entries: Dict[str, JournalEntry] = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"저널의 끊긴 줄 무시: {line[:80]!r}")
+                    continue
+
+                paper_id = record["paper"]
+                stage = record["stage"]
+                entry = entries.get(paper_id)
+                if stage == STAGE_FETCHED:
+                    if entry is None:
+                        entries[paper_id] = {"paper_data": record["paper_data"], "stage": STAGE_FETCHED}
+                    continue
+                if entry is None or entry["stage"] in TERMINAL_STAGES:
+                    continue
+
+                if stage == STAGE_REJECTED or STAGE_ORDER.index(stage) > STAGE_ORDER.index(entry["stage"]):
+                    entry["stage"] = stage
+                if "artifact" in record:
+                    artifact_path = self.artifacts_dir / record["artifact"]
+                    try:
+                        artifact = json.loads(artifact_path.read_text(encoding="utf-8"))
+                    except (OSError, json.JSONDecodeError) as e:
+                        # artifact를 읽을 수 없으면 해당 단계는 다시 진행
+                        logger.warning(f"artifact를 읽을 수 없어 {stage} 단계를 다시 진행합니다 ({paper_id}): {e}")
+                        entry["stage"] = STAGE_DOWNLOADED if stage == STAGE_REVIEWED else STAGE_REVIEWED
+                        continue
+                    if "review_result" in artifact:
+                        entry["review_result"] = artifact["review_result"]
+                    if "ai_response" in artifact:
+                        entry["ai_response"] = _decode_ai_response(artifact["ai_response"])
+        return entries
+
+    def close(self, completed: bool = False) -> None:
+        """
+        저널 닫기
+
+        Args:
+            completed: 실행이 끝까지 진행되었으면 True (저널과 artifact 삭제)
+        """
+        with self._lock:
+            if completed:
+                # 잠금을 가진 채로 삭제하여 다른 실행이 삭제 중인 저널을 재개하지 않도록
+                self.path.unlink(missing_ok=True)
+                shutil.rmtree(self.artifacts_dir, ignore_errors=True)
+                logger.info(f"실행 완료, 저널 삭제: {self.run_id}")
+            self._file.close()
+
+
+_active_journal: Optional[PaperJournal] = None
+
+
+def get_active_journal() -> Optional[PaperJournal]:
+    """
+    현재 실행의 저널
+
+    Returns:
+        PaperJournal 인스턴스 또는 None (비활성화 또는 실행 중이 아닐 때)
+    """
+    return _active_journal
+
+
+def remove_stale_journals(journal_dir: Path, max_age_days: float) -> int:
+    """
+    오래된 끝나지 않은 저널 삭제 (다른 실행이 사용 중인 저널은 잠겨 있으므로 건너뜀)
+
+    Args:
+        journal_dir: 저널 디렉토리
+        max_age_days: 마지막 기록 이후 이 기간(일)이 지난 저널만 삭제 (0 이하이면 삭제하지 않음)
+
+    Returns:
+        삭제한 저널 수
+    """
+    if max_age_days <= 0:
+        return 0
+
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in journal_dir.glob("*.jsonl"):
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            with open(path, "a", encoding="utf-8") as f:
+                if not _try_lock(f):
+                    continue
+                path.unlink(missing_ok=True)
+                shutil.rmtree(journal_dir / path.stem, ignore_errors=True)
+        except OSError as e:
+            logger.warning(f"오래된 저널 삭제 실패 ({path.name}): {e}")
+            continue
+        removed += 1
+        logger.warning(f"{max_age_days:g}일 넘게 재개하지 않은 실행 저널 삭제: {path.stem}")
+    return removed
+
+
+def open_journal(mode: str, resume: bool = False) -> Optional[PaperJournal]:
+    """
+    실행 저널 시작
+
+    resume이면 같은 모드의 끝나지 않은 저널 중 다른 실행이 사용하고 있지 않은 마지막 저널을 이어서 쓰고
+    기록된 상태를 `resumed`에 복원. 재개하지 않는 저널은 남겨 두고 PAPER_JOURNAL_MAX_AGE_DAYS가 지나면 삭제
+
+    Args:
+        mode: 처리 모드 (latest, scheduled)
+        resume: 끝나지 않은 실행을 이어서 처리할지 여부
+
+    Returns:
+        PaperJournal 인스턴스 또는 None (비활성화 또는 초기화 실패 시)
+    """
+    global _active_journal
+
+    if not PAPER_JOURNAL_ENABLED:
+        return None
+
+    try:
+        journal_dir = Path(PAPER_JOURNAL_DIR)
+        journal_dir.mkdir(parents=True, exist_ok=True)
+
+        remove_stale_journals(journal_dir, PAPER_JOURNAL_MAX_AGE_DAYS)
+
+        # 끝나지 않은 저널 (파일 이름: {모드}-{시각}-{난수}.jsonl, 이름순 = 시작순)
+        unfinished = sorted(journal_dir.glob(f"{mode}-*.jsonl"))
+        journal = None
+        if resume:
+            for path in reversed(unfinished):
+                try:
+                    journal = PaperJournal(PAPER_JOURNAL_DIR, path.stem, mode)
+                except (JournalLockedError, FileNotFoundError):
+                    logger.info(f"다른 실행이 사용 중인 저널 건너뜀: {path.stem}")
+                    continue
+                journal.resumed = journal.replay()
+                done = sum(1 for entry in journal.resumed.values() if entry["stage"] in TERMINAL_STAGES)
+                logger.info(f"실행 재개: {journal.run_id} (논문 {len(journal.resumed)}개, 끝난 논문 {done}개)")
+                print(f"이전 실행 재개: 논문 {len(journal.resumed)}개 중 {done}개 완료됨")
+                break
+        elif unfinished:
+            logger.info(f"끝나지 않은 이전 실행 저널 {len(unfinished)}개 (--resume으로 이어서 처리 가능)")
+
+        if journal is None:
+            if resume:
+                logger.info("재개할 실행이 없어 새로 시작")
+                print("재개할 실행이 없어 새로 시작합니다.")
+            run_id = f"{mode}-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+            journal = PaperJournal(PAPER_JOURNAL_DIR, run_id, mode)
+            logger.info(f"실행 저널 시작: {run_id}")
+    except Exception as e:
+        logger.error(f"실행 저널 초기화 실패, 저널 없이 진행: {e}", exc_info=True)
+        return None
+
+    _active_journal = journal
+    return journal
+
+
+def close_journal(journal: Optional[PaperJournal], completed: bool) -> None:
+    """
+    실행 저널 종료
+
+    Args:
+        journal: open_journal이 반환한 저널 (None 가능)
+        completed: 실행이 끝까지 진행되었는지 여부 (True이면 저널 삭제)
+    """
+    global _active_journal
+
+    if journal is None:
+        return
+    journal.close(completed)
+    if _active_journal is journal:
+        _active_journal = None
@@ -2,27 +2,234 @@
 논문 리뷰 처리 모듈
 """
 
+import asyncio
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from reviewer import Reviewer
-from pdf_handler import extract_text_from_pdf
-from config import REVIEWER_MODEL, REVIEWER_REFLECTION
-from logger import setup_logger
+from reviewer import BatchReviewRunner, Reviewer
+from review_store import ReviewStore, get_review_store, paper_key_from_id, paper_key_from_text
+from pdf_handler import extract_pdf_text_async
+from pdf_buffer import PdfBuffer
+from config import (
+    REVIEWER_MODEL,
+    REVIEWER_REFLECTION,
+    REVIEWER_PROMPT_LAYOUT,
+    REVIEWER_OUTPUT_MODE,
+    REVIEWER_CONTEXT_TOKENS,
+    REVIEWER_OUTPUT_TOKENS,
+    REVIEWER_PAPER_MAX_TOKENS,
+    REVIEWER_SECTION_VIEW,
+    REVIEWER_MODE,
+    REVIEWER_ENSEMBLE_SIZE,
+    MAX_PDF_TEXT_LENGTH,
+    TRIAGE_MODEL,
+    TRIAGE_REJECT_BELOW,
+    REVIEW_BATCH_DIR,
+    REVIEW_BATCH_POLL_INTERVAL
+)
+from logger import setup_logger, current_paper, log_cost, log_section, print_progress
 
 logger = setup_logger("reviewer")
 
+# MAX_PDF_TEXT_LENGTH=0일 때 추출 문자 수 상한 계산용 토큰당 문자 수
+# (영문 논문은 보통 토큰당 4~5자이므로 넉넉히 추출한 뒤 토큰 예산으로 정확히 자름)
+EXTRACT_CHARS_PER_TOKEN = 6
 
-async def review_paper(pdf_content: bytes, reviewer: Reviewer) -> Optional[Dict]:
+
+class ReviewError(Exception):
+    """리뷰를 끝내지 못한 경우 (텍스트 추출 실패, 빈 리뷰, API 오류 등 - 부적절 판단과 달리 다음 실행에서 다시 리뷰)"""
+
+
+def is_review_appropriate(review_result: Dict) -> bool:
+    """
+    리뷰 결과로 논문이 적절한지 판단
+    
+    Args:
+        review_result: 최종 리뷰 딕셔너리
+    
+    Returns:
+        적절한 논문이면 True
+    """
+    is_appropriate = False  # 기본값을 False로 변경
+    
+    # 1. recommendation 필드 체크 (최우선)
+    if 'recommendation' in review_result:
+        recommendation = review_result.get('recommendation', '').lower()
+        logger.info(f"Recommendation: {review_result.get('recommendation')}")
+        
+        # Accept 계열이면 적절
+        if 'accept' in recommendation:
+            is_appropriate = True
+        # Reject 계열이면 부적절
+        elif 'reject' in recommendation:
+            is_appropriate = False
+        else:
+            logger.warning(f"알 수 없는 recommendation 값: {recommendation}")
+    
+    # 2. overall_score 필드 체크
+    if 'overall_score' in review_result:
+        overall_score = review_result.get('overall_score', 0)
+        logger.info(f"Overall Score: {overall_score}/10")
+        
+        # recommendation이 없었다면 overall_score로 판단
+        if 'recommendation' not in review_result:
+            is_appropriate = overall_score >= 5
+    
+    # 3. rating 필드 체크 (하위 호환성)
+    if 'rating' in review_result:
+        rating = review_result.get('rating', 0)
+        logger.info(f"Rating: {rating}/10")
+        
+        # recommendation과 overall_score 둘 다 없었다면 rating으로 판단
+        if 'recommendation' not in review_result and 'overall_score' not in review_result:
+            is_appropriate = rating >= 5
+    
+    return is_appropriate
+
+
+def _finish_review(review_result: Dict, start_time: float, label: str = "  → 논문 적절성 판단") -> Optional[Dict]:
+    """리뷰 결과로 적절성을 판단하고 label 뒤에 결과 출력 (적절하면 리뷰, 아니면 None 반환)"""
+    logger.debug(f"리뷰 결과: {review_result}")
+    
+    is_appropriate = is_review_appropriate(review_result)
+    
+    # 판단 결과 로깅
+    logger.info(f"적절성 판단: {'적절' if is_appropriate else '부적절'}")
+    
+    if 'content' in review_result:
+        logger.info(f"리뷰 내용 (처음 300자): {review_result['content'][:300]}...")
+    
+    elapsed = time.time() - start_time
+    logger.info(f"Reviewer 총 소요 시간: {elapsed:.2f}초")
+    
+    if is_appropriate:
+        print_progress(f"{label}: 성공 (적절한 논문)")
+        logger.info("✓ 적절한 논문으로 판단됨")
+        return review_result
+    else:
+        print_progress(f"{label}: 부적절 (recommendation: {review_result.get('recommendation', 'N/A')}, score: {review_result.get('overall_score', review_result.get('rating', 'N/A'))})")
+        logger.info(f"✗ 부적절한 논문으로 판단됨")
+        return None
+
+
+def _review_rounds(reviewer: Reviewer) -> int:
+    """논문이 들어간 대화의 리플렉션 라운드 수 (ensemble 방식이면 0, 토큰 예산과 리뷰 저장소 키에 사용)"""
+    return reviewer.review_rounds(REVIEWER_REFLECTION)
+
+
+def _load_stored_review(store: Optional[ReviewStore], paper_key: Optional[str], reviewer: Reviewer) -> Optional[Dict]:
+    """저장소에서 이전 리뷰 조회 (실패해도 리뷰는 계속 진행)"""
+    if store is None or paper_key is None:
+        return None
+    try:
+        return store.get(paper_key, reviewer.model, reviewer.prompt_version, _review_rounds(reviewer))
+    except Exception as e:
+        logger.warning(f"리뷰 저장소 조회 실패: {e}")
+        return None
+
+
+async def _prepare_review(
+    pdf_content: PdfBuffer,
+    reviewer: Reviewer,
+    paper_id: Optional[str]
+) -> Tuple[Optional[Dict], Optional[str], List[str]]:
+    """
+    리뷰 준비: 저장된 리뷰 조회와 PDF 텍스트 추출
+    
+    Returns:
+        (저장된 리뷰, 논문 텍스트, 리뷰 저장소 키 목록) - 저장된 리뷰가 있으면 텍스트는 None
+    """
+    # 저장된 리뷰가 있으면 텍스트 추출 없이 바로 판단
+    store = get_review_store()
+    id_key = paper_key_from_id(paper_id)
+    stored_review = await asyncio.to_thread(_load_stored_review, store, id_key, reviewer)
+    if stored_review:
+        logger.info(f"저장된 리뷰 사용: {id_key} (모델: {reviewer.model}, 프롬프트 버전: {reviewer.prompt_version})")
+        return stored_review, None, [id_key]
+    
+    # PDF에서 텍스트 추출 (프로세스 풀에서 실행)
+    logger.debug(f"PDF 크기: {len(pdf_content)} bytes")
+    extract_start = time.time()
+    max_length = MAX_PDF_TEXT_LENGTH
+    if max_length <= 0:
+        max_length = reviewer.paper_token_limit(_review_rounds(reviewer)) * EXTRACT_CHARS_PER_TOKEN
+    extraction = await extract_pdf_text_async(pdf_content, max_length)
+    extract_time = time.time() - extract_start
+    paper_text = extraction["text"]
+    
+    if not paper_text:
+        logger.warning("PDF 텍스트 추출 실패")
+        print_progress("    ⚠ 텍스트 추출 실패, 리뷰 건너뜀")
+        return None, None, []
+    
+    logger.info(f"PDF 텍스트 추출 완료: {len(paper_text)} 문자 (백엔드: {extraction['backend']}, 소요 시간: {extract_time:.2f}초)")
+    logger.info(
+        f"추출 페이지: {extraction['pages_read']}/{extraction['total_pages']} "
+        f"(최대 길이 도달로 건너뛴 페이지: {extraction['pages_skipped']})"
+    )
+    logger.debug(f"텍스트 미리보기: {paper_text[:200]}...")
+    
+    # ID가 없거나 ID로 저장된 리뷰가 없으면 텍스트 해시로 한 번 더 조회
+    text_key = paper_key_from_text(paper_text)
+    stored_review = await asyncio.to_thread(_load_stored_review, store, text_key, reviewer)
+    if stored_review:
+        logger.info(f"저장된 리뷰 사용: {text_key} (모델: {reviewer.model}, 프롬프트 버전: {reviewer.prompt_version})")
+        return stored_review, None, [text_key]
+    
+    # 리뷰용 섹션 텍스트로 줄이고 고정 프롬프트와 리플렉션 대화를 뺀 토큰 예산에 맞춤
+    review_text = await asyncio.to_thread(reviewer.prepare_paper, paper_text, _review_rounds(reviewer))
+    if review_text is not paper_text:
+        logger.info(
+            f"리뷰 입력 텍스트: {len(paper_text)} → {len(review_text)} 문자 "
+            f"(섹션 텍스트: {reviewer.section_view}, 토큰 예산: {reviewer.paper_token_limit(_review_rounds(reviewer))}, "
+            f"정확한 계산: {reviewer.token_budget.exact})"
+        )
+    
+    return None, review_text, [key for key in (id_key, text_key) if key]
+
+
+async def _save_review(reviewer: Reviewer, paper_keys: List[str], review_result: Dict) -> None:
+    """다음 실행/재시도에서 재사용하도록 리뷰 저장 (실패해도 계속 진행)"""
+    store = get_review_store()
+    if store is None:
+        return
+    try:
+        for paper_key in paper_keys:
+            await asyncio.to_thread(
+                store.put, paper_key, reviewer.model, reviewer.prompt_version, _review_rounds(reviewer), review_result
+            )
+    except Exception as e:
+        logger.warning(f"리뷰 저장 실패: {e}")
+
+
+def _log_session_cost(reviewer: Reviewer, session) -> None:
+    """리뷰 세션의 토큰 사용량 로깅"""
+    log_cost(
+        logger,
+        reviewer.model,
+        session.usage["prompt_tokens"],
+        session.usage["completion_tokens"],
+        session.usage["cached_tokens"]
+    )
+
+
+async def review_paper(pdf_content: PdfBuffer, reviewer: Reviewer, paper_id: Optional[str] = None) -> Optional[Dict]:
     """
     Reviewer를 사용하여 논문이 적절한지 판단
     
+    같은 논문(버전 포함 arXiv ID 또는 추출 텍스트), 모델, 프롬프트 버전, 리플렉션 횟수로
+    이미 리뷰한 결과가 저장소에 있으면 OpenAI를 호출하지 않고 재사용
+    
     Args:
-        pdf_content: PDF 파일의 바이너리 데이터
+        pdf_content: PDF 버퍼
         reviewer: Reviewer 인스턴스
+        paper_id: arXiv 논문 ID (버전 포함, 리뷰 저장소 키)
     
     Returns:
         리뷰 결과 (적절한 논문이면 리뷰 데이터, 아니면 None)
+    
+    Raises:
+        ReviewError: 리뷰를 끝내지 못한 경우 (부적절 판단과 구분)
     """
     start_time = time.time()
     logger.info("=" * 80)
@@ -30,102 +237,171 @@ async def review_paper(pdf_content: bytes, reviewer: Reviewer) -> Optional[Dict]
     logger.info("=" * 80)
     
     try:
-        # PDF에서 텍스트 추출
-        logger.debug(f"PDF 크기: {len(pdf_content)} bytes")
-        paper_text = extract_text_from_pdf(pdf_content)
-        
+        stored_review, paper_text, paper_keys = await _prepare_review(pdf_content, reviewer, paper_id)
+        if stored_review:
+            return _finish_review(stored_review, start_time, "  → 저장된 리뷰로 논문 적절성 판단")
         if not paper_text:
-            logger.warning("PDF 텍스트 추출 실패")
-            print("    ⚠ 텍스트 추출 실패, 리뷰 건너뜀")
-            return None
-        
-        logger.info(f"PDF 텍스트 추출 완료: {len(paper_text)} 문자")
-        logger.debug(f"텍스트 미리보기: {paper_text[:200]}...")
+            raise ReviewError("PDF 텍스트 추출 실패")
         
         # Reviewer로 논문 리뷰
-        print("  → Reviewer로 논문 적절성 판단 중...", end=" ", flush=True)
-        logger.info(f"OpenAI API 호출 시작 (Model: {REVIEWER_MODEL}, Reflection: {REVIEWER_REFLECTION})")
+        print_progress("  → Reviewer로 논문 적절성 판단 중...")
+        logger.info(
+            f"OpenAI API 호출 시작 (Model: {REVIEWER_MODEL}, Mode: {reviewer.review_mode}, "
+            f"Reflection: {REVIEWER_REFLECTION}, Ensemble: {reviewer.ensemble_size})"
+        )
         
         review_start = time.time()
-        reviews = await reviewer.review(paper_text, reflection=REVIEWER_REFLECTION)
+        session = await reviewer.run_review(paper_text, reflection=REVIEWER_REFLECTION)
         review_time = time.time() - review_start
         
-        logger.info(f"OpenAI API 호출 완료 (소요 시간: {review_time:.2f}초)")
+        logger.info(f"OpenAI API 호출 완료 (소요 시간: {review_time:.2f}초, 리뷰 {len(session.reviews)}개)")
         
-        # 토큰 사용량 로깅 (Reviewer 객체에서 가져올 수 있다면)
-        if hasattr(reviewer, 'last_usage'):
-            usage = reviewer.last_usage
-            from logger import log_cost
-            log_cost(logger, REVIEWER_MODEL, usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+        # 이 논문의 리뷰에 사용된 토큰 사용량 로깅
+        _log_session_cost(reviewer, session)
         
-        if not reviews or len(reviews) == 0:
+        review_result = session.final_review
+        if not review_result:
             logger.warning("리뷰 결과가 비어있음")
-            print("실패 (리뷰 없음)")
-            return None
-        
-        # 첫 번째 리뷰 결과 확인
-        review_result = reviews[0]
-        logger.debug(f"리뷰 결과: {review_result}")
-        
-        # 논문이 적절한지 판단
-        is_appropriate = False  # 기본값을 False로 변경
+            print_progress("  → 논문 적절성 판단: 실패 (리뷰 없음)")
+            raise ReviewError("리뷰 결과가 비어있음")
         
-        # 1. recommendation 필드 체크 (최우선)
-        if 'recommendation' in review_result:
-            recommendation = review_result.get('recommendation', '').lower()
-            logger.info(f"Recommendation: {review_result.get('recommendation')}")
-            
-            # Accept 계열이면 적절
-            if 'accept' in recommendation:
-                is_appropriate = True
-            # Reject 계열이면 부적절
-            elif 'reject' in recommendation:
-                is_appropriate = False
-            else:
-                logger.warning(f"알 수 없는 recommendation 값: {recommendation}")
-        
-        # 2. overall_score 필드 체크
-        if 'overall_score' in review_result:
-            overall_score = review_result.get('overall_score', 0)
-            logger.info(f"Overall Score: {overall_score}/10")
-            
-            # recommendation이 없었다면 overall_score로 판단
-            if 'recommendation' not in review_result:
-                is_appropriate = overall_score >= 5
+        # 다음 실행/재시도에서 재사용하도록 저장 (ID 키와 텍스트 키 모두)
+        await _save_review(reviewer, paper_keys, review_result)
         
-        # 3. rating 필드 체크 (하위 호환성)
-        if 'rating' in review_result:
-            rating = review_result.get('rating', 0)
-            logger.info(f"Rating: {rating}/10")
+        # 최종 리뷰 결과 확인 (리플렉션까지 반영된 마지막 리뷰)
+        return _finish_review(review_result, start_time)
             
-            # recommendation과 overall_score 둘 다 없었다면 rating으로 판단
-            if 'recommendation' not in review_result and 'overall_score' not in review_result:
-                is_appropriate = rating >= 5
-        
-        # 판단 결과 로깅
-        logger.info(f"적절성 판단: {'적절' if is_appropriate else '부적절'}")
+    except ReviewError:
+        raise
+    except Exception as e:
+        elapsed = time.time() - start_time
+        logger.error(f"Reviewer 오류 발생: {str(e)}", exc_info=True)
+        logger.error(f"소요 시간: {elapsed:.2f}초")
+        print_progress(f"  → 논문 적절성 판단: 실패 (오류: {str(e)[:100]})")
+        raise ReviewError(str(e)) from e
+
+
+async def review_papers_batch(
+    papers: List[Tuple[PdfBuffer, Optional[str]]],
+    reviewer: Reviewer
+) -> List[Union[Dict, ReviewError, None]]:
+    """
+    여러 논문을 OpenAI Batch API로 한 번에 리뷰하여 적절성 판단 (응답 지연 대신 비용 절감)
+    
+    저장된 리뷰가 있는 논문은 배치에서 제외하며, 배치 상태는 REVIEW_BATCH_DIR에 저장되어
+    재시작 시 같은 논문 목록이면 이미 제출한 배치를 이어서 기다림
+    
+    Args:
+        papers: (PDF 버퍼, arXiv 논문 ID) 리스트
+        reviewer: Reviewer 인스턴스
+    
+    Returns:
+        논문 순서대로 리뷰 결과 (적절한 논문이면 리뷰 데이터, 부적절하면 None,
+        리뷰를 끝내지 못한 논문은 ReviewError)
+    """
+    start_time = time.time()
+    log_section(logger, f"Reviewer: 배치 리뷰 시작 ({len(papers)}개)")
+    
+    async def prepare(pdf_content: PdfBuffer, paper_id: Optional[str]):
+        # 논문마다 별도 Task에서 실행되므로 이 논문의 로그/출력에만 식별자 표시
+        current_paper.set(paper_id or "?")
+        try:
+            return await _prepare_review(pdf_content, reviewer, paper_id)
+        except Exception as e:
+            logger.error(f"리뷰 준비 중 오류 ({paper_id}): {str(e)}", exc_info=True)
+            return None, None, []
+    
+    prepared = await asyncio.gather(*(prepare(pdf_content, paper_id) for pdf_content, paper_id in papers))
+    
+    # 배치 요청의 custom_id는 리뷰 저장소 키 중 첫 번째 (재시작해도 같은 값)
+    pending = {}
+    for stored_review, paper_text, paper_keys in prepared:
+        if not stored_review and paper_text:
+            pending.setdefault(paper_keys[0], paper_text)
+    
+    logger.info(f"저장된 리뷰 사용: {sum(1 for item in prepared if item[0])}개, 배치 리뷰 대상: {len(pending)}개")
+    
+    sessions = {}
+    if pending:
+        runner = BatchReviewRunner(reviewer, REVIEW_BATCH_DIR, REVIEW_BATCH_POLL_INTERVAL)
+        sessions = await runner.review_many(pending, reflection=REVIEWER_REFLECTION)
+    
+    results = []
+    for (_, paper_id), (stored_review, paper_text, paper_keys) in zip(papers, prepared):
+        # 여러 논문의 결과를 한 Task에서 출력하므로 논문 ID를 직접 표시
+        label = f"  → [{paper_id}] 논문 적절성 판단"
+        if stored_review:
+            results.append(_finish_review(stored_review, start_time, label))
+            continue
         
-        if 'content' in review_result:
-            logger.info(f"리뷰 내용 (처음 300자): {review_result['content'][:300]}...")
+        session = sessions.get(paper_keys[0]) if paper_keys else None
+        review_result = session.final_review if session else None
+        if not review_result:
+            logger.warning(f"리뷰 결과가 비어있음 ({paper_id})")
+            print_progress(f"{label}: 실패 (리뷰 없음)")
+            results.append(ReviewError("리뷰 결과가 비어있음" if paper_keys else "리뷰 준비 실패"))
+            continue
         
+        logger.info(f"배치 리뷰 결과: {paper_id}")
+        _log_session_cost(reviewer, session)
+        await _save_review(reviewer, paper_keys, review_result)
+        results.append(_finish_review(review_result, start_time, label))
+    
+    return results
+
+
+async def screen_paper(title: str, abstract: str, reviewer: Reviewer) -> bool:
+    """
+    제목과 초록으로 1차 판단 (명백히 부적절한 논문은 PDF 다운로드와 전체 리뷰 없이 제외)
+    
+    판단에 실패하면 전체 리뷰로 넘김
+    
+    Args:
+        title: 논문 제목
+        abstract: 논문 초록
+        reviewer: Reviewer 인스턴스
+    
+    Returns:
+        전체 리뷰로 진행할지 여부
+    """
+    if not abstract:
+        logger.info("초록 없음, 1차 판단 건너뜀")
+        return True
+    
+    start_time = time.time()
+    
+    try:
+        session = await reviewer.screen_abstract(title, abstract, model=TRIAGE_MODEL)
         elapsed = time.time() - start_time
-        logger.info(f"Reviewer 총 소요 시간: {elapsed:.2f}초")
+        log_cost(
+            logger,
+            TRIAGE_MODEL,
+            session.usage["prompt_tokens"],
+            session.usage["completion_tokens"],
+            session.usage["cached_tokens"]
+        )
         
-        if is_appropriate:
-            print("성공 (적절한 논문)")
-            logger.info("✓ 적절한 논문으로 판단됨")
-            return review_result
-        else:
-            print(f"부적절 (recommendation: {review_result.get('recommendation', 'N/A')}, score: {review_result.get('overall_score', review_result.get('rating', 'N/A'))})")
-            logger.info(f"✗ 부적절한 논문으로 판단됨")
-            return None
-            
+        screening = session.final_review
+        score = float(screening["score"]) if screening and screening.get("score") is not None else None
     except Exception as e:
-        elapsed = time.time() - start_time
-        logger.error(f"Reviewer 오류 발생: {str(e)}", exc_info=True)
-        logger.error(f"소요 시간: {elapsed:.2f}초")
-        print(f"실패 (오류: {str(e)[:100]})")
-        return None
+        logger.error(f"초록 1차 판단 오류, 전체 리뷰로 진행: {str(e)}", exc_info=True)
+        print_progress("  → 초록 1차 판단: 실패 (전체 리뷰로 진행)")
+        return True
+    
+    if score is None:
+        logger.warning(f"초록 1차 판단 결과 없음, 전체 리뷰로 진행 (소요 시간: {elapsed:.2f}초)")
+        print_progress("  → 초록 1차 판단: 실패 (전체 리뷰로 진행)")
+        return True
+    
+    logger.info(f"초록 1차 판단: {score}/10 (기준: {TRIAGE_REJECT_BELOW}, 소요 시간: {elapsed:.2f}초) - {screening.get('reason', '')}")
+    
+    if score < TRIAGE_REJECT_BELOW:
+        print_progress(f"  → 초록 1차 판단: 제외 (score: {score})")
+        logger.info("✗ 초록 1차 판단에서 제외됨")
+        return False
+    
+    print_progress(f"  → 초록 1차 판단: 통과 (score: {score})")
+    return True
 
 
 def initialize_reviewer() -> Optional[Reviewer]:
@@ -140,12 +416,30 @@ def initialize_reviewer() -> Optional[Reviewer]:
         logger.info("=" * 80)
         logger.info("Reviewer 초기화 시작")
         logger.info(f"Model: {REVIEWER_MODEL}")
-        logger.info(f"Reflection: {REVIEWER_REFLECTION}")
+        logger.info(f"Mode: {REVIEWER_MODE} (Reflection: {REVIEWER_REFLECTION}, Ensemble: {REVIEWER_ENSEMBLE_SIZE})")
+        logger.info(f"Prompt Layout: {REVIEWER_PROMPT_LAYOUT}")
+        logger.info(f"Output Mode: {REVIEWER_OUTPUT_MODE}")
+        logger.info(f"Section View: {REVIEWER_SECTION_VIEW}")
+        logger.info(f"Context Tokens: {REVIEWER_CONTEXT_TOKENS or '모델 기본값'}")
         logger.info("=" * 80)
         
-        reviewer = Reviewer(model=REVIEWER_MODEL)
+        reviewer = Reviewer(
+            model=REVIEWER_MODEL,
+            prompt_layout=REVIEWER_PROMPT_LAYOUT,
+            output_mode=REVIEWER_OUTPUT_MODE,
+            context_tokens=REVIEWER_CONTEXT_TOKENS,
+            output_tokens=REVIEWER_OUTPUT_TOKENS,
+            paper_max_tokens=REVIEWER_PAPER_MAX_TOKENS,
+            section_view=REVIEWER_SECTION_VIEW,
+            review_mode=REVIEWER_MODE,
+            ensemble_size=REVIEWER_ENSEMBLE_SIZE
+        )
         
         print("Reviewer 초기화 완료\n")
+        logger.info(
+            f"논문 입력 토큰 예산: {reviewer.paper_token_limit(_review_rounds(reviewer))} "
+            f"(컨텍스트 윈도우: {reviewer.token_budget.context_tokens}, 토크나이저: {'tiktoken' if reviewer.token_budget.exact else '문자 수 근사'})"
+        )
         logger.info("Reviewer 초기화 성공")
         return reviewer
     except Exception as e:
@@ -0,0 +1,156 @@
+"""
+PDF 텍스트 추출 백엔드 모듈
+
+각 백엔드는 PDF 스트림(또는 바이너리)을 받아 (전체 페이지 수, 페이지 텍스트 제너레이터)를
+반환하며, 페이지 텍스트는 실제로 소비될 때 한 페이지씩 추출됨 (소비가 끝날 때까지 스트림은
+열려 있어야 함).
+PyPDF2 외의 백엔드는 선택 의존성이므로 사용할 때만 import함
+"""
+
+import io
+from typing import BinaryIO, Callable, Dict, Iterator, List, Tuple, Union
+
+# (전체 페이지 수, 페이지 텍스트 제너레이터)
+PdfPages = Tuple[int, Iterator[str]]
+
+# seek 가능한 바이너리 스트림 또는 PDF 바이너리
+PdfSource = Union[BinaryIO, bytes]
+
+
+def _as_stream(pdf_source: PdfSource) -> BinaryIO:
+    return io.BytesIO(pdf_source) if isinstance(pdf_source, (bytes, bytearray, memoryview)) else pdf_source
+
+
+def _open_pypdf2(pdf_source: PdfSource) -> PdfPages:
+    """PyPDF2 백엔드 (기본값, 순수 Python)"""
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(_as_stream(pdf_source))
+
+    def iter_pages() -> Iterator[str]:
+        for page in pdf_reader.pages:
+            yield page.extract_text() or ""
+
+    return len(pdf_reader.pages), iter_pages()
+
+
+def _open_pypdf(pdf_source: PdfSource) -> PdfPages:
+    """pypdf 백엔드 (PyPDF2의 후속 프로젝트, 순수 Python)"""
+    import pypdf
+
+    pdf_reader = pypdf.PdfReader(_as_stream(pdf_source))
+
+    def iter_pages() -> Iterator[str]:
+        for page in pdf_reader.pages:
+            yield page.extract_text() or ""
+
+    return len(pdf_reader.pages), iter_pages()
+
+
+def _open_pdfminer(pdf_source: PdfSource) -> PdfPages:
+    """pdfminer.six 백엔드 (레이아웃 분석 기반, 느리지만 텍스트 순서가 정확한 편)"""
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    from pdfminer.pdfpage import PDFPage
+
+    pdf_stream = _as_stream(pdf_source)
+    total_pages = sum(1 for _ in PDFPage.get_pages(pdf_stream))
+
+    def iter_pages() -> Iterator[str]:
+        pdf_stream.seek(0)
+        for page_layout in extract_pages(pdf_stream):
+            yield "".join(
+                element.get_text() for element in page_layout if isinstance(element, LTTextContainer)
+            )
+
+    return total_pages, iter_pages()
+
+
+def _open_pypdfium2(pdf_source: PdfSource) -> PdfPages:
+    """pypdfium2 백엔드 (PDFium 네이티브 바인딩, 가장 빠름)"""
+    import pypdfium2
+
+    pdf_document = pypdfium2.PdfDocument(pdf_source)
+
+    def iter_pages() -> Iterator[str]:
+        try:
+            for page_index in range(len(pdf_document)):
+                page = pdf_document[page_index]
+                text_page = page.get_textpage()
+                try:
+                    yield text_page.get_text_range()
+                finally:
+                    text_page.close()
+                    page.close()
+        finally:
+            pdf_document.close()
+
+    return len(pdf_document), iter_pages()
+
+
+# 백엔드 이름 → 열기 함수
+PDF_BACKENDS: Dict[str, Callable[[PdfSource], PdfPages]] = {
+    "pypdf2": _open_pypdf2,
+    "pypdf": _open_pypdf,
+    "pdfminer": _open_pdfminer,
+    "pypdfium2": _open_pypdfium2,
+}
+
+# 백엔드 이름 → import 모듈 이름 (설치 여부 확인용)
+_BACKEND_MODULES = {
+    "pypdf2": "PyPDF2",
+    "pypdf": "pypdf",
+    "pdfminer": "pdfminer",
+    "pypdfium2": "pypdfium2",
+}
+
+
+def is_backend_available(backend: str) -> bool:
+    """
+    백엔드가 등록되어 있고 필요한 패키지가 설치되어 있는지 확인
+
+    Args:
+        backend: 백엔드 이름
+
+    Returns:
+        사용 가능 여부
+    """
+    if backend not in PDF_BACKENDS:
+        return False
+
+    try:
+        __import__(_BACKEND_MODULES[backend])
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends() -> List[str]:
+    """
+    설치되어 사용 가능한 백엔드 목록
+
+    Returns:
+        백엔드 이름 리스트
+    """
+    return [backend for backend in PDF_BACKENDS if is_backend_available(backend)]
+
+
+def open_pdf_pages(pdf_source: PdfSource, backend: str = "pypdf2") -> PdfPages:
+    """
+    지정한 백엔드로 PDF를 열어 페이지 텍스트를 지연 추출
+
+    Args:
+        pdf_source: seek 가능한 PDF 스트림 또는 PDF 바이너리
+        backend: 백엔드 이름 (PDF_BACKENDS의 키)
+
+    Returns:
+        (전체 페이지 수, 페이지 텍스트 제너레이터)
+
+    Raises:
+        ValueError: 알 수 없는 백엔드인 경우
+        ImportError: 백엔드 패키지가 설치되지 않은 경우
+    """
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"알 수 없는 PDF 백엔드: {backend} (사용 가능: {', '.join(PDF_BACKENDS)})")
+
+    return PDF_BACKENDS[backend](pdf_source)
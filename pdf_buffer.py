@@ -0,0 +1,180 @@
+"""
+PDF 데이터 버퍼 모듈
+
+다운로드한 PDF를 한 번만 저장하고 모든 소비자(텍스트 추출, AI 서버 업로드, 백엔드 업로드,
+캐시)가 복사 없이 읽도록 하는 버퍼. 작은 파일은 메모리(bytes)에, 큰 파일은 디스크 임시 파일에
+두며(spool), 디스크에 있는 경우 mmap/파일 스트림으로만 접근하여 힙에 올리지 않음
+"""
+
+import io
+import mmap
+import os
+import tempfile
+import weakref
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+# PDF 파일 시그니처
+PDF_MAGIC = b"%PDF-"
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class PdfBuffer:
+    """
+    PDF 바이너리 버퍼 (메모리 또는 디스크 파일)
+
+    - open(): 소비자마다 독립적인 읽기 스트림 (메모리면 BytesIO, 디스크면 새 파일 핸들)
+    - view(): 전체 내용을 복사 없이 보는 버퍼 (메모리면 memoryview, 디스크면 mmap)
+
+    프로세스 풀로 전달(pickle)될 때 디스크 버퍼는 경로만 전달되므로 데이터가 복사되지 않음
+    """
+
+    def __init__(self, data: Optional[bytes] = None, path: Optional[str] = None, owns_file: bool = False):
+        """
+        Args:
+            data: 메모리에 있는 PDF 데이터
+            path: 디스크에 있는 PDF 파일 경로 (data가 없을 때)
+            owns_file: close() 시 path 파일을 삭제할지 여부 (임시 파일인 경우)
+        """
+        if (data is None) == (path is None):
+            raise ValueError("data와 path 중 하나만 지정해야 합니다.")
+
+        self._data = data
+        self._path = path
+        self._size = len(data) if data is not None else os.path.getsize(path)
+        self._finalizer = weakref.finalize(self, _remove_file, path) if path and owns_file else None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PdfBuffer":
+        """메모리 데이터로 버퍼 생성"""
+        return cls(data=data)
+
+    @classmethod
+    def from_file(cls, path: str, owns_file: bool = False) -> "PdfBuffer":
+        """디스크 파일로 버퍼 생성"""
+        return cls(path=path, owns_file=owns_file)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __getstate__(self) -> dict:
+        # 임시 파일 소유권은 전달하지 않음 (원본 프로세스에서만 삭제)
+        return {"_data": self._data, "_path": self._path, "_size": self._size, "_finalizer": None}
+
+    @property
+    def on_disk(self) -> bool:
+        """디스크에 spool된 버퍼인지 여부"""
+        return self._path is not None
+
+    def open(self) -> BinaryIO:
+        """
+        읽기 전용 스트림 열기 (호출자가 닫아야 함)
+
+        Returns:
+            seek 가능한 바이너리 스트림
+        """
+        if self._data is not None:
+            # bytes로 초기화한 BytesIO는 쓰기 전까지 원본 버퍼를 공유 (복사 없음)
+            return io.BytesIO(self._data)
+        return open(self._path, "rb")
+
+    @contextmanager
+    def view(self) -> Iterator[Union[memoryview, mmap.mmap]]:
+        """
+        전체 내용을 복사 없이 보는 버퍼 (해시 계산, 파일 쓰기 등)
+
+        Yields:
+            memoryview 또는 mmap
+        """
+        if self._data is not None:
+            with memoryview(self._data) as data_view:
+                yield data_view
+            return
+
+        if self._size == 0:
+            yield memoryview(b"")
+            return
+
+        with open(self._path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+    def read_bytes(self) -> bytes:
+        """
+        전체 내용을 bytes로 반환 (디스크 버퍼는 복사가 발생하므로 꼭 필요한 경우에만 사용)
+        """
+        if self._data is not None:
+            return self._data
+        with open(self._path, "rb") as f:
+            return f.read()
+
+    def close(self) -> None:
+        """소유한 임시 파일 삭제"""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+class PdfBufferWriter:
+    """
+    청크 단위로 PDF를 받아 PdfBuffer를 만드는 writer
+
+    받은 크기가 spool_threshold를 넘는 순간 디스크 임시 파일로 전환하여
+    큰 PDF가 힙에 누적되지 않도록 함
+    """
+
+    def __init__(self, spool_threshold: int, spool_dir: Optional[str] = None):
+        """
+        Args:
+            spool_threshold: 디스크로 전환할 크기 (byte)
+            spool_dir: 임시 파일 디렉토리 (None이면 시스템 기본값)
+        """
+        self.spool_threshold = spool_threshold
+        self.spool_dir = spool_dir
+        self.size = 0
+        self._chunks: List[bytes] = []
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+
+    def write(self, chunk: bytes) -> None:
+        """청크 추가"""
+        self.size += len(chunk)
+
+        if self._file is None and self.size > self.spool_threshold:
+            fd, self._path = tempfile.mkstemp(prefix="crawler_pdf_", suffix=".pdf", dir=self.spool_dir)
+            self._file = os.fdopen(fd, "wb")
+            for buffered in self._chunks:
+                self._file.write(buffered)
+            self._chunks = []
+
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def finish(self) -> PdfBuffer:
+        """쓰기를 마치고 PdfBuffer 반환"""
+        if self._file is not None:
+            self._file.close()
+            path, self._file, self._path = self._path, None, None
+            return PdfBuffer.from_file(path, owns_file=True)
+
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return PdfBuffer.from_bytes(data)
+
+    def abort(self) -> None:
+        """쓰기를 중단하고 임시 파일 삭제"""
+        self._chunks = []
+        if self._file is not None:
+            self._file.close()
+            _remove_file(self._path)
+            self._file = None
+            self._path = None
@@ -0,0 +1,290 @@
+"""
+PDF 로컬 캐시 모듈
+
+arXiv ID + 버전을 키로 PDF를 저장하는 content-addressed 디스크 캐시.
+파일은 sha256 해시 이름으로 저장되어 저장 시 검증한 크기/수정 시각이 바뀌었을 때 무결성을 다시 검증하고,
+전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거(LRU).
+읽을 때는 캐시 파일의 하드 링크(지원하지 않으면 복사본)를 호출자에게 넘기므로
+LRU 제거로 캐시 파일이 삭제되어도 이미 받은 버퍼는 계속 읽을 수 있음
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from config import PDF_CACHE_ENABLED, PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES
+from logger import setup_logger
+from pdf_buffer import PdfBuffer
+
+logger = setup_logger("pdf_cache")
+
+
+# arXiv PDF URL에서 버전이 포함된 ID 추출 (예: /pdf/2401.12345v2.pdf, /pdf/cs/0112017v1)
+_ARXIV_PDF_ID_PATTERN = re.compile(r'/pdf/(.+?v\d+)(?:\.pdf)?$')
+
+
+def cache_key_from_url(pdf_url: str) -> Optional[str]:
+    """
+    arXiv PDF URL에서 캐시 키(arXiv ID + 버전) 추출
+
+    버전이 없는 URL은 내용이 바뀔 수 있으므로 캐시하지 않음
+
+    Args:
+        pdf_url: PDF 파일의 URL
+
+    Returns:
+        캐시 키 또는 None
+    """
+    match = _ARXIV_PDF_ID_PATTERN.search(pdf_url)
+    return match.group(1) if match else None
+
+
+class PdfCache:
+    """
+    content-addressed PDF 디스크 캐시 (LRU 제거)
+
+    - 파일: {cache_dir}/objects/{sha256[:2]}/{sha256}.pdf
+    - 인덱스: {cache_dir}/index.sqlite3 (키 → sha256, 크기, 검증한 수정 시각, 마지막 사용 시각)
+    - 호출자에게 넘긴 링크: {cache_dir}/checkout/ (버퍼를 닫으면 삭제)
+
+    인덱스는 SQLite(WAL)를 사용하므로 여러 스레드/프로세스(main과 scheduled_crawl 동시 실행)에서
+    같은 캐시를 공유할 수 있음
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 캐시 최대 크기 (byte)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.checkout_dir = self.cache_dir / "checkout"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.checkout_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_checkouts()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_sha256 ON entries (sha256)")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if "mtime_ns" not in columns:
+                # 이전 버전 캐시: 검증한 수정 시각이 없으므로 다음 읽기에서 한 번 검증
+                conn.execute("ALTER TABLE entries ADD COLUMN mtime_ns INTEGER")
+
+    def _remove_stale_checkouts(self, max_age: float = 86400.0) -> None:
+        """비정상 종료로 남은 오래된 링크 삭제 (다른 프로세스가 사용 중일 수 있는 최근 링크는 유지)"""
+        cutoff = time.time() - max_age
+        for path in self.checkout_dir.glob("*.pdf"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """인덱스 DB 연결 (블록이 끝나면 커밋 후 닫음)"""
+        conn = sqlite3.connect(self.cache_dir / "index.sqlite3", timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.pdf"
+
+    def _checkout(self, object_path: Path) -> Path:
+        """
+        캐시 파일을 호출자 전용 경로로 링크 (하드 링크를 지원하지 않는 파일 시스템이면 복사)
+
+        Raises:
+            FileNotFoundError: 캐시 파일이 없는 경우
+        """
+        checkout_path = self.checkout_dir / f"{object_path.stem}-{uuid.uuid4().hex[:12]}.pdf"
+        try:
+            os.link(object_path, checkout_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(object_path, checkout_path)
+        return checkout_path
+
+    def get(self, key: str) -> Optional[PdfBuffer]:
+        """
+        캐시에서 PDF 읽기
+
+        저장 시 기록한 크기/수정 시각과 다를 때만 sha256을 다시 검증하고, 검증 실패 시 항목 삭제 후 None
+
+        Args:
+            key: 캐시 키 (arXiv ID + 버전)
+
+        Returns:
+            호출자가 소유하는 PDF 버퍼 (캐시 파일의 링크, close() 시 삭제) 또는 None
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT sha256, size, mtime_ns FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            sha256, size, mtime_ns = row
+            object_path = self._object_path(sha256)
+            try:
+                checkout_path = self._checkout(object_path)
+            except FileNotFoundError:
+                logger.warning(f"캐시 항목 누락, 삭제: {key}")
+                self._remove_entry(conn, key, sha256)
+                return None
+
+            pdf = PdfBuffer.from_file(str(checkout_path), owns_file=True)
+            stat = checkout_path.stat()
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                with pdf.view() as view:
+                    valid = hashlib.sha256(view).hexdigest() == sha256
+                if not valid:
+                    logger.warning(f"캐시 항목 손상, 삭제: {key}")
+                    pdf.close()
+                    self._remove_entry(conn, key, sha256)
+                    return None
+                mtime_ns = stat.st_mtime_ns
+
+            conn.execute("UPDATE entries SET last_access = ?, mtime_ns = ? WHERE key = ?", (time.time(), mtime_ns, key))
+            return pdf
+
+    def put(self, key: str, pdf: PdfBuffer) -> str:
+        """
+        PDF를 캐시에 저장하고 크기 상한을 넘으면 LRU 제거
+
+        Args:
+            key: 캐시 키 (arXiv ID + 버전)
+            pdf: PDF 버퍼
+
+        Returns:
+            저장된 PDF의 sha256
+        """
+        with pdf.view() as view:
+            sha256 = hashlib.sha256(view).hexdigest()
+        object_path = self._object_path(sha256)
+
+        with self._lock:
+            if object_path.exists():
+                # 같은 내용의 파일이 이미 있어도 손상되었으면 새로 씀
+                with PdfBuffer.from_file(str(object_path)).view() as view:
+                    if hashlib.sha256(view).hexdigest() != sha256:
+                        object_path.unlink()
+            if not object_path.exists():
+                # 임시 파일에 쓴 뒤 rename하여 중간에 중단되어도 깨진 파일이 남지 않도록 함
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=object_path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f, pdf.view() as view:
+                        f.write(view)
+                    os.replace(tmp_path, object_path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+
+            mtime_ns = object_path.stat().st_mtime_ns
+            with self._connect() as conn:
+                old = conn.execute("SELECT sha256 FROM entries WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, sha256, size, last_access, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                    (key, sha256, len(pdf), time.time(), mtime_ns)
+                )
+                if old and old[0] != sha256:
+                    self._delete_object_if_unreferenced(conn, old[0])
+                self._evict(conn)
+
+        return sha256
+
+    def total_bytes(self) -> int:
+        """캐시에 저장된 파일의 전체 크기 (byte, 중복 제거 기준)"""
+        with self._connect() as conn:
+            return self._total_bytes(conn)
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT sha256, size FROM entries)").fetchone()
+        return row[0]
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, sha256 in conn.execute("SELECT key, sha256 FROM entries ORDER BY last_access ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            total -= self._remove_entry(conn, key, sha256)
+            evicted += 1
+
+        logger.info(f"PDF 캐시 LRU 제거: {evicted}개 (현재 크기: {total / (1024 * 1024):.1f}MB)")
+
+    def _remove_entry(self, conn: sqlite3.Connection, key: str, sha256: str) -> int:
+        """항목 삭제 후 실제로 해제된 크기 반환"""
+        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        return self._delete_object_if_unreferenced(conn, sha256)
+
+    def _delete_object_if_unreferenced(self, conn: sqlite3.Connection, sha256: str) -> int:
+        """다른 키가 참조하지 않는 파일이면 삭제 후 크기 반환"""
+        if conn.execute("SELECT 1 FROM entries WHERE sha256 = ? LIMIT 1", (sha256,)).fetchone():
+            return 0
+
+        object_path = self._object_path(sha256)
+        try:
+            size = object_path.stat().st_size
+            object_path.unlink()
+            return size
+        except FileNotFoundError:
+            return 0
+
+
+_pdf_cache: Optional[PdfCache] = None
+_pdf_cache_lock = threading.Lock()
+
+
+def get_pdf_cache() -> Optional[PdfCache]:
+    """
+    공유 PDF 캐시 가져오기 (없으면 생성)
+
+    Returns:
+        PdfCache 인스턴스 또는 None (캐시 비활성화 또는 초기화 실패 시)
+    """
+    global _pdf_cache
+
+    if not PDF_CACHE_ENABLED:
+        return None
+
+    with _pdf_cache_lock:
+        if _pdf_cache is None:
+            try:
+                _pdf_cache = PdfCache(PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES)
+                logger.info(f"PDF 캐시 사용: {PDF_CACHE_DIR} (최대 {PDF_CACHE_MAX_BYTES / (1024 * 1024):.0f}MB)")
+            except Exception as e:
+                logger.error(f"PDF 캐시 초기화 실패, 캐시 없이 진행: {e}", exc_info=True)
+                return None
+        return _pdf_cache
@@ -2,60 +2,268 @@
 PDF 다운로드 및 텍스트 추출 모듈
 """
 
-import io
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from typing import Optional
 
-import PyPDF2
-import requests
+from config import (
+    PDF_DOWNLOAD_TIMEOUT,
+    MAX_PDF_TEXT_LENGTH,
+    PDF_EXTRACT_WORKERS,
+    PDF_TEXT_BACKEND,
+    PDF_MAX_DOWNLOAD_BYTES,
+    PDF_SPOOL_THRESHOLD_BYTES,
+    PDF_SPOOL_DIR
+)
+from http_client import get_http_client
+from logger import setup_logger, print_progress
+from models import PdfTextExtraction
+from pdf_buffer import PDF_MAGIC, PdfBuffer, PdfBufferWriter
+from pdf_cache import cache_key_from_url, get_pdf_cache
+from pdf_backends import is_backend_available, open_pdf_pages
+from rate_limiter import ARXIV_PDF, rate_limit
 
-from config import PDF_DOWNLOAD_TIMEOUT, MAX_PDF_TEXT_LENGTH
+logger = setup_logger("pdf_handler")
 
+# 설정된 백엔드를 사용할 수 없을 때 대체할 백엔드 (requirements.txt에 포함)
+DEFAULT_PDF_BACKEND = "pypdf2"
 
-def download_pdf(pdf_url: str) -> Optional[bytes]:
+# 스트리밍 다운로드 청크 크기 (byte)
+PDF_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 텍스트 추출용 프로세스 풀 (처음 사용할 때 생성)
+_extract_executor: Optional[ProcessPoolExecutor] = None
+_extract_executor_lock = threading.Lock()
+
+
+async def download_pdf(pdf_url: str) -> Optional[PdfBuffer]:
     """
-    PDF 파일을 다운로드하는 함수
+    PDF 파일을 스트리밍으로 다운로드하는 함수
+    
+    Content-Length와 PDF 시그니처를 먼저 확인하고, 최대 크기를 넘으면 중단하며,
+    PDF_SPOOL_THRESHOLD_BYTES보다 큰 파일은 메모리 대신 디스크 임시 파일에 저장
     
     Args:
         pdf_url: PDF 파일의 URL
     
     Returns:
-        PDF 파일의 바이너리 데이터 또는 None
+        PDF 버퍼 또는 None
     """
+    # 로컬 캐시 확인 (arXiv ID + 버전이 있는 URL만)
+    cache = get_pdf_cache()
+    cache_key = cache_key_from_url(pdf_url) if cache else None
+    if cache_key:
+        try:
+            cached = await asyncio.to_thread(cache.get, cache_key)
+            if cached:
+                logger.info(f"PDF 캐시 사용: {cache_key} ({len(cached)} bytes)")
+                return cached
+        except Exception as e:
+            logger.warning(f"PDF 캐시 읽기 실패, 다운로드 진행: {e}")
+    
+    writer = PdfBufferWriter(PDF_SPOOL_THRESHOLD_BYTES, PDF_SPOOL_DIR)
     try:
-        response = requests.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
-        return response.content
+        await rate_limit(ARXIV_PDF)
+        client = get_http_client()
+        async with client.stream("GET", pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            
+            content_length = response.headers.get("Content-Length")
+            if content_length and int(content_length) > PDF_MAX_DOWNLOAD_BYTES:
+                raise ValueError(f"PDF 크기 초과 (Content-Length: {content_length} bytes)")
+            
+            head = b""
+            async for chunk in response.aiter_bytes(chunk_size=PDF_DOWNLOAD_CHUNK_SIZE):
+                if not chunk:
+                    continue
+                
+                # 첫 바이트로 PDF 여부 확인 (HTML 오류 페이지 등은 바로 중단)
+                if len(head) < len(PDF_MAGIC):
+                    head += chunk[:len(PDF_MAGIC) - len(head)]
+                    if len(head) == len(PDF_MAGIC) and head != PDF_MAGIC:
+                        raise ValueError(f"PDF 형식이 아님 (시작 바이트: {head!r})")
+                
+                writer.write(chunk)
+                if writer.size > PDF_MAX_DOWNLOAD_BYTES:
+                    raise ValueError(f"PDF 크기 초과 ({writer.size} bytes 이상)")
+            
+            if head != PDF_MAGIC:
+                raise ValueError(f"PDF 형식이 아님 (크기: {writer.size} bytes)")
+        
+        pdf_content = writer.finish()
     except Exception as e:
-        print(f"PDF 다운로드 실패: {str(e)[:50]}")
+        writer.abort()
+        logger.error(f"PDF 다운로드 실패: {e}")
+        print_progress(f"    ⚠ PDF 다운로드 실패: {str(e)[:50]}")
         return None
+    
+    if pdf_content.on_disk:
+        logger.debug(f"PDF를 디스크에 저장 ({len(pdf_content)} bytes)")
+    
+    if cache_key:
+        try:
+            await asyncio.to_thread(cache.put, cache_key, pdf_content)
+        except Exception as e:
+            logger.warning(f"PDF 캐시 저장 실패: {e}")
+    
+    return pdf_content
 
 
-def extract_text_from_pdf(pdf_content: bytes) -> str:
+@lru_cache(maxsize=None)
+def resolve_pdf_backend(backend: str = PDF_TEXT_BACKEND) -> str:
     """
-    PDF 파일에서 텍스트를 추출하는 함수
+    사용할 PDF 텍스트 추출 백엔드 결정 (설치되지 않았으면 PyPDF2로 대체)
     
     Args:
-        pdf_content: PDF 파일의 바이너리 데이터
+        backend: 설정된 백엔드 이름
     
     Returns:
-        추출된 텍스트 또는 빈 문자열
+        실제로 사용할 백엔드 이름
+    """
+    if is_backend_available(backend):
+        return backend
+    
+    logger.warning(f"PDF 백엔드 '{backend}'를 사용할 수 없어 '{DEFAULT_PDF_BACKEND}'로 대체합니다.")
+    return DEFAULT_PDF_BACKEND
+
+
+def extract_pdf_text(
+    pdf_content: PdfBuffer,
+    max_length: int = MAX_PDF_TEXT_LENGTH,
+    backend: str = PDF_TEXT_BACKEND
+) -> PdfTextExtraction:
     """
+    PDF 파일에서 텍스트를 페이지 단위로 추출하고, 최대 길이에 도달하면 즉시 중단
+    
+    Args:
+        pdf_content: PDF 버퍼
+        max_length: 추출할 최대 문자 수 (0 이하이면 전체)
+        backend: 텍스트 추출 백엔드 이름 (pdf_backends.PDF_BACKENDS의 키)
+    
+    Returns:
+        추출 결과 (텍스트, 전체/추출/건너뛴 페이지 수)
+    """
+    backend = resolve_pdf_backend(backend)
+    
     try:
-        pdf_file = io.BytesIO(pdf_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        with pdf_content.open() as pdf_stream:
+            total_pages, pages = open_pdf_pages(pdf_stream, backend)
+            
+            parts = []
+            length = 0
+            pages_read = 0
+            try:
+                for page_text in pages:
+                    parts.append(page_text)
+                    parts.append("\n")
+                    length += len(page_text) + 1
+                    pages_read += 1
+                    
+                    # 최대 길이에 도달하면 남은 페이지는 추출하지 않음
+                    if max_length > 0 and length >= max_length:
+                        break
+            finally:
+                # 스트림을 닫기 전에 백엔드 리소스 정리
+                pages.close()
         
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        text = "".join(parts)
+        truncated = max_length > 0 and len(text) > max_length
+        if truncated:
+            text = text[:max_length]
         
-        # 텍스트가 너무 길면 앞부분만 사용 (토큰 제한 고려)
-        if len(text) > MAX_PDF_TEXT_LENGTH:
-            text = text[:MAX_PDF_TEXT_LENGTH]
-        
-        return text
+        return {
+            "text": text,
+            "backend": backend,
+            "total_pages": total_pages,
+            "pages_read": pages_read,
+            "pages_skipped": total_pages - pages_read,
+            "truncated": truncated or pages_read < total_pages
+        }
     except Exception as e:
         print(f"    ⚠ 경고: PDF 텍스트 추출 실패: {str(e)[:50]}")
-        return ""
+        return {"text": "", "backend": backend, "total_pages": 0, "pages_read": 0, "pages_skipped": 0, "truncated": False}
+
+
+def extract_text_from_pdf(pdf_content: PdfBuffer) -> str:
+    """
+    PDF 파일에서 텍스트를 추출하는 함수
+    
+    Args:
+        pdf_content: PDF 버퍼
+    
+    Returns:
+        추출된 텍스트 또는 빈 문자열
+    """
+    return extract_pdf_text(pdf_content)["text"]
+
+
+def get_extract_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    텍스트 추출용 프로세스 풀 가져오기 (없으면 생성)
+    
+    Returns:
+        ProcessPoolExecutor 또는 None (PDF_EXTRACT_WORKERS가 0 이하인 경우)
+    """
+    global _extract_executor
+    
+    if PDF_EXTRACT_WORKERS <= 0:
+        return None
+    
+    with _extract_executor_lock:
+        if _extract_executor is None:
+            # 스레드가 떠 있는 프로세스에서 fork하지 않도록 spawn 사용
+            _extract_executor = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"PDF 텍스트 추출 프로세스 풀 생성 (workers: {PDF_EXTRACT_WORKERS})")
+        return _extract_executor
+
+
+def shutdown_extract_executor() -> None:
+    """텍스트 추출용 프로세스 풀 종료"""
+    global _extract_executor
+    
+    with _extract_executor_lock:
+        if _extract_executor is not None:
+            _extract_executor.shutdown(wait=True, cancel_futures=True)
+            _extract_executor = None
+            logger.info("PDF 텍스트 추출 프로세스 풀 종료")
+
+
+async def extract_pdf_text_async(pdf_content: PdfBuffer, max_length: int = MAX_PDF_TEXT_LENGTH) -> PdfTextExtraction:
+    """
+    PDF 텍스트 추출을 프로세스 풀에서 실행 (이벤트 루프를 막지 않고 여러 코어 사용)
+    
+    디스크에 있는 버퍼는 경로만 워커 프로세스로 전달되므로 PDF 데이터가 복사되지 않음
+    
+    Args:
+        pdf_content: PDF 버퍼
+        max_length: 추출할 최대 문자 수 (0 이하이면 전체)
+    
+    Returns:
+        추출 결과 (텍스트, 전체/추출/건너뛴 페이지 수)
+    """
+    global _extract_executor
+    
+    executor = get_extract_executor()
+    if executor is None:
+        return await asyncio.to_thread(extract_pdf_text, pdf_content, max_length)
+    
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, extract_pdf_text, pdf_content, max_length)
+    except BrokenProcessPool:
+        # 워커 프로세스가 비정상 종료된 경우 풀을 버리고 이번 요청은 스레드에서 처리
+        logger.error("PDF 텍스트 추출 프로세스 풀 손상, 다음 요청 시 재생성", exc_info=True)
+        with _extract_executor_lock:
+            if _extract_executor is executor:
+                _extract_executor = None
+        return await asyncio.to_thread(extract_pdf_text, pdf_content, max_length)
 
 
 def load_thumbnail() -> Optional[bytes]:
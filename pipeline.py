@@ -0,0 +1,544 @@
+"""
+논문 처리 파이프라인 모듈
+
+단일 논문 처리 과정을 단계(초록 1차 판단 → PDF 다운로드 → 리뷰 → 요약 → 업로드)별 함수로 나누고,
+각 단계를 독립된 워커 풀과 bounded asyncio 큐로 연결한 단계별 파이프라인을 제공
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Callable, List, Optional, Union
+
+from arxiv_fetcher import transform_arxiv_to_paper_data
+from pdf_handler import download_pdf
+from paper_reviewer_handler import ReviewError, review_paper, review_papers_batch, screen_paper
+from ai_service import summarize_paper_with_ai
+from backend_service import fetch_user_activities, upload_paper_to_backend
+from models import PaperJob
+from paper_catalog import DECISION_ACCEPTED, DECISION_REJECTED, get_paper_catalog
+from paper_journal import (
+    STAGE_DOWNLOADED,
+    STAGE_REVIEWED,
+    STAGE_SUMMARIZED,
+    STAGE_UPLOADED,
+    STAGE_REJECTED,
+    get_active_journal
+)
+from config import (
+    TRIAGE_ENABLED,
+    PIPELINE_TRIAGE_WORKERS,
+    PIPELINE_DOWNLOAD_WORKERS,
+    PIPELINE_REVIEW_WORKERS,
+    PIPELINE_SUMMARIZE_WORKERS,
+    PIPELINE_UPLOAD_WORKERS,
+    PIPELINE_QUEUE_SIZE
+)
+from logger import setup_logger, current_paper, print_progress
+
+logger = setup_logger("pipeline")
+
+# 카탈로그 단계 이름 → 저널 단계
+_JOURNAL_STAGES = {
+    "download": STAGE_DOWNLOADED,
+    "review": STAGE_REVIEWED,
+    "summarize": STAGE_SUMMARIZED,
+    "upload": STAGE_UPLOADED,
+}
+
+
+def _progress_label(index: int, total: int) -> str:
+    """진행 표시 ("[3/10] (30.0%)", 전체 개수를 아직 모르면 "[3/?]")"""
+    if not total:
+        return f"[{index}/?]"
+    return f"[{index}/{total}] ({(index / total) * 100:.1f}%)"
+
+
+async def iterate_papers(papers: Union[List, AsyncIterator]) -> AsyncIterator:
+    """
+    논문 리스트 또는 논문의 비동기 이터레이터를 같은 방식으로 순회
+
+    Args:
+        papers: 논문 리스트 또는 비동기 이터레이터
+
+    Yields:
+        논문 (ArXiv Result 객체 또는 논문 데이터)
+    """
+    if isinstance(papers, list):
+        for paper in papers:
+            yield paper
+    else:
+        async for paper in papers:
+            yield paper
+
+
+def create_job(paper, index: int, total: int) -> PaperJob:
+    """
+    ArXiv 결과로부터 처리 작업 생성
+
+    재개한 실행의 저널에 있는 논문이면 마지막으로 끝낸 단계와 리뷰 결과/AI 응답을 채워 넣음
+
+    Args:
+        paper: ArXiv Result 객체 또는 논문 데이터 (저널에서 복원한 경우)
+        index: 현재 인덱스
+        total: 전체 개수 (0이면 아직 모름)
+
+    Returns:
+        논문 처리 작업
+    """
+    job: PaperJob = {
+        "index": index,
+        "total": total,
+        "start_time": time.time(),
+        "paper_data": paper if isinstance(paper, dict) else transform_arxiv_to_paper_data(paper)
+    }
+    bind_job_context(job)
+
+    journal = get_active_journal()
+    entry = journal.resumed.get(job["paper_data"]["paperId"]) if journal else None
+    if entry and entry["stage"] in (STAGE_DOWNLOADED, STAGE_REVIEWED, STAGE_SUMMARIZED):
+        job["resumed_stage"] = entry["stage"]
+        if "review_result" in entry:
+            job["review_result"] = entry["review_result"]
+        if "ai_response" in entry:
+            job["ai_response"] = entry["ai_response"]
+        logger.info(f"저널에서 재개: 마지막으로 끝낸 단계 {entry['stage']}")
+
+    paper_data = job["paper_data"]
+
+    # 진행률 계산
+    progress = _progress_label(index, total)
+
+    title_display = paper_data['title'][:50] + "..." if len(paper_data['title']) > 50 else paper_data['title']
+    print(f"{progress} 처리 중: \"{title_display}\"")
+
+    logger.info("=" * 80)
+    logger.info(f"논문 처리 시작 {progress}")
+    logger.info(f"Title: {paper_data['title']}")
+    logger.info(f"Paper ID: {paper_data.get('paperId', 'N/A')}")
+    logger.info("=" * 80)
+
+    return job
+
+
+def release_job(job: PaperJob) -> None:
+    """처리가 끝난 작업의 PDF 버퍼 해제 (디스크에 spool된 임시 파일 삭제)"""
+    pdf_content = job.get("pdf_content")
+    if pdf_content is not None:
+        pdf_content.close()
+
+
+def bind_job_context(job: PaperJob) -> None:
+    """
+    현재 Task에서 남기는 모든 로그에 논문 식별자 표시 (동시 처리 시 구분용)
+
+    Args:
+        job: 논문 처리 작업
+    """
+    current_paper.set(f"{job['index']}/{job['total'] or '?'} {job['paper_data']['paperId']}")
+
+
+async def record_stage(job: PaperJob, stage: str, decision: Optional[str] = None, uploaded: bool = False) -> None:
+    """
+    논문 카탈로그와 실행 저널에 끝낸 단계 기록 (기록 오류는 처리에 영향 없음)
+
+    Args:
+        job: 논문 처리 작업
+        stage: 끝낸 단계 이름
+        decision: 리뷰 판단 (accepted, rejected)
+        uploaded: 업로드 완료 여부
+    """
+    if decision == DECISION_REJECTED or uploaded:
+        job["finished"] = True
+
+    catalog = get_paper_catalog()
+    journal = get_active_journal()
+    paper_id = job["paper_data"]["paperId"]
+
+    def record() -> None:
+        if journal is not None:
+            journal_stage = STAGE_REJECTED if decision == DECISION_REJECTED else _JOURNAL_STAGES[stage]
+            journal.record(paper_id, journal_stage, job.get("review_result"), job.get("ai_response"))
+        if catalog is not None:
+            catalog.record(paper_id, stage, decision, uploaded)
+
+    if catalog is None and journal is None:
+        return
+    try:
+        await asyncio.to_thread(record)
+    except Exception as e:
+        logger.error(f"단계 기록 실패 ({stage}): {e}")
+
+
+async def stage_triage(job: PaperJob, reviewer) -> bool:
+    """
+    0단계: 초록으로 1차 판단 (TRIAGE_ENABLED이고 Reviewer가 있을 때만)
+
+    Args:
+        job: 논문 처리 작업
+        reviewer: Reviewer 인스턴스 또는 None
+
+    Returns:
+        다음 단계로 진행할지 여부 (명백히 부적절하면 False)
+    """
+    if not TRIAGE_ENABLED or not reviewer or job.get("resumed_stage"):
+        return True
+
+    paper_data = job["paper_data"]
+    if await screen_paper(paper_data['title'], paper_data.get('summary', ''), reviewer):
+        return True
+
+    print_progress("  ✗ 초록 1차 판단에서 제외, 건너뜀\n")
+    await record_stage(job, "triage", DECISION_REJECTED)
+    paper_elapsed = time.time() - job["start_time"]
+    logger.info(f"논문 처리 중단 (총 소요 시간: {paper_elapsed:.2f}초)")
+    return False
+
+
+async def stage_download(job: PaperJob) -> bool:
+    """
+    1단계: PDF 다운로드
+
+    Args:
+        job: 논문 처리 작업
+
+    Returns:
+        다음 단계로 진행할지 여부
+    """
+    paper_data = job["paper_data"]
+
+    if not paper_data.get('pdfUrl'):
+        logger.error("PDF URL 없음")
+        print_progress("  ✗ 실패 (PDF URL 없음)\n")
+        return False
+
+    logger.info("PDF 다운로드 시작")
+
+    download_start = time.time()
+    pdf_content = await download_pdf(paper_data['pdfUrl'])
+    download_time = time.time() - download_start
+
+    if not pdf_content:
+        logger.error(f"PDF 다운로드 실패 (소요 시간: {download_time:.2f}초)")
+        print_progress("  ✗ 실패 (PDF 다운로드 불가)\n")
+        return False
+
+    logger.info(f"PDF 다운로드 완료 (크기: {len(pdf_content)} bytes, 소요 시간: {download_time:.2f}초)")
+    print_progress("  → PDF 다운로드 성공")
+    job["pdf_content"] = pdf_content
+    await record_stage(job, "download")
+    return True
+
+
+async def stage_review(job: PaperJob, reviewer) -> bool:
+    """
+    2단계: Reviewer로 논문 적절성 판단
+
+    Args:
+        job: 논문 처리 작업
+        reviewer: Reviewer 인스턴스 또는 None
+
+    Returns:
+        다음 단계로 진행할지 여부 (적절한 논문이면 True)
+    """
+    if job.get("resumed_stage") in (STAGE_REVIEWED, STAGE_SUMMARIZED):
+        logger.info("저널의 리뷰 결과 사용 (리뷰 단계 건너뜀)")
+        print_progress("  → 이전 실행의 리뷰 결과 사용")
+        return True
+
+    if not reviewer:
+        logger.info("Reviewer 없음, 모든 논문 적절하다고 판단")
+        print_progress("  → Reviewer 없음, 모든 논문 적절하다고 판단")
+        job["review_result"] = None
+        return True
+
+    try:
+        review_result = await review_paper(job["pdf_content"], reviewer, job["paper_data"].get('paperId'))
+    except ReviewError as e:
+        # 일시적인 오류일 수 있으므로 부적절 판단으로 기록하지 않음 (다음 실행에서 다시 리뷰)
+        logger.warning(f"리뷰 실패, 다음 실행에서 다시 시도: {e}")
+        print_progress("  ✗ 실패 (리뷰 오류)\n")
+        return False
+
+    if not review_result:
+        logger.warning("부적절한 논문으로 판단되어 건너뜀")
+        print_progress("  ✗ 부적절한 논문, 건너뜀\n")
+        await record_stage(job, "review", DECISION_REJECTED)
+
+        paper_elapsed = time.time() - job["start_time"]
+        logger.info(f"논문 처리 중단 (총 소요 시간: {paper_elapsed:.2f}초)")
+        return False
+
+    job["review_result"] = review_result
+    await record_stage(job, "review", DECISION_ACCEPTED)
+    return True
+
+
+async def stage_summarize(job: PaperJob) -> bool:
+    """
+    3~4단계: UserActivity 요청 후 AI 서버로 논문 요약 요청 (적절한 논문만)
+
+    요약에 실패해도 AI 응답 없이 업로드를 진행하므로 항상 True 반환
+
+    Args:
+        job: 논문 처리 작업
+
+    Returns:
+        다음 단계로 진행할지 여부
+    """
+    if job.get("resumed_stage") == STAGE_SUMMARIZED:
+        logger.info("저널의 AI 응답 사용 (요약 단계 건너뜀)")
+        print_progress("  → 이전 실행의 AI 요약 사용")
+        return True
+
+    activities = await fetch_user_activities()
+
+    if activities:
+        print_progress("  → 사용자 활동 정보 요청 성공")
+    else:
+        print_progress("  → 사용자 활동 정보 요청 실패 (계속 진행)")
+        logger.warning("사용자 활동 정보 가져오기 실패, AI 요약 없이 진행")
+
+    ai_response = None
+    if activities:
+        ai_response = await summarize_paper_with_ai(
+            job["pdf_content"],
+            activities,
+            job["paper_data"].get('paperId', f'paper_{job["index"]}')
+        )
+    else:
+        logger.warning("사용자 활동 정보 없음, AI 요약 건너뜀")
+        print_progress("  ⚠ 경고: 사용자 활동 정보 없음, AI 요약 건너뜀")
+
+    job["ai_response"] = ai_response
+    if ai_response:
+        await record_stage(job, "summarize")
+    return True
+
+
+async def stage_upload(job: PaperJob) -> bool:
+    """
+    5단계: 백엔드 서버로 업로드
+
+    Args:
+        job: 논문 처리 작업
+
+    Returns:
+        성공 여부
+    """
+    success = await upload_paper_to_backend(
+        job["paper_data"],
+        job["pdf_content"],
+        job.get("ai_response")
+    )
+
+    paper_elapsed = time.time() - job["start_time"]
+
+    if success:
+        await record_stage(job, "upload", uploaded=True)
+        logger.info(f"논문 처리 완료 (총 소요 시간: {paper_elapsed:.2f}초)")
+        logger.info("✓ 성공")
+        print_progress("  ✓ 완료\n")
+        return True
+    else:
+        logger.error(f"논문 처리 실패 (총 소요 시간: {paper_elapsed:.2f}초)")
+        logger.error("✗ 실패")
+        print_progress("  ✗ 실패\n")
+        return False
+
+
+async def run_staged_pipeline(
+    papers: Union[List, AsyncIterator],
+    reviewer,
+    on_result: Callable[[Optional[PaperJob], bool], None]
+) -> None:
+    """
+    단계별 워커 풀과 bounded 큐로 연결된 파이프라인으로 논문 목록 처리
+
+    각 단계는 자신의 워커 수만큼만 동시에 실행되며, 다음 단계 큐가 가득 차면
+    put()에서 대기하므로 느린 단계(예: AI 서버)가 앞 단계를 자연스럽게 늦춤(backpressure)
+
+    Args:
+        papers: ArXiv Result 객체 리스트 또는 비동기 이터레이터 (페이지가 도착하는 대로 첫 단계 큐에 넣음)
+        reviewer: Reviewer 인스턴스 또는 None
+        on_result: 논문 하나의 처리가 끝날 때마다 (작업, 성공 여부)로 호출되는 콜백
+    """
+    total = len(papers) if isinstance(papers, list) else 0
+
+    async def triage(job: PaperJob) -> bool:
+        return await stage_triage(job, reviewer)
+
+    async def review(job: PaperJob) -> bool:
+        return await stage_review(job, reviewer)
+
+    # (단계 이름, 단계 함수, 워커 수) - 순서대로 큐로 연결됨
+    stages = [
+        ("triage", triage, PIPELINE_TRIAGE_WORKERS),
+        ("download", stage_download, PIPELINE_DOWNLOAD_WORKERS),
+        ("review", review, PIPELINE_REVIEW_WORKERS),
+        ("summarize", stage_summarize, PIPELINE_SUMMARIZE_WORKERS),
+        ("upload", stage_upload, PIPELINE_UPLOAD_WORKERS),
+    ]
+    queues = [asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE) for _ in stages]
+
+    logger.info(
+        "단계별 파이프라인 시작 - "
+        + ", ".join(f"{name}: {workers} workers" for name, _, workers in stages)
+        + f", 큐 크기: {PIPELINE_QUEUE_SIZE}"
+    )
+
+    async def worker(stage_index: int) -> None:
+        name, stage_func, _ = stages[stage_index]
+        in_queue = queues[stage_index]
+        out_queue = queues[stage_index + 1] if stage_index + 1 < len(stages) else None
+
+        while True:
+            job = await in_queue.get()
+            try:
+                bind_job_context(job)
+                try:
+                    proceed = await stage_func(job)
+                except Exception as e:
+                    paper_elapsed = time.time() - job["start_time"]
+                    logger.error(f"논문 처리 중 오류 발생 ({name} 단계, 소요 시간: {paper_elapsed:.2f}초)", exc_info=True)
+                    print_progress(f"  ✗ 실패 (오류: {str(e)[:100]})\n")
+                    proceed = False
+
+                if not proceed:
+                    release_job(job)
+                    on_result(job, False)
+                elif out_queue is None:
+                    release_job(job)
+                    on_result(job, True)
+                else:
+                    await out_queue.put(job)
+            finally:
+                in_queue.task_done()
+
+    workers = [
+        [asyncio.create_task(worker(stage_index)) for _ in range(max(1, worker_count))]
+        for stage_index, (_, _, worker_count) in enumerate(stages)
+    ]
+
+    async def produce() -> None:
+        # 별도 Task에서 실행하여 create_job의 로그 컨텍스트가 호출자에게 새지 않도록 함
+        index = 0
+        async for paper in iterate_papers(papers):
+            index += 1
+            try:
+                job = create_job(paper, index, total)
+            except Exception as e:
+                logger.error(f"논문 변환 중 오류 발생 [{index}/{total or '?'}]", exc_info=True)
+                print_progress(f"  ✗ 실패 (오류: {str(e)[:100]})\n")
+                on_result(None, False)
+                continue
+            # 첫 단계 큐가 가득 차면 대기
+            await queues[0].put(job)
+
+    try:
+        await asyncio.create_task(produce())
+
+        # 앞 단계부터 순서대로 비워지길 기다린 뒤 해당 단계 워커 종료
+        for queue, stage_workers in zip(queues, workers):
+            await queue.join()
+            for task in stage_workers:
+                task.cancel()
+    finally:
+        all_workers = [task for stage_workers in workers for task in stage_workers]
+        for task in all_workers:
+            task.cancel()
+        await asyncio.gather(*all_workers, return_exceptions=True)
+
+
+async def run_batch_pipeline(
+    papers: List,
+    reviewer,
+    on_result: Callable[[Optional[PaperJob], bool], None]
+) -> None:
+    """
+    리뷰를 OpenAI Batch API로 모아서 처리하는 파이프라인 (응답 지연 대신 비용 절감)
+
+    1) 모든 논문의 초록 1차 판단과 PDF 다운로드, 2) 남은 논문을 한 번의 배치 리뷰로 판단,
+    3) 적절한 논문만 요약 및 업로드 순서로 진행
+
+    Args:
+        papers: ArXiv Result 객체 리스트
+        reviewer: Reviewer 인스턴스 또는 None (없으면 모든 논문을 적절하다고 판단)
+        on_result: 논문 하나의 처리가 끝날 때마다 (작업, 성공 여부)로 호출되는 콜백
+    """
+    total = len(papers)
+
+    def fail(job: Optional[PaperJob]) -> None:
+        if job is not None:
+            release_job(job)
+        on_result(job, False)
+
+    # 1) 초록 1차 판단 + PDF 다운로드
+    download_semaphore = asyncio.Semaphore(max(1, PIPELINE_DOWNLOAD_WORKERS))
+
+    async def prepare(index: int, paper) -> Optional[PaperJob]:
+        async with download_semaphore:
+            job = None
+            try:
+                job = create_job(paper, index, total)
+                if await stage_triage(job, reviewer) and await stage_download(job):
+                    return job
+            except Exception as e:
+                logger.error(f"논문 처리 중 오류 발생 [{index}/{total}]", exc_info=True)
+                print_progress(f"  ✗ 실패 (오류: {str(e)[:100]})\n")
+            fail(job)
+            return None
+
+    prepared = await asyncio.gather(*(prepare(index, paper) for index, paper in enumerate(papers, start=1)))
+    jobs = [job for job in prepared if job is not None]
+
+    # 2) 배치 리뷰 (저널에서 재개한 논문 중 리뷰를 끝낸 논문은 제외)
+    reviewed = [job for job in jobs if job.get("resumed_stage") in (STAGE_REVIEWED, STAGE_SUMMARIZED)]
+    jobs = [job for job in jobs if job.get("resumed_stage") not in (STAGE_REVIEWED, STAGE_SUMMARIZED)]
+    if reviewer and jobs:
+        try:
+            review_results = await review_papers_batch(
+                [(job["pdf_content"], job["paper_data"].get('paperId')) for job in jobs],
+                reviewer
+            )
+        except Exception as e:
+            logger.error("배치 리뷰 실패 (다시 실행하면 제출한 배치를 이어서 기다림)", exc_info=True)
+            print_progress(f"  ✗ 배치 리뷰 실패 (오류: {str(e)[:100]})\n")
+            for job in jobs + reviewed:
+                fail(job)
+            return
+
+        accepted = reviewed
+        for job, review_result in zip(jobs, review_results):
+            if isinstance(review_result, ReviewError):
+                # 부적절 판단으로 기록하지 않음 (다음 실행에서 다시 리뷰)
+                logger.warning(f"리뷰 실패, 다음 실행에서 다시 시도 ({job['paper_data']['paperId']}): {review_result}")
+                fail(job)
+            elif review_result:
+                job["review_result"] = review_result
+                await record_stage(job, "review", DECISION_ACCEPTED)
+                accepted.append(job)
+            else:
+                await record_stage(job, "review", DECISION_REJECTED)
+                fail(job)
+        jobs = accepted
+    else:
+        jobs = reviewed + jobs
+
+    # 3) 요약 + 업로드
+    finish_semaphore = asyncio.Semaphore(max(1, PIPELINE_SUMMARIZE_WORKERS))
+
+    async def finish(job: PaperJob) -> None:
+        async with finish_semaphore:
+            bind_job_context(job)
+            try:
+                await stage_summarize(job)
+                result = await stage_upload(job)
+            except Exception as e:
+                paper_elapsed = time.time() - job["start_time"]
+                logger.error(f"논문 처리 중 오류 발생 (소요 시간: {paper_elapsed:.2f}초)", exc_info=True)
+                print_progress(f"  ✗ 실패 (오류: {str(e)[:100]})\n")
+                result = False
+            release_job(job)
+            on_result(job, result)
+
+    await asyncio.gather(*(finish(job) for job in jobs))
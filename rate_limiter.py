@@ -0,0 +1,138 @@
+"""
+목적지(호스트)별 Rate Limiting 모듈
+
+목적지마다 독립적인 토큰 버킷을 두어, 제한된 목적지로 가는 호출만 대기시킴.
+asyncio 코드에서는 acquire(), 워커 스레드에서 실행되는 동기 코드에서는
+acquire_blocking()을 사용하며 두 경로는 같은 버킷을 공유함
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+
+from config import RATE_LIMITS
+from logger import setup_logger
+
+logger = setup_logger("rate_limiter")
+
+
+# 목적지 이름 (RATE_LIMITS의 키)
+ARXIV_API = "arxiv_api"
+ARXIV_PDF = "arxiv_pdf"
+OPENAI = "openai"
+AI_SERVER = "ai_server"
+BACKEND = "backend"
+
+
+class TokenBucket:
+    """
+    토큰 버킷 Rate Limiter
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓임.
+    토큰을 미리 예약(음수 허용)하고 부족한 만큼만 대기하므로 대기 순서가 공정함
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = 1):
+        """
+        Args:
+            name: 목적지 이름 (로깅용)
+            rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 한 번에 허용되는 최대 요청 수
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 대기해야 할 시간(초) 반환
+        """
+        with self._lock:
+            now = time.monotonic()
+            blocked_wait = max(0.0, self._blocked_until - now)
+            if self.rate <= 0:
+                return blocked_wait
+
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            token_wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(token_wait, blocked_wait)
+
+    def defer(self, seconds: float) -> None:
+        """
+        다음 토큰 지급을 지정한 시간만큼 미룸 (HTTP 429 등 서버 측 제한 응답 시)
+
+        Args:
+            seconds: 미룰 시간 (초)
+        """
+        if seconds <= 0:
+            return
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+        logger.warning(f"[{self.name}] {seconds:.1f}초 동안 요청 보류")
+
+    async def acquire(self) -> None:
+        """토큰을 얻을 때까지 비동기 대기 (이벤트 루프는 막지 않음)"""
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"[{self.name}] Rate limit 대기: {wait:.2f}초")
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self) -> None:
+        """토큰을 얻을 때까지 현재 스레드에서 대기 (워커 스레드의 동기 코드용)"""
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"[{self.name}] Rate limit 대기: {wait:.2f}초")
+            time.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(destination: str) -> TokenBucket:
+    """
+    목적지별 토큰 버킷 가져오기 (없으면 RATE_LIMITS 설정으로 생성)
+
+    Args:
+        destination: 목적지 이름 (예: ARXIV_PDF, OPENAI)
+
+    Returns:
+        해당 목적지의 TokenBucket (설정이 없으면 제한 없는 버킷)
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(destination)
+        if bucket is None:
+            rate, burst = RATE_LIMITS.get(destination, (0.0, 1))
+            bucket = TokenBucket(destination, rate, burst)
+            _buckets[destination] = bucket
+            logger.debug(f"[{destination}] Rate limiter 생성 (rate: {rate}/s, burst: {burst})")
+        return bucket
+
+
+async def rate_limit(destination: str) -> None:
+    """
+    목적지로 요청을 보내기 전 호출 (비동기)
+
+    Args:
+        destination: 목적지 이름
+    """
+    await get_rate_limiter(destination).acquire()
+
+
+def rate_limit_blocking(destination: str) -> None:
+    """
+    목적지로 요청을 보내기 전 호출 (동기, 워커 스레드용)
+
+    Args:
+        destination: 목적지 이름
+    """
+    get_rate_limiter(destination).acquire_blocking()
@@ -0,0 +1,257 @@
+"""
+리뷰 결과 저장소 모듈
+
+같은 논문을 재시도/재크롤링하거나 latest와 scheduled 실행에 모두 나타나는 경우
+OpenAI 리뷰를 다시 하지 않도록 최종 리뷰를 SQLite에 저장.
+키는 (논문 키, 모델, 프롬프트 버전, 리플렉션 횟수)이며 논문 키는 버전이 포함된 arXiv ID
+또는 추출된 텍스트의 sha256
+
+사용법 (프롬프트를 바꾼 뒤 이전 리뷰 무효화):
+    python review_store.py --stats
+    python review_store.py --invalidate                # 현재 프롬프트 버전과 다른 리뷰 삭제
+    python review_store.py --invalidate --all          # 전체 삭제
+    python review_store.py --invalidate --paper 2401.12345v1
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from config import (
+    REVIEW_CACHE_ENABLED,
+    REVIEW_CACHE_PATH,
+    REVIEWER_PROMPT_LAYOUT,
+    REVIEWER_SECTION_VIEW,
+    REVIEWER_MODE,
+    REVIEWER_ENSEMBLE_SIZE
+)
+from logger import setup_logger
+
+logger = setup_logger("review_store")
+
+
+# 버전이 포함된 arXiv ID (예: 2401.12345v2)
+_VERSIONED_ARXIV_ID_PATTERN = re.compile(r'v\d+$')
+
+
+def paper_key_from_id(paper_id: Optional[str]) -> Optional[str]:
+    """
+    논문 ID로 리뷰 저장소 키 생성 (버전이 없는 ID는 내용이 바뀔 수 있으므로 None)
+
+    Args:
+        paper_id: arXiv 논문 ID
+
+    Returns:
+        저장소 키 또는 None
+    """
+    if paper_id and _VERSIONED_ARXIV_ID_PATTERN.search(paper_id):
+        return f"arxiv:{paper_id}"
+    return None
+
+
+def paper_key_from_text(paper_text: str) -> str:
+    """
+    추출된 논문 텍스트로 리뷰 저장소 키 생성
+
+    Args:
+        paper_text: 논문 텍스트
+
+    Returns:
+        저장소 키
+    """
+    return "sha256:" + hashlib.sha256(paper_text.encode("utf-8")).hexdigest()
+
+
+class ReviewStore:
+    """
+    최종 리뷰 결과 SQLite 저장소
+
+    인덱스는 SQLite(WAL)를 사용하므로 여러 스레드/프로세스에서 공유 가능
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS reviews (
+                    paper_key TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    reflection INTEGER NOT NULL,
+                    review TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (paper_key, model, prompt_version, reflection)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """DB 연결 (블록이 끝나면 커밋 후 닫음)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, paper_key: str, model: str, prompt_version: str, reflection: int) -> Optional[Dict]:
+        """
+        저장된 최종 리뷰 조회
+
+        Args:
+            paper_key: 논문 키
+            model: 리뷰 모델
+            prompt_version: 프롬프트 버전 해시
+            reflection: 리플렉션 횟수
+
+        Returns:
+            리뷰 딕셔너리 또는 None
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT review FROM reviews WHERE paper_key = ? AND model = ? AND prompt_version = ? AND reflection = ?",
+                (paper_key, model, prompt_version, reflection)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, paper_key: str, model: str, prompt_version: str, reflection: int, review: Dict) -> None:
+        """
+        최종 리뷰 저장 (같은 키가 있으면 덮어씀)
+
+        Args:
+            paper_key: 논문 키
+            model: 리뷰 모델
+            prompt_version: 프롬프트 버전 해시
+            reflection: 리플렉션 횟수
+            review: 최종 리뷰 딕셔너리
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reviews (paper_key, model, prompt_version, reflection, review, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (paper_key, model, prompt_version, reflection, json.dumps(review, ensure_ascii=False), time.time())
+            )
+
+    def invalidate(self, keep_prompt_version: Optional[str] = None, paper_key: Optional[str] = None) -> int:
+        """
+        저장된 리뷰 삭제
+
+        Args:
+            keep_prompt_version: 지정하면 이 프롬프트 버전이 아닌 리뷰만 삭제
+            paper_key: 지정하면 이 논문의 리뷰만 삭제
+
+        Returns:
+            삭제된 리뷰 수
+        """
+        conditions = []
+        params = []
+        if keep_prompt_version is not None:
+            conditions.append("prompt_version != ?")
+            params.append(keep_prompt_version)
+        if paper_key is not None:
+            conditions.append("paper_key = ?")
+            params.append(paper_key)
+
+        query = "DELETE FROM reviews"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        with self._lock, self._connect() as conn:
+            return conn.execute(query, params).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """
+        프롬프트 버전별 저장된 리뷰 수
+
+        Returns:
+            {프롬프트 버전: 리뷰 수}
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT prompt_version, COUNT(*) FROM reviews GROUP BY prompt_version").fetchall()
+        return {prompt_version: count for prompt_version, count in rows}
+
+
+_review_store: Optional[ReviewStore] = None
+_review_store_lock = threading.Lock()
+
+
+def get_review_store() -> Optional[ReviewStore]:
+    """
+    공유 리뷰 저장소 가져오기 (없으면 생성)
+
+    Returns:
+        ReviewStore 인스턴스 또는 None (비활성화 또는 초기화 실패 시)
+    """
+    global _review_store
+
+    if not REVIEW_CACHE_ENABLED:
+        return None
+
+    with _review_store_lock:
+        if _review_store is None:
+            try:
+                _review_store = ReviewStore(REVIEW_CACHE_PATH)
+                logger.info(f"리뷰 저장소 사용: {REVIEW_CACHE_PATH}")
+            except Exception as e:
+                logger.error(f"리뷰 저장소 초기화 실패, 저장소 없이 진행: {e}", exc_info=True)
+                return None
+        return _review_store
+
+
+def main() -> None:
+    from reviewer import compute_prompt_version
+
+    parser = argparse.ArgumentParser(description="리뷰 결과 저장소 관리")
+    parser.add_argument("--stats", action="store_true", help="프롬프트 버전별 저장된 리뷰 수 출력")
+    parser.add_argument("--invalidate", action="store_true", help="현재 프롬프트 버전과 다른 리뷰 삭제")
+    parser.add_argument("--all", action="store_true", help="--invalidate와 함께 사용: 프롬프트 버전과 관계없이 삭제")
+    parser.add_argument("--paper", default=None, help="--invalidate와 함께 사용: 이 arXiv ID(버전 포함)의 리뷰만 삭제")
+    args = parser.parse_args()
+
+    store = ReviewStore(REVIEW_CACHE_PATH)
+    current_version = compute_prompt_version(
+        prompt_layout=REVIEWER_PROMPT_LAYOUT,
+        section_view=REVIEWER_SECTION_VIEW,
+        review_mode=REVIEWER_MODE,
+        ensemble_size=max(1, REVIEWER_ENSEMBLE_SIZE)
+    )
+    print(f"리뷰 저장소: {REVIEW_CACHE_PATH}")
+    print(f"현재 프롬프트 버전: {current_version}")
+
+    if args.invalidate:
+        paper_key = None
+        if args.paper:
+            paper_key = paper_key_from_id(args.paper)
+            if paper_key is None:
+                print(f"버전이 포함된 arXiv ID가 필요합니다: {args.paper}")
+                return
+        keep_version = None if (args.all or paper_key) else current_version
+        deleted = store.invalidate(keep_prompt_version=keep_version, paper_key=paper_key)
+        print(f"삭제된 리뷰: {deleted}개")
+        logger.info(f"리뷰 저장소 무효화: {deleted}개 삭제 (paper: {args.paper or '전체'}, all: {args.all})")
+
+    if args.stats or not args.invalidate:
+        for prompt_version, count in store.stats().items():
+            marker = " (현재)" if prompt_version == current_version else ""
+            print(f"  {prompt_version}: {count}개{marker}")
+
+
+if __name__ == "__main__":
+    main()
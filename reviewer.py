@@ -1,14 +1,83 @@
+import asyncio
+import hashlib
 import json
 import os
 import re
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel, Field, ValidationError
+
+from openai_scheduler import get_openai_scheduler
+from rate_limiter import OPENAI, rate_limit
+from section_segmenter import build_review_view
+from token_budget import TOKENS_PER_MESSAGE, TokenBudget, estimate_message_tokens
 
 # Load environment variables from .env file
 load_dotenv()
 
+# 프롬프트 배치 방식 (config.REVIEWER_PROMPT_LAYOUT 참고)
+PROMPT_LAYOUT_PREFIX = "prefix"
+PROMPT_LAYOUT_INLINE = "inline"
+
+# 리뷰 방식 (config.REVIEWER_MODE 참고)
+REVIEW_MODE_REFLECTION = "reflection"
+REVIEW_MODE_ENSEMBLE = "ensemble"
+
+# 응답 형식 (config.REVIEWER_OUTPUT_MODE 참고)
+OUTPUT_MODE_JSON_SCHEMA = "json_schema"
+OUTPUT_MODE_TEXT = "text"
+
+# 리뷰에 사용하는 프롬프트 파일 (프롬프트 버전 해시 계산 대상)
+REVIEW_PROMPT_FILES = (
+    "reviewer_system.txt",
+    "paper_review.txt",
+    "neurips_reviewer_guidelines.txt",
+    "few_shot_review_examples.txt",
+    "paper_reflection.txt",
+    "ensemble_system.txt",
+)
+
+
+def _short_hash(text: str) -> str:
+    """프롬프트 캐시 키용 짧은 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def compute_prompt_version(
+    prompts_dir: str = "./prompts/paper_review",
+    prompt_layout: str = PROMPT_LAYOUT_PREFIX,
+    section_view: bool = True,
+    review_mode: str = REVIEW_MODE_REFLECTION,
+    ensemble_size: int = 3
+) -> str:
+    """
+    리뷰 프롬프트 파일, 배치 방식, 논문 입력 방식으로 프롬프트 버전 해시 계산 (저장된 리뷰 무효화 기준)
+    
+    Args:
+        prompts_dir: 프롬프트 디렉토리
+        prompt_layout: 프롬프트 배치 방식
+        section_view: 리뷰용 섹션 텍스트 사용 여부
+        review_mode: 리뷰 방식
+        ensemble_size: 병렬 앙상블 리뷰 수 (ensemble 방식에서만 사용)
+    
+    Returns:
+        프롬프트 버전 해시
+    """
+    prompts_path = Path(prompts_dir)
+    digest = hashlib.sha256(prompt_layout.encode("utf-8"))
+    if section_view:
+        digest.update(b"\0section_view")
+    if review_mode == REVIEW_MODE_ENSEMBLE:
+        digest.update(f"\0ensemble:{ensemble_size}".encode("utf-8"))
+    for filename in REVIEW_PROMPT_FILES:
+        digest.update(b"\0" + filename.encode("utf-8") + b"\0")
+        digest.update((prompts_path / filename).read_bytes())
+    return digest.hexdigest()[:16]
+
 
 def parse_markdown_json(content: str) -> dict:
     """
@@ -59,15 +128,178 @@ def parse_markdown_json(content: str) -> dict:
         raise ValueError(f"JSON 파싱 실패. 원본 내용:\n{content[:500]}")
 
 
+class PaperReview(BaseModel):
+    """리뷰 응답 스키마 (few-shot 예시의 리뷰 형식)"""
+
+    content: str = Field(description="Full review text: summary, strengths, weaknesses, questions and limitations")
+    recommendation: str = Field(description='One of "Strong Accept", "Accept", "Weak Accept", "Borderline", "Weak Reject", "Reject", "Strong Reject"')
+    overall_score: int = Field(ge=1, le=10, description="Overall score from 1 to 10")
+    confidence: int = Field(ge=1, le=5, description="Reviewer confidence from 1 to 5")
+
+
+class PaperReflection(PaperReview):
+    """리플렉션 응답 스키마 (구조화된 응답에서는 "I am done"을 is_done으로 받음)"""
+
+    # 자유 형식 응답(text 모드, fallback)에는 없으므로 기본값 False
+    is_done: bool = Field(default=False, description="True only if you are making no more changes to the review")
+
+
+class AbstractScreening(BaseModel):
+    """초록 1차 판단 응답 스키마"""
+
+    score: int = Field(ge=1, le=10, description="Score from 1 to 10")
+    reason: str = Field(description="One sentence")
+
+
+# 응답 파싱 경로별 횟수 (schema: JSON 그대로 검증, fallback: 정규식 추출, failed: 실패)
+PARSE_STATS = {"schema": 0, "fallback": 0, "failed": 0}
+
+
+def response_format_for(schema: type[BaseModel]) -> dict:
+    """
+    응답 스키마로 Chat Completion의 response_format(json_schema, strict) 생성
+    
+    Args:
+        schema: 응답 스키마 모델
+    
+    Returns:
+        response_format 딕셔너리
+    """
+    # strict 모드는 모든 필드가 required여야 하고 default/추가 필드를 허용하지 않음
+    json_schema = schema.model_json_schema()
+    json_schema.pop("description", None)
+    for field_schema in json_schema["properties"].values():
+        field_schema.pop("default", None)
+    json_schema["additionalProperties"] = False
+    json_schema["required"] = list(json_schema["properties"])
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": schema.__name__, "strict": True, "schema": json_schema},
+    }
+
+
+def reviews_converged(previous: dict, current: dict) -> bool:
+    """
+    연속된 두 리뷰의 판단(overall_score, recommendation)이 같은지 확인
+    
+    Args:
+        previous: 이전 라운드 리뷰
+        current: 현재 라운드 리뷰
+    
+    Returns:
+        판단이 바뀌지 않았으면 True
+    """
+    def decision(review: dict) -> tuple:
+        recommendation = str(review.get("recommendation", "")).strip().lower()
+        try:
+            score = float(review.get("overall_score"))
+        except (TypeError, ValueError):
+            score = None
+        return score, recommendation
+
+    return decision(previous) == decision(current)
+
+
+def parse_review_response(content: Optional[str], schema: type[BaseModel]) -> BaseModel:
+    """
+    응답을 스키마로 검증 (구조화된 응답이면 바로 검증하고, 아니면 parse_markdown_json으로 JSON 추출 후 검증)
+    
+    Args:
+        content: OpenAI 응답 문자열
+        schema: 응답 스키마 모델
+    
+    Returns:
+        검증된 스키마 인스턴스
+    
+    Raises:
+        ValueError: JSON 추출 또는 스키마 검증 실패 시
+    """
+    content = content or ""
+    try:
+        result = schema.model_validate_json(content)
+        PARSE_STATS["schema"] += 1
+        return result
+    except ValidationError:
+        pass
+
+    try:
+        result = schema.model_validate(parse_markdown_json(content))
+    except (json.JSONDecodeError, ValueError) as e:
+        PARSE_STATS["failed"] += 1
+        raise ValueError(f"{schema.__name__} 검증 실패: {str(e)[:500]}") from e
+
+    PARSE_STATS["fallback"] += 1
+    return result
+
+
+class ReviewSession:
+    """
+    논문 한 편에 대한 리뷰 세션 (리뷰 결과, 대화 메시지, 토큰 사용량)
+
+    Reviewer는 상태를 갖지 않고 호출마다 새 세션을 만들어 반환하므로,
+    하나의 Reviewer(AsyncOpenAI 클라이언트)로 여러 논문을 동시에 리뷰할 수 있음
+    """
+
+    def __init__(self):
+        self.reviews: list[dict] = []
+        self.messages: list[dict] = []
+        self.usage = {"prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+    @property
+    def final_review(self) -> Optional[dict]:
+        """가장 마지막(리플렉션/앙상블까지 반영된) 리뷰"""
+        return self.reviews[-1] if self.reviews else None
+
+    def add_usage(self, completion) -> None:
+        """
+        Chat Completion 응답의 토큰 사용량 누적
+        
+        Args:
+            completion: ChatCompletion 응답
+        """
+        usage = getattr(completion, "usage", None)
+        if usage is None:
+            return
+        self.usage["prompt_tokens"] += usage.prompt_tokens or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.usage["cached_tokens"] += (getattr(details, "cached_tokens", None) or 0) if details else 0
+        self.usage["completion_tokens"] += usage.completion_tokens or 0
+        self.usage["total_tokens"] += usage.total_tokens or 0
+
+    def add_usage_dict(self, usage: dict) -> None:
+        """
+        저장해 둔 토큰 사용량(딕셔너리) 누적
+        
+        Args:
+            usage: ReviewSession.usage 형식의 딕셔너리
+        """
+        for key in self.usage:
+            self.usage[key] += usage.get(key, 0)
+
+
 class Reviewer:
-    def __init__(self, model: str = "gpt-4o-mini", prompts_dir: str = "./prompts/paper_review"):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        prompts_dir: str = "./prompts/paper_review",
+        prompt_layout: str = PROMPT_LAYOUT_PREFIX,
+        output_mode: str = OUTPUT_MODE_JSON_SCHEMA,
+        context_tokens: int = 0,
+        output_tokens: int = 4096,
+        paper_max_tokens: int = 0,
+        section_view: bool = True,
+        review_mode: str = REVIEW_MODE_REFLECTION,
+        ensemble_size: int = 3
+    ):
 
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY environment variable is not set.")
         
-        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # OPENAI_BASE_URL이 있으면 해당 서버 사용 (OpenAI 호환 로컬 서버 등)
+        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), base_url=os.getenv("OPENAI_BASE_URL") or None)
+        # Chat Completion 재시도는 스케줄러가 RPM/TPM 예산과 함께 처리하므로 SDK 자체 재시도는 끔
+        self.completion_client = self.client.with_options(max_retries=0)
         self.model = model
-        self.reviews = []
 
         prompts_path = Path(prompts_dir)
         self.reviewer_system = (prompts_path / "reviewer_system.txt").read_text(encoding="utf-8")
@@ -76,46 +308,226 @@ class Reviewer:
         self.few_shot_review_examples = (prompts_path / "few_shot_review_examples.txt").read_text(encoding="utf-8")
         self.paper_reflection = (prompts_path / "paper_reflection.txt").read_text(encoding="utf-8")
         self.ensemble_system = (prompts_path / "ensemble_system.txt").read_text(encoding="utf-8")
+        self.abstract_screening = (prompts_path / "abstract_screening.txt").read_text(encoding="utf-8")
+
+        if prompt_layout not in (PROMPT_LAYOUT_PREFIX, PROMPT_LAYOUT_INLINE):
+            raise ValueError(f"Unknown prompt layout: {prompt_layout}")
+        self.prompt_layout = prompt_layout
+        if review_mode not in (REVIEW_MODE_REFLECTION, REVIEW_MODE_ENSEMBLE):
+            raise ValueError(f"Unknown review mode: {review_mode}")
+        self.review_mode = review_mode
+        self.ensemble_size = max(1, ensemble_size)
 
-    async def review(self, paper_content: str, reflection: int = 3) -> list[dict]:
+        self.section_view = section_view
+        self.prompt_version = compute_prompt_version(prompts_dir, prompt_layout, section_view, review_mode, self.ensemble_size)
+
+        if output_mode not in (OUTPUT_MODE_JSON_SCHEMA, OUTPUT_MODE_TEXT):
+            raise ValueError(f"Unknown output mode: {output_mode}")
+        self.output_mode = output_mode
+
+        # 논문 앞의 고정 부분(가이드라인, few-shot 예시)은 한 번만 만들어 매 호출 byte 단위로 동일하게 유지
+        paper_review = self.paper_review.replace("{neurips_reviewer_guidelines}", self.neurips_reviewer_guidelines)
+        paper_review = paper_review.replace("{few_show_examples}", self.few_shot_review_examples)
+        self.review_prefix, self.review_suffix = paper_review.split("{paper}", 1)
+
+        # 같은 고정 앞부분을 가진 요청이 같은 캐시로 라우팅되도록 하는 키
+        self.review_cache_key = "paper-review-" + _short_hash(self.reviewer_system + self.review_prefix)
+        self.ensemble_cache_key = "paper-ensemble-" + _short_hash(self.ensemble_system + self.neurips_reviewer_guidelines)
+
+        # 논문 입력 토큰 예산 (컨텍스트 윈도우 - 고정 프롬프트 - 리플렉션 대화 - 응답 예약분)
+        self.token_budget = TokenBudget(model, context_tokens)
+        self.output_tokens = output_tokens
+        self.paper_max_tokens = paper_max_tokens
+        self._paper_token_limits: dict[int, int] = {}
+
+    async def _create_completion(
+        self,
+        messages: list[dict],
+        session: Optional[ReviewSession] = None,
+        prompt_cache_key: Optional[str] = None,
+        model: Optional[str] = None,
+        schema: Optional[type[BaseModel]] = None
+    ):
         """
-        논문을 리뷰하는 메인 함수
+        OpenAI Chat Completion 호출 (모델별 RPM/TPM 스케줄러 + OpenAI 목적지 Rate Limit 적용)
+        
+        Args:
+            messages: 대화 메시지 리스트
+            session: 토큰 사용량을 누적할 리뷰 세션
+            prompt_cache_key: 프롬프트 캐시 라우팅 키 (prefix 배치에서만 전송)
+            model: 사용할 모델 (None이면 self.model)
+            schema: 응답 스키마 (json_schema 모드에서만 response_format으로 전송)
+        
+        Returns:
+            ChatCompletion 응답
+        """
+        model = model or self.model
+        kwargs = self.request_options(prompt_cache_key, schema)
+
+        async def send() -> ChatCompletion:
+            await rate_limit(OPENAI)
+            return await self.completion_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                **kwargs,
+            )
+
+        completion = await get_openai_scheduler(model).run(
+            send,
+            estimate_message_tokens(messages) + self.output_tokens,
+            lambda result: result.usage.total_tokens if result.usage else None,
+        )
+        if session is not None:
+            session.add_usage(completion)
+        if completion.choices[0].message.refusal:
+            print(f"request refused: {completion.choices[0].message.refusal}")
+        return completion
+
+    def request_options(self, prompt_cache_key: Optional[str] = None, schema: Optional[type[BaseModel]] = None) -> dict:
+        """
+        모델/메시지 외의 요청 옵션 (Batch API 요청 본문에도 동일하게 사용)
+        
+        Args:
+            prompt_cache_key: 프롬프트 캐시 라우팅 키 (prefix 배치에서만 전송)
+            schema: 응답 스키마 (json_schema 모드에서만 response_format으로 전송)
+        
+        Returns:
+            요청 옵션 딕셔너리
+        """
+        options = {}
+        if prompt_cache_key and self.prompt_layout == PROMPT_LAYOUT_PREFIX:
+            options["prompt_cache_key"] = prompt_cache_key
+        if schema is not None and self.output_mode == OUTPUT_MODE_JSON_SCHEMA:
+            options["response_format"] = response_format_for(schema)
+        return options
+
+    def build_review_messages(self, paper_content: str) -> list[dict]:
+        """
+        최초 리뷰 요청 메시지 생성
         
         Args:
             paper_content: 논문 텍스트 내용
-            reflection: 리플렉션 라운드 수 (기본값: 3)
         
         Returns:
-            리뷰 딕셔너리 리스트
+            대화 메시지 리스트
         """
         messages = [{'role': 'system', 'content': self.reviewer_system}]
 
-        paper_review = self.paper_review 
+        if self.prompt_layout == PROMPT_LAYOUT_PREFIX:
+            # 고정 앞부분과 논문을 별도 메시지로 나누어 논문이 항상 마지막에 오도록 함
+            messages.append({'role': 'user', 'content': self.review_prefix})
+            messages.append({'role': 'user', 'content': paper_content + self.review_suffix})
+        else:
+            messages.append({'role': 'user', 'content': self.review_prefix + paper_content + self.review_suffix})
 
-        paper_review = paper_review.replace("{neurips_reviewer_guidelines}", self.neurips_reviewer_guidelines)
-        paper_review = paper_review.replace("{few_show_examples}", self.few_shot_review_examples)
-        paper_review = paper_review.replace("{paper}", paper_content)
+        return messages
+
+    def paper_token_limit(self, reflection: int = 3) -> int:
+        """
+        리뷰 요청에서 논문 텍스트에 쓸 수 있는 토큰 수
+        
+        마지막 리플렉션 라운드(이전 응답과 리플렉션 요청이 모두 쌓인 상태)에서도
+        응답 예약분까지 컨텍스트 윈도우에 들어가도록 계산
+        
+        Args:
+            reflection: 리플렉션 라운드 수
+        
+        Returns:
+            논문 텍스트 최대 토큰 수
+        """
+        if reflection in self._paper_token_limits:
+            return self._paper_token_limits[reflection]
+
+        budget = self.token_budget
+        static_tokens = budget.count_messages(self.build_review_messages(""))
+        reflection_tokens = TOKENS_PER_MESSAGE + budget.count(self.build_reflection_message(reflection, reflection)['content'])
+        conversation_tokens = reflection * (TOKENS_PER_MESSAGE + self.output_tokens + reflection_tokens)
 
-        prompt = paper_review
+        # 토크나이저가 없으면 근사값이므로 여유를 더 둠
+        margin = budget.context_tokens // (100 if budget.exact else 10)
+        limit = budget.context_tokens - static_tokens - conversation_tokens - self.output_tokens - margin
+        if self.paper_max_tokens > 0:
+            limit = min(limit, self.paper_max_tokens)
 
-        messages.append({'role': 'user', 'content': prompt})
+        self._paper_token_limits[reflection] = max(0, limit)
+        return self._paper_token_limits[reflection]
+
+    def fit_paper(self, paper_content: str, reflection: int = 3) -> str:
+        """
+        논문 텍스트를 토큰 예산에 맞춤 (넘치면 참고문헌 → 부록 → 본문 중간 순으로 잘라냄)
+        
+        Args:
+            paper_content: 논문 텍스트 내용
+            reflection: 리플렉션 라운드 수
+        
+        Returns:
+            예산에 맞춘 논문 텍스트
+        """
+        limit = self.paper_token_limit(reflection)
+        fitted, original_tokens = self.token_budget.fit_paper(paper_content, limit)
+        if fitted is not paper_content:
+            print(f"paper trimmed to token budget: {original_tokens} -> {limit} tokens")
+        return fitted
+
+    def prepare_paper(self, paper_content: str, reflection: int = 3) -> str:
+        """
+        추출된 논문 텍스트를 리뷰 입력으로 변환 (리뷰용 섹션 텍스트 → 토큰 예산에 맞춤)
+        
+        Args:
+            paper_content: 추출된 논문 텍스트
+            reflection: 리플렉션 라운드 수
+        
+        Returns:
+            리뷰 입력 텍스트
+        """
+        if self.section_view:
+            view, dropped = build_review_view(paper_content)
+            if dropped:
+                print(f"review view: dropped {', '.join(dropped)} ({len(paper_content)} -> {len(view)} chars)")
+            paper_content = view
+        return self.fit_paper(paper_content, reflection)
+
+    def build_reflection_message(self, round_num: int, reflection: int) -> dict:
+        """
+        리플렉션 라운드 요청 메시지 생성
+        
+        Args:
+            round_num: 현재 라운드 (1부터)
+            reflection: 전체 리플렉션 라운드 수
+        
+        Returns:
+            user 메시지
+        """
+        return {'role': 'user', 'content': f"Round {round_num}/{reflection}." + self.paper_reflection}
+
+    async def review(self, paper_content: str, reflection: int = 3) -> ReviewSession:
+        """
+        논문을 리뷰하는 메인 함수
+        
+        Args:
+            paper_content: 논문 텍스트 내용
+            reflection: 리플렉션 라운드 수 (기본값: 3)
+        
+        Returns:
+            이 논문의 리뷰 세션 (JSON 파싱에 실패하면 reviews가 비어 있거나 일부만 있음)
+        """
+        session = ReviewSession()
+        messages = session.messages
+        messages.extend(self.build_review_messages(paper_content))
 
         # 1) 최초 리뷰 생성
         print("==> initial review generation start...")
-        completion = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-        )
+        completion = await self._create_completion(messages, session, self.review_cache_key, schema=PaperReview)
 
         print(completion.choices[0].message.content)
 
         try:
-            review_json = parse_markdown_json(completion.choices[0].message.content)
-        except (json.JSONDecodeError, ValueError) as e:
+            review = parse_review_response(completion.choices[0].message.content, PaperReview)
+        except ValueError as e:
             print(f"review JSON parsing failed: {e}")
-            return []
+            return session
 
-        self.reviews.append(review_json)
+        session.reviews.append(review.model_dump())
         messages.append({'role': 'assistant', 'content': completion.choices[0].message.content})
         print("==> initial review generation done.")
 
@@ -123,80 +535,185 @@ class Reviewer:
         for i in range(reflection):
             round_num = i + 1
             print(f"==> reflection {round_num}/{reflection} start...")
-            messages.append({'role': 'user', 'content': f"Round {round_num}/{reflection}." + self.paper_reflection})
+            messages.append(self.build_reflection_message(round_num, reflection))
 
-            completion = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-            )
+            completion = await self._create_completion(messages, session, self.review_cache_key, schema=PaperReflection)
             try:
-                reflection_json = parse_markdown_json(completion.choices[0].message.content)
-            except (json.JSONDecodeError, ValueError) as e:
+                reflection_review = parse_review_response(completion.choices[0].message.content, PaperReflection)
+            except ValueError as e:
+                # 실패한 라운드만 버리고 이전 라운드까지의 리뷰는 유지
                 print(f"reflection {round_num} JSON parsing failed: {e}")
-                return self.reviews
+                messages.pop()
+                return session
 
-            self.reviews.append(reflection_json)
+            session.reviews.append(reflection_review.model_dump(exclude={"is_done"}))
             messages.append({'role': 'assistant', 'content': completion.choices[0].message.content})
             print(f"==> reflection {round_num}/{reflection} done.")
 
-            if 'i am done' in completion.choices[0].message.content.lower():
+            if reflection_review.is_done or 'i am done' in completion.choices[0].message.content.lower():
                 print("reflection early done")
                 break
 
-        return self.reviews
+            # 점수와 추천이 더 이상 바뀌지 않으면 남은 라운드는 건너뜀
+            if reviews_converged(session.reviews[-2], session.reviews[-1]):
+                print("reflection converged")
+                break
+
+        return session
 
-    async def review_ensembling(self) -> list[dict]:
+    async def review_parallel(self, paper_content: str, ensemble_size: Optional[int] = None) -> ReviewSession:
         """
-        여러 리뷰를 앙상블하여 최종 리뷰 생성
+        독립적인 최초 리뷰 여러 개를 동시에 생성한 뒤 review_ensembling으로 합침 (리플렉션 대신 사용)
+        
+        Args:
+            paper_content: 논문 텍스트 내용
+            ensemble_size: 동시에 생성할 리뷰 수 (None이면 self.ensemble_size)
+        
+        Returns:
+            이 논문의 리뷰 세션 (reviews는 앙상블된 최종 리뷰 하나, 앙상블 실패 시 개별 리뷰들)
+        """
+        ensemble_size = ensemble_size or self.ensemble_size
+        session = ReviewSession()
+        session.messages.extend(self.build_review_messages(paper_content))
+
+        print(f"==> parallel review generation start ({ensemble_size})...")
+        completions = await asyncio.gather(
+            *(
+                self._create_completion(session.messages, session, self.review_cache_key, schema=PaperReview)
+                for _ in range(ensemble_size)
+            ),
+            return_exceptions=True
+        )
+
+        for index, completion in enumerate(completions, start=1):
+            if isinstance(completion, BaseException):
+                print(f"parallel review {index} failed: {completion}")
+                continue
+            try:
+                session.reviews.append(parse_review_response(completion.choices[0].message.content, PaperReview).model_dump())
+            except ValueError as e:
+                print(f"parallel review {index} JSON parsing failed: {e}")
+        print(f"==> parallel review generation done ({len(session.reviews)}/{ensemble_size}).")
+
+        if len(session.reviews) > 1:
+            await self.review_ensembling(session)
+        return session
+
+    async def run_review(self, paper_content: str, reflection: int = 3) -> ReviewSession:
+        """
+        설정된 리뷰 방식으로 논문 리뷰 (reflection: 순차 리플렉션, ensemble: 병렬 리뷰 후 앙상블)
+        
+        Args:
+            paper_content: 논문 텍스트 내용
+            reflection: 리플렉션 라운드 수 (reflection 방식에서만 사용)
         
         Returns:
-            앙상블된 최종 리뷰 딕셔너리 리스트
+            이 논문의 리뷰 세션
         """
-        if not self.reviews:
+        if self.review_mode == REVIEW_MODE_ENSEMBLE:
+            return await self.review_parallel(paper_content)
+        return await self.review(paper_content, reflection=reflection)
+
+    def review_rounds(self, reflection: int) -> int:
+        """
+        논문이 들어간 대화에서 이어지는 리플렉션 라운드 수 (토큰 예산, 리뷰 저장소 키에 사용)
+        
+        Args:
+            reflection: 설정된 리플렉션 라운드 수
+        
+        Returns:
+            ensemble 방식이면 0, 아니면 reflection
+        """
+        return 0 if self.review_mode == REVIEW_MODE_ENSEMBLE else reflection
+
+    async def screen_abstract(self, title: str, abstract: str, model: Optional[str] = None) -> ReviewSession:
+        """
+        제목과 초록만으로 빠르게 1차 판단 (전체 리뷰 전에 명백히 부적절한 논문 제외)
+        
+        Args:
+            title: 논문 제목
+            abstract: 논문 초록
+            model: 1차 판단에 사용할 모델 (None이면 self.model)
+        
+        Returns:
+            리뷰 세션 (reviews에 {"score", "reason"} 하나, 검증 실패 시 비어 있음)
+        """
+        session = ReviewSession()
+        session.messages.append({'role': 'system', 'content': self.abstract_screening})
+        session.messages.append({'role': 'user', 'content': f"Title: {title}\n\nAbstract:\n{abstract}"})
+
+        completion = await self._create_completion(session.messages, session, model=model, schema=AbstractScreening)
+
+        try:
+            session.reviews.append(parse_review_response(completion.choices[0].message.content, AbstractScreening).model_dump())
+        except ValueError as e:
+            print(f"abstract screening JSON parsing failed: {e}")
+
+        return session
+
+    async def review_ensembling(self, session: ReviewSession) -> ReviewSession:
+        """
+        세션의 여러 리뷰를 앙상블하여 최종 리뷰 생성
+        
+        Args:
+            session: review()가 반환한 리뷰 세션
+        
+        Returns:
+            reviews가 앙상블된 최종 리뷰 하나로 바뀐 같은 세션 (실패 시 그대로)
+        """
+        if not session.reviews:
             raise ValueError("No reviews available for ensembling.")
 
         print("==> review ensembling start...")
         
-        self.ensemble_system = self.ensemble_system.replace("{reviewer_count}", str(len(self.reviews)))
+        ensemble_system = self.ensemble_system.replace("{reviewer_count}", str(len(session.reviews)))
 
-        messages = [{'role': 'system', 'content': self.ensemble_system}]
+        messages = [{'role': 'system', 'content': ensemble_system}]
 
         prompt = ""
-        for idx, content in enumerate(self.reviews):
+        for idx, content in enumerate(session.reviews):
             review_text = json.dumps(content, indent=2) if isinstance(content, dict) else str(content)
-            prompt += f"Review {idx + 1}/{len(self.reviews)}:\n{review_text}\n\n"
+            prompt += f"Review {idx + 1}/{len(session.reviews)}:\n{review_text}\n\n"
 
-        prompt += "\n\n\n\n\n" + self.neurips_reviewer_guidelines
-        messages.append({'role': 'user', 'content': prompt})
+        if self.prompt_layout == PROMPT_LAYOUT_PREFIX:
+            # 고정된 가이드라인을 리뷰들보다 앞에 두어 프롬프트 캐시 대상이 되도록 함
+            messages.append({'role': 'user', 'content': self.neurips_reviewer_guidelines})
+            messages.append({'role': 'user', 'content': prompt})
+        else:
+            prompt += "\n\n\n\n\n" + self.neurips_reviewer_guidelines
+            messages.append({'role': 'user', 'content': prompt})
 
-        completion = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-        )
+        completion = await self._create_completion(messages, session, self.ensemble_cache_key, schema=PaperReview)
 
         try:
-            final_review = parse_markdown_json(completion.choices[0].message.content)
-        except (json.JSONDecodeError, ValueError) as e:
+            final_review = parse_review_response(completion.choices[0].message.content, PaperReview).model_dump()
+        except ValueError as e:
             print(f"ensembling review JSON parsing failed: {e}")
-            return self.reviews
+            return session
 
-        self.reviews = [final_review]
+        session.reviews = [final_review]
         print("==> review ensembling done.")
 
-        return self.reviews
+        return session
 
-    def is_review_strong_enough(self, score_threshold: float = 3.0, confidence_threshold: float = 3.0) -> bool:
+    def is_review_strong_enough(
+        self,
+        session: ReviewSession,
+        score_threshold: float = 3.0,
+        confidence_threshold: float = 3.0
+    ) -> bool:
         """
         리뷰가 충분히 강한지 확인
         
         Args:
+            session: 리뷰 세션
             score_threshold: 최소 점수 임계값
             confidence_threshold: 최소 신뢰도 임계값
         
         Returns:
             리뷰가 충분히 강하면 True
         """
-        for review in self.reviews:
+        for review in session.reviews:
             if isinstance(review, dict):
                 overall = review.get("overall_score")
                 confidence = review.get("confidence")
@@ -208,3 +725,270 @@ class Reviewer:
                     continue
         return False
 
+
+class BatchReviewRunner:
+    """
+    OpenAI Batch API로 여러 논문을 한 번에 리뷰 (응답 지연 대신 비용 절감)
+
+    라운드(최초 리뷰, 리플렉션 1..n)마다 아직 끝나지 않은 논문의 요청을 JSONL 배치 파일로 만들어
+    제출하고 완료될 때까지 polling. 업로드한 입력 파일 ID와 배치 ID는 각 API 호출 직후, 라운드별 응답은
+    라운드가 끝날 때 상태 파일에 저장되므로 프로세스가 재시작되어도 같은 논문 목록이면
+    이미 제출한 배치를 이어서 기다림 (배치를 두 번 제출하지 않음)
+    """
+
+    TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(self, reviewer: Reviewer, batch_dir: str, poll_interval: float = 30.0):
+        """
+        Args:
+            reviewer: Reviewer 인스턴스 (클라이언트, 모델, 프롬프트 사용)
+            batch_dir: 배치 입력 파일과 상태 파일을 저장할 디렉토리
+            poll_interval: 배치 상태 확인 간격 (초)
+        """
+        self.reviewer = reviewer
+        self.batch_dir = Path(batch_dir)
+        self.poll_interval = poll_interval
+
+    def _run_id(self, custom_ids: list[str], reflection: int) -> str:
+        """같은 논문 목록/모델/프롬프트/리플렉션이면 같은 실행 ID (재시작 시 상태 파일을 찾는 키)"""
+        key = "\n".join([self.reviewer.model, self.reviewer.prompt_version, str(reflection)] + sorted(custom_ids))
+        return _short_hash(key)
+
+    @staticmethod
+    def _request_id(custom_id: str, sample: int, samples: int) -> str:
+        """배치 요청 ID (ensemble 방식에서는 논문 하나에 요청 여러 개)"""
+        return custom_id if samples == 1 else f"{custom_id}#{sample}"
+
+    def _load_state(self, state_path: Path, run_id: str, reflection: int) -> dict:
+        if state_path.exists():
+            print(f"==> resuming batch review run {run_id}")
+            return json.loads(state_path.read_text(encoding="utf-8"))
+        return {
+            "run_id": run_id,
+            "model": self.reviewer.model,
+            "prompt_version": self.reviewer.prompt_version,
+            "reflection": reflection,
+            "rounds": {},
+            "responses": {},
+            "reviews": {},
+            "usage": {},
+            "finished": [],
+        }
+
+    def _save_state(self, state_path: Path, state: dict) -> None:
+        # 임시 파일에 쓴 뒤 rename하여 중간에 중단되어도 상태 파일이 깨지지 않도록 함
+        tmp_path = state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, state_path)
+
+    def _build_messages(self, paper_content: str, responses: list[str], reflection: int) -> list[dict]:
+        """저장된 이전 라운드 응답으로 다음 라운드 요청 메시지 재구성"""
+        messages = self.reviewer.build_review_messages(paper_content)
+        for round_num, content in enumerate(responses, start=1):
+            messages.append({'role': 'assistant', 'content': content})
+            messages.append(self.reviewer.build_reflection_message(round_num, reflection))
+        return messages
+
+    async def _find_batch(self, input_file_id: str):
+        """입력 파일로 이미 만든 배치 (배치 ID를 저장하기 전에 중단된 경우 확인용, 없으면 None)"""
+        await rate_limit(OPENAI)
+        page = await self.reviewer.client.batches.list(limit=100)
+        for batch in page.data:
+            if batch.input_file_id == input_file_id:
+                return batch
+        return None
+
+    async def _submit_round(self, run_id: str, round_index: int, requests: list[dict], round_state: dict, save) -> None:
+        """
+        배치 입력 파일 작성 후 업로드하고 배치 생성
+
+        각 API 호출 직후 round_state에 ID를 기록하고 save()로 상태 파일에 저장하므로,
+        업로드 후 중단되면 다시 업로드하지 않고 배치 생성 후 중단되면 그 배치를 찾아 이어서 사용
+
+        Args:
+            run_id: 실행 ID
+            round_index: 라운드 번호
+            requests: 배치 요청 리스트
+            round_state: 라운드 상태 (input_file_id, batch_id가 기록됨)
+            save: 상태 파일 저장 함수
+        """
+        if round_state.get("input_file_id"):
+            batch = await self._find_batch(round_state["input_file_id"])
+            if batch is not None:
+                print(f"==> batch round {round_index} already submitted: {batch.id}")
+                round_state["batch_id"] = batch.id
+                save()
+                return
+        else:
+            input_path = self.batch_dir / f"{run_id}-round{round_index}.jsonl"
+            with open(input_path, "w", encoding="utf-8") as f:
+                for request in requests:
+                    f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+            await rate_limit(OPENAI)
+            with open(input_path, "rb") as f:
+                input_file = await self.reviewer.client.files.create(file=f, purpose="batch")
+            round_state["input_file_id"] = input_file.id
+            save()
+            input_path.unlink(missing_ok=True)
+
+        await rate_limit(OPENAI)
+        batch = await self.reviewer.client.batches.create(
+            input_file_id=round_state["input_file_id"],
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"run_id": run_id, "round": str(round_index)},
+        )
+        round_state["batch_id"] = batch.id
+        save()
+        print(f"==> batch round {round_index} submitted: {batch.id} ({len(requests)} requests)")
+
+    async def _wait_for_batch(self, batch_id: str):
+        """배치가 끝날 때까지 polling"""
+        while True:
+            batch = await self.reviewer.client.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            progress = f"{counts.completed}/{counts.total} (failed: {counts.failed})" if counts else "-"
+            print(f"==> batch {batch_id}: {batch.status} {progress}")
+            if batch.status in self.TERMINAL_STATUSES:
+                return batch
+            await asyncio.sleep(self.poll_interval)
+
+    async def _read_output(self, batch) -> dict[str, ChatCompletion]:
+        """배치 결과 파일에서 custom_id → ChatCompletion (실패한 요청은 제외)"""
+        results = {}
+        if not batch.output_file_id:
+            return results
+
+        output = await self.reviewer.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                print(f"batch request {item.get('custom_id')} failed: {item.get('error') or response.get('status_code')}")
+                continue
+            results[item["custom_id"]] = ChatCompletion.model_validate(response["body"])
+        return results
+
+    async def review_many(self, papers: dict[str, str], reflection: int = 3) -> dict[str, ReviewSession]:
+        """
+        여러 논문을 배치로 리뷰
+        
+        ensemble 방식이면 논문마다 독립적인 최초 리뷰 여러 개를 한 배치로 요청하고,
+        결과는 review_ensembling(일반 API)으로 합침
+        
+        Args:
+            papers: {custom_id(논문 키): 논문 텍스트}
+            reflection: 리플렉션 라운드 수 (reflection 방식에서만 사용)
+        
+        Returns:
+            {custom_id: 리뷰 세션} (JSON 파싱에 실패한 논문은 reviews가 비어 있거나 일부만 있음)
+        """
+        if not papers:
+            return {}
+
+        reflection = self.reviewer.review_rounds(reflection)
+        samples = self.reviewer.ensemble_size if self.reviewer.review_mode == REVIEW_MODE_ENSEMBLE else 1
+
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        run_id = self._run_id(list(papers), reflection)
+        state_path = self.batch_dir / f"{run_id}.json"
+        state = self._load_state(state_path, run_id, reflection)
+
+        for round_index in range(reflection + 1):
+            schema = PaperReview if round_index == 0 else PaperReflection
+            round_state = state["rounds"].setdefault(str(round_index), {})
+            if round_state.get("status") == "done":
+                continue
+
+            if not round_state.get("batch_id"):
+                custom_ids = round_state.get("custom_ids") or [
+                    custom_id for custom_id in papers if custom_id not in state["finished"]
+                ]
+                if not custom_ids:
+                    break
+
+                kwargs = self.reviewer.request_options(self.reviewer.review_cache_key, schema)
+                requests = [
+                    {
+                        "custom_id": self._request_id(custom_id, sample, samples),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.reviewer.model,
+                            "messages": self._build_messages(papers[custom_id], state["responses"].get(custom_id, []), reflection),
+                            **kwargs,
+                        },
+                    }
+                    for custom_id in custom_ids
+                    for sample in range(samples)
+                ]
+                round_state["custom_ids"] = custom_ids
+                await self._submit_round(
+                    run_id, round_index, requests, round_state, lambda: self._save_state(state_path, state)
+                )
+
+            batch = await self._wait_for_batch(round_state["batch_id"])
+            if batch.status in ("failed", "cancelled") and not batch.output_file_id:
+                # 다음 실행에서 이 라운드를 다시 업로드/제출하도록 입력 파일 ID와 배치 ID 제거
+                round_state.pop("batch_id", None)
+                round_state.pop("input_file_id", None)
+                self._save_state(state_path, state)
+                raise RuntimeError(f"Batch {batch.id} {batch.status}: {batch.errors}")
+
+            results = await self._read_output(batch)
+            for custom_id in round_state["custom_ids"]:
+                for sample in range(samples):
+                    completion = results.get(self._request_id(custom_id, sample, samples))
+                    if completion is None:
+                        state["finished"].append(custom_id)
+                        continue
+
+                    content = completion.choices[0].message.content or ""
+                    state["responses"].setdefault(custom_id, []).append(content)
+                    usage = ReviewSession()
+                    usage.add_usage(completion)
+                    for key, value in usage.usage.items():
+                        state["usage"].setdefault(custom_id, {}).setdefault(key, 0)
+                        state["usage"][custom_id][key] += value
+
+                    try:
+                        review = parse_review_response(content, schema)
+                    except ValueError as e:
+                        print(f"batch review {custom_id} round {round_index} JSON parsing failed: {e}")
+                        state["finished"].append(custom_id)
+                        continue
+
+                    reviews = state["reviews"].setdefault(custom_id, [])
+                    reviews.append(review.model_dump(exclude={"is_done"}))
+                    if round_index > 0 and (
+                        review.is_done or 'i am done' in content.lower() or reviews_converged(reviews[-2], reviews[-1])
+                    ):
+                        state["finished"].append(custom_id)
+
+            round_state["status"] = "done"
+            self._save_state(state_path, state)
+            print(f"==> batch round {round_index} done.")
+
+        sessions = {}
+        for custom_id, paper_content in papers.items():
+            session = ReviewSession()
+            responses = state["responses"].get(custom_id, [])
+            if samples > 1:
+                session.messages = self.reviewer.build_review_messages(paper_content)
+            else:
+                messages = self._build_messages(paper_content, responses, reflection)
+                # 마지막 응답 뒤에 붙은 (보내지 않은) 리플렉션 요청 제외
+                session.messages = messages[:-1] if responses else messages
+            session.reviews = state["reviews"].get(custom_id, [])
+            session.add_usage_dict(state["usage"].get(custom_id, {}))
+            sessions[custom_id] = session
+
+        if samples > 1:
+            await asyncio.gather(
+                *(self.reviewer.review_ensembling(session) for session in sessions.values() if len(session.reviews) > 1),
+                return_exceptions=True
+            )
+        return sessions
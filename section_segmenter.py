@@ -0,0 +1,204 @@
+"""
+논문 섹션 분할 모듈
+
+PDF에서 추출한 텍스트에서 섹션 제목(Abstract, Introduction, Method, Experiments,
+Conclusion, References, Appendix 등)을 찾아 섹션 단위로 나누고,
+리뷰에 필요 없는 부분(저자 목록, 참고문헌, 감사의 글, 부록)을 뺀 리뷰용 텍스트를 만듦
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from models import PaperSection
+
+
+# 섹션 종류 (제목 키워드, 앞에 있을수록 우선 - 예: "Experimental Results and Discussion"은 experiments)
+SECTION_KEYWORDS: List[Tuple[str, re.Pattern]] = [
+    ("abstract", re.compile(r'^abstract\b')),
+    ("introduction", re.compile(r'^introduction\b')),
+    ("references", re.compile(r'^(?:references|bibliography|works cited)\b')),
+    ("acknowledgments", re.compile(r'^acknowledge?ments?\b')),
+    ("appendix", re.compile(r'^(?:appendix|appendices|supplementary)\b')),
+    ("conclusion", re.compile(r'\bconclu(?:sion|sions|ding)\b|^summary\b|\bfuture work\b')),
+    ("related_work", re.compile(r'\brelated work\b|^background\b|^preliminar|\bprior work\b')),
+    ("limitations", re.compile(r'\blimitations?\b|\bbroader impact')),
+    ("experiments", re.compile(r'\bexperiment|\bevaluation\b|\bresults?\b|\bempirical\b|\bbenchmark')),
+    ("discussion", re.compile(r'\bdiscussion\b|\banalysis\b|\bablation')),
+    ("method", re.compile(r'\bmethod|\bapproach\b|\bmodel\b|\bframework\b|\bproposed\b|\balgorithm|\barchitecture\b')),
+]
+
+# 리뷰용 텍스트에서 빼는 섹션 종류
+DROPPED_SECTION_KINDS = ("references", "acknowledgments", "appendix")
+
+# 참고문헌/부록 제목은 텍스트 앞부분(목차, 본문의 언급)에서 오인하지 않도록 이 비율 이후에서만 인정
+_TAIL_HEADING_MIN_POSITION = 0.3
+
+# 섹션 제목 후보 줄 (번호는 숫자, 로마 숫자, 부록의 알파벳)
+_HEADING_LINE = re.compile(
+    r'^[ \t]*(?:(?P<number>\d{1,2}|[IVX]{1,4}|[A-H])\.?[ \t]+)?'
+    r'(?P<title>[A-Z][A-Za-z][A-Za-z0-9 \-:&,\'/()]{0,78})[ \t]*$',
+    re.MULTILINE
+)
+
+# 같은 줄에 본문이 이어지는 초록 제목 (예: "Abstract—We propose ...", "Abstract: ...")
+_INLINE_ABSTRACT = re.compile(r'^[ \t]*abstract[ \t]*[.:—–-][ \t]*(?=\S)', re.IGNORECASE | re.MULTILINE)
+
+# 번호 없는 제목으로 인정하는 최대 단어 수 / 번호 있는 제목의 최대 단어 수
+_MAX_UNNUMBERED_HEADING_WORDS = 4
+_MAX_NUMBERED_HEADING_WORDS = 10
+
+_ROMAN_NUMERALS = {"I": 1, "II": 2, "III": 3, "IV": 4, "V": 5, "VI": 6, "VII": 7, "VIII": 8, "IX": 9, "X": 10}
+
+
+def classify_heading(title: str) -> str:
+    """
+    섹션 제목으로 섹션 종류 판단
+
+    Args:
+        title: 섹션 제목 (번호 제외)
+
+    Returns:
+        섹션 종류 (SECTION_KEYWORDS의 키, 해당 없으면 "other")
+    """
+    normalized = " ".join(title.lower().split())
+    for kind, pattern in SECTION_KEYWORDS:
+        if pattern.search(normalized):
+            return kind
+    return "other"
+
+
+def _heading_number(number: Optional[str]) -> Optional[int]:
+    """섹션 번호를 정수로 (알파벳 번호나 번호 없음은 None)"""
+    if number is None:
+        return None
+    if number.isdigit():
+        return int(number)
+    return _ROMAN_NUMERALS.get(number)
+
+
+def _find_headings(text: str) -> List[Tuple[int, str, str]]:
+    """
+    섹션 제목 위치 찾기
+
+    Returns:
+        [(시작 위치, 섹션 종류, 제목)] (위치 순)
+    """
+    headings = []
+    last_number = 0
+    last_numbered_index = None
+    in_tail = False
+    tail_min_position = int(len(text) * _TAIL_HEADING_MIN_POSITION)
+
+    inline_abstract = _INLINE_ABSTRACT.search(text)
+    if inline_abstract:
+        headings.append((inline_abstract.start(), "abstract", "Abstract"))
+
+    for match in _HEADING_LINE.finditer(text):
+        title = match.group("title").strip()
+        words = title.split()
+        if title.endswith((".", ",", ":")):
+            continue
+
+        kind = classify_heading(title)
+        raw_number = match.group("number")
+        number = _heading_number(raw_number)
+
+        if raw_number is None:
+            # 번호 없는 제목은 알려진 섹션 이름일 때만 인정 (예: "Abstract", "References")
+            if kind == "other" or len(words) > _MAX_UNNUMBERED_HEADING_WORDS:
+                continue
+        elif number is None:
+            # 알파벳 번호(A, B, ...)는 참고문헌 이후 부록에서만 인정
+            if not in_tail:
+                continue
+            kind = "appendix"
+        else:
+            # 번호 있는 제목은 다음 번호이거나 알려진 섹션 이름일 때만 인정 (번호 목록, 표 오인 방지)
+            if len(words) > _MAX_NUMBERED_HEADING_WORDS:
+                continue
+            previous = headings[last_numbered_index] if last_numbered_index is not None and last_numbered_index < len(headings) else None
+            if number == last_number and kind != "other" and previous is not None and previous[1] == "other":
+                # 같은 번호의 앞 후보가 본문 번호 목록이었던 경우 (예: "2 Better training" 다음 "2 Related Work")
+                del headings[last_numbered_index]
+            elif number != last_number + 1 and (kind == "other" or number <= last_number):
+                continue
+            last_number = number
+            last_numbered_index = len(headings)
+
+        if kind in DROPPED_SECTION_KINDS:
+            if match.start() < tail_min_position:
+                continue
+            in_tail = True
+        elif in_tail and kind != "acknowledgments":
+            # 참고문헌 이후의 섹션은 부록
+            kind = "appendix"
+
+        if headings and headings[-1][0] == match.start():
+            continue
+        headings.append((match.start(), kind, title))
+
+    headings.sort(key=lambda heading: heading[0])
+    return headings
+
+
+def segment_paper(text: str) -> List[PaperSection]:
+    """
+    논문 텍스트를 섹션 단위로 나눔
+
+    첫 제목 앞부분(제목, 저자, 소속)은 "front" 섹션이며, 섹션 텍스트를 순서대로 이으면 원래 텍스트가 됨
+
+    Args:
+        text: 추출된 논문 텍스트
+
+    Returns:
+        섹션 리스트 (제목을 찾지 못하면 전체가 "front" 섹션 하나)
+    """
+    headings = _find_headings(text)
+    boundaries = [(0, "front", "")] + [heading for heading in headings if heading[0] > 0]
+    if headings and headings[0][0] == 0:
+        boundaries = headings
+
+    sections: List[PaperSection] = []
+    for index, (start, kind, title) in enumerate(boundaries):
+        end = boundaries[index + 1][0] if index + 1 < len(boundaries) else len(text)
+        sections.append({"kind": kind, "title": title, "text": text[start:end]})
+    return sections
+
+
+def _title_line(front: str, max_length: int = 200) -> str:
+    """앞부분에서 논문 제목(첫 줄)만 남김 (저자 목록, 소속, 이메일 제외)"""
+    for line in front.splitlines():
+        if line.strip():
+            return line.strip()[:max_length] + "\n\n"
+    return ""
+
+
+def build_review_view(text: str) -> Tuple[str, List[str]]:
+    """
+    리뷰용 텍스트 생성 (저자 목록, 참고문헌, 감사의 글, 부록 제외)
+
+    섹션을 찾지 못하면 원래 텍스트를 그대로 사용
+
+    Args:
+        text: 추출된 논문 텍스트
+
+    Returns:
+        (리뷰용 텍스트, 뺀 섹션 종류 리스트)
+    """
+    sections = segment_paper(text)
+    if len(sections) <= 1:
+        return text, []
+
+    has_abstract = any(section["kind"] == "abstract" for section in sections)
+    parts = []
+    dropped = []
+    for section in sections:
+        if section["kind"] in DROPPED_SECTION_KINDS:
+            if section["kind"] not in dropped:
+                dropped.append(section["kind"])
+        elif section["kind"] == "front" and has_abstract:
+            # 초록을 찾은 경우에만 앞부분을 제목으로 줄임 (못 찾으면 앞부분에 초록이 있을 수 있음)
+            parts.append(_title_line(section["text"]))
+        else:
+            parts.append(section["text"])
+    return "".join(parts), dropped
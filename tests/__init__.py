@@ -0,0 +1,18 @@
+"""
+단위 테스트
+
+config 모듈은 import 시 필수 환경변수를 검사하므로 테스트용 값을 먼저 설정함.
+전역 논문 카탈로그/실행 저널/리뷰 저장소는 끄고, 필요한 테스트에서 임시 디렉토리에 직접 만들어 사용
+실행: python -m unittest discover -s tests -t .
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("CRAWLER_SECRET_KEY", "test")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("PAPER_CATALOG_ENABLED", "false")
+os.environ.setdefault("PAPER_JOURNAL_ENABLED", "false")
+os.environ.setdefault("REVIEW_CACHE_ENABLED", "false")
@@ -0,0 +1,205 @@
+"""
+OpenAI Batch API 로컬 대역 서버 (테스트용)
+
+파일 업로드 → 배치 생성 → 상태 조회 → 결과 파일 다운로드 흐름만 구현하며,
+배치 요청마다 응답 스키마에 맞는 고정 리뷰 JSON을 돌려줌.
+배치는 처음 조회할 때 in_progress, 그다음부터 completed 상태
+
+단독 실행 (OPENAI_BASE_URL=http://127.0.0.1:8080/v1 로 연결):
+    python -m tests.fake_openai_server --port 8080
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+REVIEW = {
+    "content": "Summary: a solid paper. Strengths: clear. Weaknesses: limited evaluation.",
+    "recommendation": "Accept",
+    "overall_score": 7,
+    "confidence": 4,
+}
+
+
+class FakeOpenAIState:
+    """업로드한 파일과 배치 (요청 스레드 간 공유)"""
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, dict] = {}
+        self.polls: Dict[str, int] = {}
+        self.requests: List[str] = []
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def new_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids)}"
+
+
+def _completion(request: dict) -> dict:
+    """배치 요청 하나에 대한 Chat Completion 응답 본문"""
+    review = dict(REVIEW)
+    # 리플렉션 요청(대화에 assistant 응답이 있음)에는 is_done을 붙여 한 번에 끝나게 함
+    if any(message["role"] == "assistant" for message in request["body"]["messages"]):
+        review["is_done"] = True
+    return {
+        "id": f"chatcmpl-{request['custom_id']}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request["body"]["model"],
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": json.dumps(review)}, "finish_reason": "stop"}
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+    }
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    state: FakeOpenAIState
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send_json(self, data: dict, status: int = 200) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _batch_object(self, batch: dict) -> dict:
+        return {
+            "id": batch["id"],
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+            "created_at": batch["created_at"],
+            "input_file_id": batch["input_file_id"],
+            "output_file_id": batch.get("output_file_id"),
+            "status": batch["status"],
+            "metadata": batch["metadata"],
+            "request_counts": batch["request_counts"],
+        }
+
+    def _complete_batch(self, batch: dict) -> None:
+        lines = self.state.files[batch["input_file_id"]].decode("utf-8").splitlines()
+        output = []
+        for line in lines:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            output.append(json.dumps({
+                "id": f"batch-req-{request['custom_id']}",
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "request_id": request["custom_id"], "body": _completion(request)},
+                "error": None,
+            }))
+        output_file_id = self.state.new_id("file")
+        self.state.files[output_file_id] = ("\n".join(output) + "\n").encode("utf-8")
+        batch["output_file_id"] = output_file_id
+        batch["status"] = "completed"
+        batch["request_counts"] = {"total": len(output), "completed": len(output), "failed": 0}
+
+    def do_POST(self) -> None:
+        with self.state.lock:
+            self.state.requests.append(f"POST {self.path}")
+            if self.path == "/v1/files":
+                # multipart/form-data에서 file 파트만 꺼냄
+                message = BytesParser().parsebytes(
+                    f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode("utf-8") + self._read_body()
+                )
+                content = next(
+                    part.get_payload(decode=True) for part in message.get_payload()
+                    if part.get_param("name", header="content-disposition") == "file"
+                )
+                file_id = self.state.new_id("file")
+                self.state.files[file_id] = content
+                self._send_json({
+                    "id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+                    "filename": "batch.jsonl", "purpose": "batch", "status": "processed",
+                })
+            elif self.path == "/v1/batches":
+                data = json.loads(self._read_body())
+                batch_id = self.state.new_id("batch")
+                batch = {
+                    "id": batch_id,
+                    "created_at": int(time.time()),
+                    "input_file_id": data["input_file_id"],
+                    "metadata": data.get("metadata"),
+                    "status": "in_progress",
+                    "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                }
+                self.state.batches[batch_id] = batch
+                self._send_json(self._batch_object(batch))
+            else:
+                self._send_json({"error": {"message": f"unknown path {self.path}"}}, status=404)
+
+    def do_GET(self) -> None:
+        with self.state.lock:
+            self.state.requests.append(f"GET {self.path}")
+            path = self.path.split("?", 1)[0]
+            parts = path.strip("/").split("/")
+            if path == "/v1/batches":
+                batches = sorted(self.state.batches.values(), key=lambda batch: batch["created_at"], reverse=True)
+                self._send_json({
+                    "object": "list", "data": [self._batch_object(batch) for batch in batches], "has_more": False,
+                })
+            elif len(parts) == 3 and parts[:2] == ["v1", "batches"] and parts[2] in self.state.batches:
+                batch = self.state.batches[parts[2]]
+                self.state.polls[batch["id"]] = self.state.polls.get(batch["id"], 0) + 1
+                if batch["status"] == "in_progress" and self.state.polls[batch["id"]] > 1:
+                    self._complete_batch(batch)
+                self._send_json(self._batch_object(batch))
+            elif len(parts) == 4 and parts[:2] == ["v1", "files"] and parts[3] == "content":
+                content = self.state.files[parts[2]]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+            else:
+                self._send_json({"error": {"message": f"unknown path {self.path}"}}, status=404)
+
+
+class FakeOpenAIServer:
+    """
+    백그라운드 스레드에서 실행되는 로컬 대역 서버 (with 블록에서 사용)
+    """
+
+    def __init__(self, port: int = 0):
+        self.state = FakeOpenAIState()
+        handler = type("Handler", (FakeOpenAIHandler,), {"state": self.state})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAI Batch API 로컬 대역 서버")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    with FakeOpenAIServer(args.port) as server:
+        print(f"listening on {server.base_url}")
+        threading.Event().wait()
@@ -0,0 +1,159 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from xml.etree.ElementTree import ParseError
+
+import arxiv
+import feedparser
+
+from arxiv_fetcher import transform_arxiv_to_paper_data
+from arxiv_native import ArxivRecord, AtomPageParser, parse_feed
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <link href="http://arxiv.org/api/query?search_query%3Dcat%3Acs.AI" rel="self" type="application/atom+xml"/>
+  <title type="html">ArXiv Query: search_query=cat:cs.AI&amp;id_list=&amp;start=0&amp;max_results=3</title>
+  <id>http://arxiv.org/api/abc</id>
+  <updated>2024-01-20T00:00:00-05:00</updated>
+  <opensearch:totalResults>1234</opensearch:totalResults>
+  <opensearch:startIndex>0</opensearch:startIndex>
+  <opensearch:itemsPerPage>3</opensearch:itemsPerPage>
+  <entry>
+    <id>http://arxiv.org/abs/2401.12345v2</id>
+    <updated>2024-01-19T10:00:00Z</updated>
+    <published>2024-01-18T17:59:58Z</published>
+    <title>Efficient Transformers:
+  A Survey of   Methods</title>
+    <summary>  We survey efficient transformers.
+Second line of the abstract.
+</summary>
+    <author>
+      <name>Alice Kim</name>
+      <arxiv:affiliation>Somewhere University</arxiv:affiliation>
+    </author>
+    <author>
+      <name>Bob Lee</name>
+    </author>
+    <arxiv:doi>10.1000/xyz.2024.1</arxiv:doi>
+    <link title="doi" href="http://dx.doi.org/10.1000/xyz.2024.1" rel="related"/>
+    <arxiv:comment>12 pages</arxiv:comment>
+    <link href="http://arxiv.org/abs/2401.12345v2" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.12345v2" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="stat.ML" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/cs/0112017v1</id>
+    <updated>2001-12-20T01:00:00Z</updated>
+    <published>2001-12-20T00:40:12Z</published>
+    <title>An Old-Style Identifier</title>
+    <summary>Papers before 2007 use archive/number identifiers.</summary>
+    <author>
+      <name>Carol Park</name>
+    </author>
+    <link href="http://arxiv.org/abs/cs/0112017v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/cs/0112017v1" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <updated>2024-01-01T00:00:00Z</updated>
+    <published>2024-01-01T00:00:00Z</published>
+    <title>DOI Given as a URL &amp; Escaped Title</title>
+    <summary>Abstract.</summary>
+    <author>
+      <name>Dana Choi</name>
+    </author>
+    <arxiv:doi>https://doi.org/10.1000/already-url</arxiv:doi>
+    <link href="http://arxiv.org/abs/2401.00001v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.00001v1" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.CV" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CV" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+def library_paper_data(feed: bytes) -> list:
+    """arxiv 패키지 경로로 파싱한 PaperData (feedparser → arxiv.Result)"""
+    return [
+        transform_arxiv_to_paper_data(arxiv.Result._from_feed_entry(entry))
+        for entry in feedparser.parse(feed).entries
+    ]
+
+
+class ParseFeedTest(unittest.TestCase):
+    def test_matches_arxiv_library(self):
+        records, _ = parse_feed([FEED])
+
+        self.assertEqual([record.to_paper_data() for record in records], library_paper_data(FEED))
+
+    def test_fields(self):
+        records, total_results = parse_feed([FEED])
+        first, old_style, doi_url = (record.to_paper_data() for record in records)
+
+        self.assertEqual(total_results, 1234)
+        self.assertEqual(first["paperId"], "2401.12345v2")
+        self.assertEqual(first["title"], "Efficient Transformers: A Survey of Methods")
+        self.assertEqual(first["doi"], "https://doi.org/10.1000/xyz.2024.1")
+        self.assertEqual(first["pdfUrl"], "http://arxiv.org/pdf/2401.12345v2.pdf")
+        self.assertEqual(first["issuedAt"], "2024-01-18T17:59:58Z")
+        self.assertEqual(json.loads(first["authors"]), ["Alice Kim", "Bob Lee"])
+        self.assertEqual(len(json.loads(first["categories"])), 3)
+        self.assertEqual(old_style["doi"], f"arXiv:{old_style['paperId']}")
+        self.assertEqual(doi_url["doi"], "https://doi.org/10.1000/already-url")
+        self.assertEqual(doi_url["title"], "DOI Given as a URL & Escaped Title")
+
+    def test_old_style_id(self):
+        records, _ = parse_feed([FEED])
+        library = arxiv.Result._from_feed_entry(feedparser.parse(FEED).entries[1])
+
+        self.assertEqual(records[1].get_short_id(), "cs/0112017v1")
+        self.assertEqual(records[1].get_short_id(), library.get_short_id())
+        self.assertEqual(records[1].entry_id, library.entry_id)
+        self.assertEqual(records[1].published, library.published)
+
+    def test_result_interface(self):
+        records, _ = parse_feed([FEED])
+
+        self.assertIsInstance(records[0], ArxivRecord)
+        self.assertEqual(records[0].entry_id, "http://arxiv.org/abs/2401.12345v2")
+        self.assertEqual(records[0].published, datetime(2024, 1, 18, 17, 59, 58, tzinfo=timezone.utc))
+        # transform_arxiv_to_paper_data는 레코드를 그대로 PaperData로 변환
+        self.assertEqual(transform_arxiv_to_paper_data(records[0]), records[0].to_paper_data())
+
+    def test_chunk_boundaries(self):
+        expected, _ = parse_feed([FEED])
+        for size in (1, 7, 64, 1000):
+            with self.subTest(chunk_size=size):
+                records, total_results = parse_feed(FEED[offset:offset + size] for offset in range(0, len(FEED), size))
+                self.assertEqual(total_results, 1234)
+                self.assertEqual([record.to_paper_data() for record in records], [record.to_paper_data() for record in expected])
+
+    def test_entry_without_id_skipped(self):
+        feed = FEED.replace(b"<id>http://arxiv.org/abs/2401.00001v1</id>", b"")
+
+        with self.assertLogs("arxiv_native", level="WARNING"):
+            records, _ = parse_feed([feed])
+
+        self.assertEqual([record.paperId for record in records], ["2401.12345v2", "0112017v1"])
+
+    def test_empty_feed(self):
+        feed = FEED.split(b"<entry>")[0].replace(b"1234", b"0") + b"</feed>\n"
+
+        self.assertEqual(parse_feed([feed]), ([], 0))
+
+    def test_truncated_feed_raises(self):
+        parser = AtomPageParser()
+        records = parser.feed(FEED[:FEED.index(b"</entry>") + len(b"</entry>")])
+
+        self.assertEqual(len(records), 1)
+        with self.assertRaises(ParseError):
+            parser.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+import arxiv
+
+import main
+import pipeline
+from arxiv_watermark import (
+    WatermarkFilter,
+    advance_watermark,
+    base_paper_id,
+    load_watermark,
+    save_watermark,
+    watermark_key,
+)
+from paper_catalog import DECISION_ACCEPTED, DECISION_REJECTED, result_paper_id
+from paper_reviewer_handler import ReviewError
+from pdf_buffer import PdfBuffer
+
+BASE = datetime(2026, 10, 10, 12, tzinfo=timezone.utc)
+
+
+def make_result(number: int, hours: float, version: int = 1) -> arxiv.Result:
+    return arxiv.Result(
+        entry_id=f"http://arxiv.org/abs/2610.{number:05d}v{version}",
+        published=BASE + timedelta(hours=hours),
+        title=f"paper {number}",
+    )
+
+
+def key(number: int, hours: float):
+    return f"2610.{number:05d}", BASE + timedelta(hours=hours)
+
+
+class WatermarkKeyTest(unittest.TestCase):
+    def test_base_id_drops_version(self):
+        self.assertEqual(base_paper_id(make_result(1, 0, version=3)), "2610.00001")
+        self.assertEqual(watermark_key(make_result(1, 5)), key(1, 5))
+
+    def test_old_style_id(self):
+        result = arxiv.Result(entry_id="http://arxiv.org/abs/cs/0112017v1", published=BASE)
+        self.assertEqual(base_paper_id(result), "cs/0112017")
+
+    def test_naive_published_is_utc(self):
+        result = arxiv.Result(entry_id="http://arxiv.org/abs/2610.00001v1", published=datetime(2026, 10, 10, 12))
+        self.assertEqual(watermark_key(result)[1], BASE)
+
+
+class AdvanceWatermarkTest(unittest.TestCase):
+    def test_nothing_processed(self):
+        self.assertIsNone(advance_watermark(None, []))
+
+    def test_moves_to_newest_and_keeps_lookback_ids(self):
+        watermark = advance_watermark(None, [key(1, 0), key(2, 10), key(3, 30)], lookback_hours=24)
+
+        self.assertEqual(watermark["published"], (BASE + timedelta(hours=30)).isoformat())
+        self.assertEqual(watermark["paper_ids"], ["2610.00002", "2610.00003"])
+
+    def test_never_moves_backwards(self):
+        watermark = advance_watermark(None, [key(1, 30)], lookback_hours=24)
+        advanced = advance_watermark(watermark, [key(2, 20)], lookback_hours=24)
+
+        self.assertEqual(advanced["published"], watermark["published"])
+        self.assertEqual(advanced["paper_ids"], ["2610.00001", "2610.00002"])
+
+    def test_failed_paper_caps_watermark(self):
+        watermark = advance_watermark(None, [key(1, 0), key(3, 30)], lookback_hours=0, pending=[key(2, 10)])
+
+        self.assertEqual(watermark["published"], (BASE + timedelta(hours=10)).isoformat())
+        self.assertNotIn("2610.00002", watermark["paper_ids"])
+        # 다음 실행에서 실패한 논문은 다시 가져오고 끝낸 논문은 건너뜀
+        watermark_filter = WatermarkFilter(watermark, lookback_hours=0)
+        self.assertFalse(watermark_filter.reached(make_result(2, 10)))
+        self.assertTrue(watermark_filter.is_new(make_result(2, 10)))
+        self.assertFalse(watermark_filter.is_new(make_result(3, 30)))
+        self.assertTrue(watermark_filter.reached(make_result(1, 0)))
+
+    def test_failed_paper_keeps_existing_watermark(self):
+        watermark = advance_watermark(None, [key(1, 30)])
+
+        self.assertEqual(advance_watermark(watermark, [], pending=[key(2, 40)])["published"], watermark["published"])
+        self.assertIsNone(advance_watermark(None, [], pending=[key(2, 40)]))
+
+    def test_retried_paper_removed_from_seen_ids(self):
+        watermark = {"published": (BASE + timedelta(hours=30)).isoformat(), "paper_ids": ["2610.00002"]}
+        advanced = advance_watermark(watermark, [key(3, 31)], pending=[key(2, 30)])
+
+        self.assertNotIn("2610.00002", advanced["paper_ids"])
+
+
+class WatermarkFilterTest(unittest.TestCase):
+    def test_without_watermark_everything_is_new(self):
+        watermark_filter = WatermarkFilter(None, lookback_hours=24)
+
+        self.assertFalse(watermark_filter.reached(make_result(1, -1000)))
+        self.assertTrue(watermark_filter.is_new(make_result(1, -1000)))
+
+    def test_lookback(self):
+        watermark = {"published": BASE.isoformat(), "paper_ids": ["2610.00001"]}
+        watermark_filter = WatermarkFilter(watermark, lookback_hours=24)
+
+        self.assertFalse(watermark_filter.reached(make_result(2, -24)))
+        self.assertTrue(watermark_filter.reached(make_result(2, -25)))
+        # 새 버전도 같은 논문으로 취급
+        self.assertFalse(watermark_filter.is_new(make_result(1, 0, version=2)))
+
+
+class WatermarkFileTest(unittest.TestCase):
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "nested" / "watermark.json")
+            watermark = advance_watermark(None, [key(1, 0)])
+            save_watermark(path, watermark)
+
+            self.assertEqual(load_watermark(path), watermark)
+
+    def test_missing_or_corrupt_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "watermark.json"
+            self.assertIsNone(load_watermark(str(path)))
+            path.write_text("{not json", encoding="utf-8")
+            self.assertIsNone(load_watermark(str(path)))
+
+
+class FinishedJobTest(unittest.TestCase):
+    """워터마크에 반영할 논문(업로드 또는 부적절 판단)만 finished로 표시되는지"""
+
+    def _record(self, *args, **kwargs) -> dict:
+        job = {"paper_data": {"paperId": "2610.00001v1"}}
+        asyncio.run(pipeline.record_stage(job, *args, **kwargs))
+        return job
+
+    def test_terminal_stages(self):
+        self.assertTrue(self._record("triage", DECISION_REJECTED).get("finished"))
+        self.assertTrue(self._record("review", DECISION_REJECTED).get("finished"))
+        self.assertTrue(self._record("upload", uploaded=True).get("finished"))
+
+    def test_intermediate_stages(self):
+        self.assertFalse(self._record("download").get("finished"))
+        self.assertFalse(self._record("review", DECISION_ACCEPTED).get("finished"))
+
+
+class ProcessPapersFinishedTest(unittest.TestCase):
+    """리뷰 오류로 실패한 논문은 finished_ids에서 빠져 워터마크가 넘어가지 않는지"""
+
+    async def _review(self, pdf_content, reviewer, paper_id):
+        if paper_id.startswith("2610.00002"):
+            return None
+        if paper_id.startswith("2610.00003"):
+            raise ReviewError("API 오류")
+        return {"recommendation": "Accept"}
+
+    async def _review_batch(self, papers, reviewer):
+        results = []
+        for pdf_content, paper_id in papers:
+            try:
+                results.append(await self._review(pdf_content, reviewer, paper_id))
+            except ReviewError as e:
+                results.append(e)
+        return results
+
+    async def _download(self, job):
+        job["pdf_content"] = PdfBuffer.from_bytes(b"%PDF")
+        return True
+
+    async def _upload(self, job):
+        await pipeline.record_stage(job, "upload", uploaded=True)
+        return True
+
+    def test_review_error_not_finished(self):
+        papers = [make_result(number, number) for number in (1, 2, 3)]
+        patches = [
+            mock.patch.object(main, "initialize_reviewer", return_value=mock.Mock()),
+            mock.patch.object(pipeline, "review_paper", side_effect=self._review),
+            mock.patch.object(pipeline, "review_papers_batch", side_effect=self._review_batch),
+            mock.patch("builtins.print"),
+        ]
+        for module in (main, pipeline):
+            patches += [
+                mock.patch.object(module, "stage_triage", mock.AsyncMock(return_value=True)),
+                mock.patch.object(module, "stage_download", side_effect=self._download),
+                mock.patch.object(module, "stage_summarize", mock.AsyncMock(return_value=True)),
+                mock.patch.object(module, "stage_upload", side_effect=self._upload),
+            ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        for mode in ("concurrent", "staged", "batch"):
+            with self.subTest(mode=mode), mock.patch.object(main, "PIPELINE_MODE", mode):
+                results = asyncio.run(main.process_papers(list(papers), mode="scheduled"))
+
+                self.assertEqual(results["finished_ids"], ["2610.00001v1", "2610.00002v1"])
+                fetched_keys = {result_paper_id(paper): watermark_key(paper) for paper in papers}
+                watermark = advance_watermark(
+                    None,
+                    [paper_key for paper_id, paper_key in fetched_keys.items() if paper_id in results["finished_ids"]],
+                    lookback_hours=0,
+                    pending=[paper_key for paper_id, paper_key in fetched_keys.items() if paper_id not in results["finished_ids"]],
+                )
+                self.assertEqual(watermark["published"], (BASE + timedelta(hours=2)).isoformat())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from reviewer import BatchReviewRunner, Reviewer
+from tests.fake_openai_server import REVIEW, FakeOpenAIServer
+
+PROMPTS_DIR = str(Path(__file__).resolve().parent.parent / "prompts" / "paper_review")
+
+PAPERS = {
+    "2401.00001v1": "Title: First paper\n\n1 Introduction\nWe study things.",
+    "2401.00002v1": "Title: Second paper\n\n1 Introduction\nWe study other things.",
+}
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+class BatchReviewRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeOpenAIServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+        with mock.patch.dict(os.environ, {"OPENAI_BASE_URL": self.server.base_url}):
+            self.reviewer = Reviewer(prompts_dir=PROMPTS_DIR)
+        self.runner = BatchReviewRunner(self.reviewer, self.tmp.name, poll_interval=0)
+
+    def _state(self) -> dict:
+        (state_path,) = Path(self.tmp.name).glob("*.json")
+        return json.loads(state_path.read_text(encoding="utf-8"))
+
+    def test_review_and_reflection_rounds(self):
+        sessions = asyncio.run(self.runner.review_many(PAPERS, reflection=2))
+
+        self.assertEqual(set(sessions), set(PAPERS))
+        for session in sessions.values():
+            # 최초 리뷰 + 리플렉션 1회 (is_done으로 종료)
+            self.assertEqual(len(session.reviews), 2)
+            self.assertEqual(session.final_review["overall_score"], REVIEW["overall_score"])
+            self.assertEqual(session.usage["total_tokens"], 240)
+
+        # 모든 논문이 첫 리플렉션에서 끝났으므로 배치는 두 개만 제출
+        self.assertEqual(len(self.server.state.batches), 2)
+        state = self._state()
+        self.assertEqual(state["rounds"]["0"]["status"], "done")
+        self.assertEqual(sorted(state["finished"]), sorted(PAPERS))
+        self.assertEqual(list(Path(self.tmp.name).glob("*.jsonl")), [])
+
+    def test_crash_after_batch_create_does_not_resubmit(self):
+        create = self.reviewer.client.batches.create
+
+        async def create_then_crash(**kwargs):
+            await create(**kwargs)
+            raise SimulatedCrash()
+
+        with mock.patch.object(self.reviewer.client.batches, "create", create_then_crash):
+            with self.assertRaises(SimulatedCrash):
+                asyncio.run(self.runner.review_many(PAPERS, reflection=0))
+
+        # 업로드한 입력 파일 ID는 배치 생성 전에 저장됨
+        self.assertIn("input_file_id", self._state()["rounds"]["0"])
+        self.assertEqual(len(self.server.state.batches), 1)
+
+        sessions = asyncio.run(self.runner.review_many(PAPERS, reflection=0))
+
+        self.assertEqual(len(self.server.state.batches), 1)
+        self.assertEqual(sum(1 for request in self.server.state.requests if request == "POST /v1/files"), 1)
+        for session in sessions.values():
+            self.assertEqual(len(session.reviews), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
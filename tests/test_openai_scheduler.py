@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+import openai_scheduler
+from openai_scheduler import MinuteBudget
+
+
+class MinuteBudgetTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        clock = mock.patch.object(openai_scheduler.time, "monotonic", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_unlimited(self):
+        budget = MinuteBudget(0)
+        budget.consume(10 ** 9)
+
+        self.assertEqual(budget.wait_time(10 ** 9), 0.0)
+
+    def test_wait_until_refilled(self):
+        budget = MinuteBudget(60)
+        budget.consume(60)
+
+        self.assertEqual(budget.wait_time(1), 1.0)
+        self.assertEqual(budget.wait_time(30), 30.0)
+        self.now += 10
+        self.assertEqual(budget.wait_time(10), 0.0)
+        self.assertEqual(budget.wait_time(30), 20.0)
+
+    def test_refill_capped_at_limit(self):
+        budget = MinuteBudget(60)
+        budget.consume(30)
+        self.now += 600
+
+        self.assertEqual(budget.wait_time(60), 0.0)
+        self.assertEqual(budget.available, 60)
+        budget.consume(60)
+        self.assertEqual(budget.wait_time(1), 1.0)
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        budget = MinuteBudget(60)
+
+        self.assertEqual(budget.wait_time(600), 0.0)
+        budget.consume(600)
+        # 음수 잔량까지 모두 충전되어야 다음 요청을 보냄
+        self.assertEqual(budget.wait_time(1), 541.0)
+
+    def test_refund(self):
+        budget = MinuteBudget(60)
+        budget.consume(50)
+        budget.refund(40)
+
+        self.assertEqual(budget.available, 50)
+        budget.refund(-30)
+        self.assertEqual(budget.available, 20)
+        budget.refund(1000)
+        self.assertEqual(budget.available, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import arxiv
+
+import paper_catalog
+from paper_catalog import (
+    DECISION_ACCEPTED,
+    DECISION_REJECTED,
+    BloomFilter,
+    PaperCatalog,
+    filter_new_papers,
+    result_paper_id,
+    split_paper_id,
+)
+
+
+class SplitPaperIdTest(unittest.TestCase):
+    def test_versions(self):
+        self.assertEqual(split_paper_id("2401.12345v2"), ("2401.12345", 2))
+        self.assertEqual(split_paper_id("2401.12345"), ("2401.12345", 0))
+        self.assertEqual(split_paper_id("cs/0112017v1"), ("cs/0112017", 1))
+
+    def test_result_paper_id(self):
+        result = arxiv.Result(entry_id="http://arxiv.org/abs/2401.12345v2")
+        self.assertEqual(result_paper_id(result), "2401.12345v2")
+
+
+class BloomFilterTest(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [f"2401.{i:05d}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in keys))
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"2401.{i:05d}")
+
+        false_positives = sum(f"2402.{i:05d}" in bloom for i in range(10000))
+        # 목표 1%에 여유를 둠
+        self.assertLess(false_positives, 300)
+
+    def test_empty(self):
+        self.assertNotIn("2401.00001", BloomFilter(0))
+
+
+class PaperCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = str(Path(self.tmp.name) / "nested" / "papers.sqlite3")
+
+    def _catalog(self, use_bloom: bool = False) -> PaperCatalog:
+        return PaperCatalog(self.db_path, use_bloom=use_bloom)
+
+    def test_finished_only_after_upload_or_rejection(self):
+        catalog = self._catalog()
+        catalog.record("2401.00001v1", "download")
+        catalog.record("2401.00002v1", "review", DECISION_ACCEPTED)
+        catalog.record("2401.00003v1", "review", DECISION_REJECTED)
+        catalog.record("2401.00004v1", "review", DECISION_ACCEPTED)
+        catalog.record("2401.00004v1", "upload", uploaded=True)
+
+        finished = catalog.finished_ids(f"2401.0000{i}v1" for i in range(1, 6))
+
+        self.assertEqual(finished, {"2401.00003v1", "2401.00004v1"})
+
+    def test_decision_kept_across_later_stages(self):
+        catalog = self._catalog()
+        catalog.record("2401.00001v1", "triage", DECISION_REJECTED)
+        catalog.record("2401.00001v1", "download")
+
+        self.assertEqual(catalog.finished_ids(["2401.00001v1"]), {"2401.00001v1"})
+
+    def test_new_version_is_not_finished(self):
+        catalog = self._catalog()
+        catalog.record("2401.00001v1", "upload", uploaded=True)
+
+        self.assertEqual(catalog.finished_ids(["2401.00001v1", "2401.00001v2"]), {"2401.00001v1"})
+
+        # 새 버전 처리를 시작하면 이전 버전의 판단/업로드 여부는 초기화
+        catalog.record("2401.00001v2", "download")
+        self.assertEqual(catalog.finished_ids(["2401.00001v2"]), set())
+
+    def test_older_version_does_not_overwrite(self):
+        catalog = self._catalog()
+        catalog.record("2401.00001v2", "upload", uploaded=True)
+        catalog.record("2401.00001v1", "download")
+
+        self.assertEqual(catalog.finished_ids(["2401.00001v2"]), {"2401.00001v2"})
+
+    def test_persists_across_instances(self):
+        self._catalog().record("2401.00001v1", "review", DECISION_REJECTED)
+
+        self.assertEqual(self._catalog().finished_ids(["2401.00001v1"]), {"2401.00001v1"})
+
+    def test_forget(self):
+        catalog = self._catalog()
+        catalog.record("2401.00001v1", "review", DECISION_REJECTED)
+        catalog.record("2401.00002v1", "upload", uploaded=True)
+        catalog.record("2401.00003v1", "review", DECISION_REJECTED)
+
+        self.assertEqual(catalog.forget(rejected_only=True), 2)
+        self.assertEqual(catalog.finished_ids(["2401.00001v1", "2401.00002v1"]), {"2401.00002v1"})
+        self.assertEqual(catalog.forget("2401.00002v5"), 1)
+        self.assertEqual(catalog.stats(), {"업로드": 0, "부적절": 0})
+
+    def test_stats(self):
+        catalog = self._catalog()
+        catalog.record("2401.00001v1", "review", DECISION_REJECTED)
+        catalog.record("2401.00002v1", "upload", uploaded=True)
+        catalog.record("2401.00003v1", "download")
+
+        self.assertEqual(
+            catalog.stats(),
+            {"업로드": 1, "부적절": 1, "단계 review": 1, "단계 upload": 1, "단계 download": 1},
+        )
+
+    def test_bloom_matches_sqlite(self):
+        self._catalog().record("2401.00001v1", "upload", uploaded=True)
+        catalog = self._catalog(use_bloom=True)
+        catalog.record("2401.00002v1", "review", DECISION_REJECTED)
+        catalog.record("2401.00003v1", "download")
+
+        self.assertEqual(
+            catalog.finished_ids(["2401.00001v1", "2401.00002v1", "2401.00003v1", "2401.00004v1"]),
+            {"2401.00001v1", "2401.00002v1"},
+        )
+        catalog.forget("2401.00001")
+        self.assertEqual(catalog.finished_ids(["2401.00001v1"]), set())
+
+
+class FilterNewPapersTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.catalog = PaperCatalog(str(Path(tmp.name) / "papers.sqlite3"))
+        self.papers = [arxiv.Result(entry_id=f"http://arxiv.org/abs/2401.0000{i}v1") for i in range(1, 4)]
+
+    def test_skips_finished_and_keeps_order(self):
+        self.catalog.record("2401.00002v1", "upload", uploaded=True)
+
+        with mock.patch.object(paper_catalog, "get_paper_catalog", return_value=self.catalog):
+            remaining = filter_new_papers(self.papers)
+
+        self.assertEqual([result_paper_id(paper) for paper in remaining], ["2401.00001v1", "2401.00003v1"])
+
+    def test_without_catalog(self):
+        with mock.patch.object(paper_catalog, "get_paper_catalog", return_value=None):
+            self.assertEqual(filter_new_papers(self.papers), self.papers)
+
+    def test_catalog_error_processes_everything(self):
+        broken = mock.Mock()
+        broken.finished_ids.side_effect = OSError("disk I/O error")
+
+        with mock.patch.object(paper_catalog, "get_paper_catalog", return_value=broken):
+            with self.assertLogs("paper_catalog", level="ERROR"):
+                self.assertEqual(filter_new_papers(self.papers), self.papers)
+
+
+if __name__ == "__main__":
+    unittest.main()
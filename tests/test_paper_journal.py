@@ -0,0 +1,206 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import paper_journal
+from paper_journal import (
+    STAGE_DOWNLOADED,
+    STAGE_FETCHED,
+    STAGE_REJECTED,
+    STAGE_REVIEWED,
+    STAGE_SUMMARIZED,
+    STAGE_UPLOADED,
+    JournalLockedError,
+    PaperJournal,
+    close_journal,
+    open_journal,
+    remove_stale_journals,
+)
+
+
+def paper(number: int) -> dict:
+    return {"paperId": f"2401.0000{number}v1", "title": f"paper {number}"}
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal_dir = Path(tmp.name)
+
+    def _journal(self, run_id: str = "scheduled-20260101000000-abcdef") -> PaperJournal:
+        journal = PaperJournal(str(self.journal_dir), run_id, "scheduled")
+        self.addCleanup(journal._file.close)
+        return journal
+
+
+class ReplayTest(JournalTestCase):
+    def test_last_stage_per_paper(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1), paper(2), paper(3)])
+        journal.record("2401.00001v1", STAGE_DOWNLOADED)
+        journal.record("2401.00001v1", STAGE_REVIEWED, review_result={"score": 7})
+        journal.record("2401.00002v1", STAGE_REJECTED)
+        journal.close()
+
+        entries = self._journal(journal.run_id).replay()
+
+        self.assertEqual(entries["2401.00001v1"]["stage"], STAGE_REVIEWED)
+        self.assertEqual(entries["2401.00001v1"]["review_result"], {"score": 7})
+        self.assertEqual(entries["2401.00001v1"]["paper_data"], paper(1))
+        self.assertEqual(entries["2401.00002v1"]["stage"], STAGE_REJECTED)
+        self.assertEqual(entries["2401.00003v1"]["stage"], STAGE_FETCHED)
+
+    def test_terminal_stage_is_final(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1)])
+        journal.record("2401.00001v1", STAGE_UPLOADED)
+        journal.record("2401.00001v1", STAGE_DOWNLOADED)
+        journal.record_fetched([paper(1)])
+
+        self.assertEqual(journal.replay()["2401.00001v1"]["stage"], STAGE_UPLOADED)
+
+    def test_stages_never_move_backwards(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1)])
+        journal.record("2401.00001v1", STAGE_REVIEWED)
+        journal.record("2401.00001v1", STAGE_DOWNLOADED)
+
+        self.assertEqual(journal.replay()["2401.00001v1"]["stage"], STAGE_REVIEWED)
+
+    def test_torn_last_line_ignored(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1)])
+        journal.record("2401.00001v1", STAGE_DOWNLOADED)
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"paper": "2401.00001v1", "stage": "revi')
+
+        with self.assertLogs("paper_journal", level="WARNING"):
+            entries = self._journal(journal.run_id).replay()
+
+        self.assertEqual(entries["2401.00001v1"]["stage"], STAGE_DOWNLOADED)
+
+    def test_ai_response_round_trip(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1)])
+        ai_response = {"content": "summary", "thumbnail_bytes": b"\x89PNG\x00"}
+        journal.record("2401.00001v1", STAGE_SUMMARIZED, ai_response=ai_response)
+
+        self.assertEqual(journal.replay()["2401.00001v1"]["ai_response"], ai_response)
+
+    def test_missing_artifact_repeats_stage(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1)])
+        journal.record("2401.00001v1", STAGE_REVIEWED, review_result={"score": 7})
+        for artifact in journal.artifacts_dir.iterdir():
+            artifact.unlink()
+
+        with self.assertLogs("paper_journal", level="WARNING"):
+            entry = journal.replay()["2401.00001v1"]
+
+        self.assertEqual(entry["stage"], STAGE_DOWNLOADED)
+        self.assertNotIn("review_result", entry)
+
+    def test_old_style_id_artifact_name(self):
+        journal = self._journal()
+        journal.record_fetched([{"paperId": "cs/0112017v1", "title": "old"}])
+        journal.record("cs/0112017v1", STAGE_REVIEWED, review_result={"score": 5})
+
+        self.assertEqual(journal.replay()["cs/0112017v1"]["review_result"], {"score": 5})
+        self.assertTrue((journal.artifacts_dir / "cs_0112017v1.reviewed.json").exists())
+
+    def test_completed_close_removes_files(self):
+        journal = self._journal()
+        journal.record_fetched([paper(1)])
+        journal.record("2401.00001v1", STAGE_REVIEWED, review_result={"score": 7})
+        journal.close(completed=True)
+
+        self.assertFalse(journal.path.exists())
+        self.assertFalse(journal.artifacts_dir.exists())
+
+
+@unittest.skipIf(paper_journal.fcntl is None, "flock을 지원하지 않는 플랫폼")
+class JournalLockTest(JournalTestCase):
+    def setUp(self):
+        super().setUp()
+        patches = [
+            mock.patch.object(paper_journal, "PAPER_JOURNAL_ENABLED", True),
+            mock.patch.object(paper_journal, "PAPER_JOURNAL_DIR", str(self.journal_dir)),
+            mock.patch.object(paper_journal, "PAPER_JOURNAL_MAX_AGE_DAYS", 7),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_open_journal_is_locked(self):
+        journal = self._journal()
+
+        with self.assertRaises(JournalLockedError):
+            PaperJournal(str(self.journal_dir), journal.run_id, "scheduled")
+
+        journal.close()
+        self._journal(journal.run_id)
+
+    def test_new_run_keeps_other_journals(self):
+        live = self._journal("scheduled-20260101000000-aaaaaa")
+        crashed = self._journal("scheduled-20260101000001-bbbbbb")
+        crashed.close()
+
+        journal = open_journal("scheduled")
+        self.addCleanup(close_journal, journal, True)
+
+        self.assertTrue(live.path.exists())
+        self.assertTrue(crashed.path.exists())
+        self.assertNotIn(journal.run_id, (live.run_id, crashed.run_id))
+
+    def test_resume_skips_journal_in_use(self):
+        crashed = self._journal("scheduled-20260101000000-aaaaaa")
+        crashed.record_fetched([paper(1)])
+        crashed.close()
+        live = self._journal("scheduled-20260101000001-bbbbbb")
+        live.record_fetched([paper(2)])
+
+        journal = open_journal("scheduled", resume=True)
+        self.addCleanup(close_journal, journal, False)
+
+        self.assertEqual(journal.run_id, crashed.run_id)
+        self.assertEqual(list(journal.resumed), ["2401.00001v1"])
+
+    def test_resume_only_same_mode(self):
+        other = self._journal("latest-20260101000000-aaaaaa")
+        other.close()
+
+        journal = open_journal("scheduled", resume=True)
+        self.addCleanup(close_journal, journal, True)
+
+        self.assertNotEqual(journal.run_id, other.run_id)
+        self.assertEqual(journal.resumed, {})
+
+    def test_stale_journals_removed_unless_locked(self):
+        live = self._journal("scheduled-20260101000000-aaaaaa")
+        crashed = self._journal("scheduled-20260101000001-bbbbbb")
+        crashed.record("2401.00001v1", STAGE_REVIEWED, review_result={"score": 7})
+        crashed.close()
+        recent = self._journal("scheduled-20260101000002-cccccc")
+        recent.close()
+        old = time.time() - 8 * 86400
+        for journal in (live, crashed):
+            os.utime(journal.path, (old, old))
+
+        with self.assertLogs("paper_journal", level="WARNING"):
+            removed = remove_stale_journals(self.journal_dir, 7)
+
+        self.assertEqual(removed, 1)
+        self.assertTrue(live.path.exists())
+        self.assertFalse(crashed.path.exists())
+        self.assertFalse(crashed.artifacts_dir.exists())
+        self.assertTrue(recent.path.exists())
+        self.assertEqual(remove_stale_journals(self.journal_dir, 0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from pdf_buffer import PdfBuffer
+from pdf_cache import PdfCache, cache_key_from_url
+
+
+def _pdf(fill: bytes, size: int = 100) -> PdfBuffer:
+    return PdfBuffer.from_bytes(b"%PDF-" + fill * (size - 5))
+
+
+class PdfCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PdfCache(self.tmp.name, max_bytes=150)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_get_returns_owned_copy(self):
+        self.cache.put("2401.00001v1", _pdf(b"a"))
+        pdf = self.cache.get("2401.00001v1")
+        self.assertEqual(pdf.read_bytes(), _pdf(b"a").read_bytes())
+        pdf.close()
+        self.assertEqual(list(self.cache.checkout_dir.iterdir()), [])
+
+    def test_buffer_survives_eviction(self):
+        self.cache.put("2401.00001v1", _pdf(b"a"))
+        pdf = self.cache.get("2401.00001v1")
+        # 두 번째 저장으로 크기 상한을 넘어 첫 항목이 LRU 제거됨
+        self.cache.put("2401.00002v1", _pdf(b"b"))
+        self.assertIsNone(self.cache.get("2401.00001v1"))
+        self.assertEqual(pdf.read_bytes()[:6], b"%PDF-a")
+        pdf.close()
+
+    def test_corrupted_object_is_removed(self):
+        sha256 = self.cache.put("2401.00001v1", _pdf(b"a"))
+        self.cache._object_path(sha256).write_bytes(b"%PDF-" + b"x" * 95)
+        self.assertIsNone(self.cache.get("2401.00001v1"))
+        self.assertEqual(self.cache.total_bytes(), 0)
+
+    def test_missing_object_is_removed(self):
+        sha256 = self.cache.put("2401.00001v1", _pdf(b"a"))
+        self.cache._object_path(sha256).unlink()
+        self.assertIsNone(self.cache.get("2401.00001v1"))
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_versioned_urls(self):
+        self.assertEqual(cache_key_from_url("http://arxiv.org/pdf/2401.12345v2.pdf"), "2401.12345v2")
+        self.assertEqual(cache_key_from_url("http://arxiv.org/pdf/cs/0112017v1"), "cs/0112017v1")
+
+    def test_unversioned_url_is_not_cached(self):
+        self.assertIsNone(cache_key_from_url("http://arxiv.org/pdf/2401.12345.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+import openai
+
+import paper_reviewer_handler
+import pipeline
+from paper_catalog import PaperCatalog
+from paper_journal import STAGE_DOWNLOADED, STAGE_REJECTED, TERMINAL_STAGES, PaperJournal
+from paper_reviewer_handler import ReviewError
+from pdf_buffer import PdfBuffer
+
+PAPER_ID = "2610.00001v1"
+EXTRACTION = {"text": "paper text", "backend": "test", "pages_read": 1, "total_pages": 1, "pages_skipped": 0}
+
+
+def api_error() -> openai.APIConnectionError:
+    return openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+
+
+def make_job(paper_id: str = PAPER_ID) -> dict:
+    return {"index": 1, "total": 1, "start_time": 0.0, "paper_data": {"paperId": paper_id}, "pdf_content": PdfBuffer.from_bytes(b"%PDF")}
+
+
+def make_reviewer(run_review) -> mock.Mock:
+    reviewer = mock.Mock(model="gpt-test", prompt_version="v1", review_mode="reflection", ensemble_size=1)
+    reviewer.review_rounds.return_value = 0
+    reviewer.prepare_paper.side_effect = lambda text, rounds: text
+    reviewer.run_review = run_review
+    return reviewer
+
+
+def session(review) -> SimpleNamespace:
+    usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
+    return SimpleNamespace(final_review=review, reviews=[review] if review else [], usage=usage)
+
+
+class ReviewOutcomeTest(unittest.TestCase):
+    """리뷰 오류는 부적절 판단과 달리 카탈로그/저널에 끝난 논문으로 남지 않는지"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.catalog = PaperCatalog(str(Path(tmp.name) / "papers.sqlite3"))
+        self.journal = PaperJournal(tmp.name, "scheduled-20261010000000-abcdef", "scheduled")
+        self.addCleanup(self.journal.close)
+        self.journal.record_fetched([make_job(paper_id)["paper_data"] for paper_id in ("2610.00001v1", "2610.00002v1", "2610.00003v1")])
+        self.extraction = dict(EXTRACTION)
+        patches = [
+            mock.patch.object(pipeline, "get_paper_catalog", return_value=self.catalog),
+            mock.patch.object(pipeline, "get_active_journal", return_value=self.journal),
+            mock.patch.object(paper_reviewer_handler, "get_review_store", return_value=None),
+            mock.patch.object(paper_reviewer_handler, "extract_pdf_text_async", side_effect=self._extract),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    async def _extract(self, pdf_content, max_length):
+        return self.extraction
+
+    def _stage_review(self, run_review, job: dict = None) -> dict:
+        job = job or make_job()
+        with mock.patch("builtins.print"):
+            proceed = asyncio.run(pipeline.stage_review(job, make_reviewer(run_review)))
+        self.assertFalse(proceed)
+        return job
+
+    def test_api_error_not_rejected(self):
+        job = self._stage_review(mock.AsyncMock(side_effect=api_error()))
+
+        self.assertFalse(job.get("finished"))
+        self.assertEqual(self.catalog.finished_ids([PAPER_ID]), set())
+        self.assertEqual(self.catalog.stats()["부적절"], 0)
+
+    def test_api_error_resumable_from_journal(self):
+        job = make_job()
+        asyncio.run(pipeline.record_stage(job, "download"))
+        self._stage_review(mock.AsyncMock(side_effect=api_error()), job)
+
+        # 터미널 단계가 아니므로 --resume으로 재개하면 다시 리뷰
+        entry = self.journal.replay()[PAPER_ID]
+        self.assertEqual(entry["stage"], STAGE_DOWNLOADED)
+        self.assertNotIn(entry["stage"], TERMINAL_STAGES)
+
+    def test_empty_review_and_extraction_not_rejected(self):
+        self._stage_review(mock.AsyncMock(return_value=session(None)))
+        self.extraction["text"] = ""
+        self._stage_review(mock.AsyncMock(return_value=session({"recommendation": "Accept"})))
+
+        self.assertEqual(self.catalog.stats(), {"업로드": 0, "부적절": 0})
+
+    def test_rejection_recorded(self):
+        job = self._stage_review(mock.AsyncMock(return_value=session({"recommendation": "Reject", "overall_score": 2})))
+
+        self.assertTrue(job.get("finished"))
+        self.assertEqual(self.catalog.finished_ids([PAPER_ID]), {PAPER_ID})
+        self.assertEqual(self.journal.replay()[PAPER_ID]["stage"], STAGE_REJECTED)
+
+    def test_review_paper_raises(self):
+        reviewer = make_reviewer(mock.AsyncMock(side_effect=api_error()))
+
+        with mock.patch("builtins.print"), self.assertRaises(ReviewError):
+            asyncio.run(paper_reviewer_handler.review_paper(PdfBuffer.from_bytes(b"%PDF"), reviewer, PAPER_ID))
+
+    def test_batch_error_not_rejected(self):
+        jobs = {paper_id: make_job(paper_id) for paper_id in ("2610.00001v1", "2610.00002v1", "2610.00003v1")}
+        review_results = [ReviewError("API 오류"), None, {"recommendation": "Accept"}]
+        results = []
+
+        async def download(job):
+            job["pdf_content"] = PdfBuffer.from_bytes(b"%PDF")
+            return True
+
+        async def upload(job):
+            await pipeline.record_stage(job, "upload", uploaded=True)
+            return True
+
+        with mock.patch.object(pipeline, "create_job", side_effect=lambda paper, index, total: jobs[paper]), \
+                mock.patch.object(pipeline, "stage_triage", mock.AsyncMock(return_value=True)), \
+                mock.patch.object(pipeline, "stage_download", side_effect=download), \
+                mock.patch.object(pipeline, "review_papers_batch", mock.AsyncMock(return_value=review_results)), \
+                mock.patch.object(pipeline, "stage_summarize", mock.AsyncMock(return_value=True)), \
+                mock.patch.object(pipeline, "stage_upload", side_effect=upload):
+            asyncio.run(pipeline.run_batch_pipeline(list(jobs), mock.Mock(), lambda job, ok: results.append((job, ok))))
+
+        self.assertEqual(sorted((job["paper_data"]["paperId"], ok) for job, ok in results),
+                         [("2610.00001v1", False), ("2610.00002v1", False), ("2610.00003v1", True)])
+        self.assertFalse(jobs["2610.00001v1"].get("finished"))
+        self.assertEqual(self.catalog.finished_ids(jobs), {"2610.00002v1", "2610.00003v1"})
+        self.assertEqual(self.catalog.stats()["부적절"], 1)
+        stages = {paper_id: entry["stage"] for paper_id, entry in self.journal.replay().items()}
+        self.assertNotIn(stages["2610.00001v1"], TERMINAL_STAGES)
+        self.assertEqual(stages["2610.00002v1"], STAGE_REJECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
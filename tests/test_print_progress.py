@@ -0,0 +1,51 @@
+import asyncio
+import contextlib
+import io
+import unittest
+
+from logger import current_paper, print_progress
+
+
+class PrintProgressTest(unittest.TestCase):
+    def _output(self, func) -> str:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            func()
+        return stdout.getvalue()
+
+    def test_untagged_outside_paper(self):
+        self.assertEqual(self._output(lambda: print_progress("  → 시작")), "  → 시작\n")
+
+    def test_tag_after_indent(self):
+        def run():
+            token = current_paper.set("3/10 2401.12345v1")
+            try:
+                print_progress("  ✗ 실패\n")
+            finally:
+                current_paper.reset(token)
+
+        self.assertEqual(self._output(run), "  [3/10 2401.12345v1] ✗ 실패\n\n")
+
+    def test_concurrent_papers_whole_lines(self):
+        async def paper(paper_id: str) -> None:
+            current_paper.set(paper_id)
+            print_progress("  → 논문 적절성 판단 중...")
+            await asyncio.sleep(0)
+            print_progress("  → 논문 적절성 판단: 성공 (적절한 논문)")
+
+        async def run() -> None:
+            await asyncio.gather(paper("1/2 a"), paper("2/2 b"))
+
+        lines = self._output(lambda: asyncio.run(run())).splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(sorted(lines), sorted([
+            "  [1/2 a] → 논문 적절성 판단 중...",
+            "  [2/2 b] → 논문 적절성 판단 중...",
+            "  [1/2 a] → 논문 적절성 판단: 성공 (적절한 논문)",
+            "  [2/2 b] → 논문 적절성 판단: 성공 (적절한 논문)",
+        ]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import json
+import unittest
+from unittest import mock
+
+import reviewer
+from reviewer import PaperReflection, PaperReview, parse_review_response, response_format_for, reviews_converged
+
+REVIEW = {
+    "content": "Summary: a solid paper.",
+    "recommendation": "Accept",
+    "overall_score": 7,
+    "confidence": 4,
+}
+
+
+class ParseReviewResponseTest(unittest.TestCase):
+    def setUp(self):
+        stats = mock.patch.dict(reviewer.PARSE_STATS, {"schema": 0, "fallback": 0, "failed": 0})
+        stats.start()
+        self.addCleanup(stats.stop)
+
+    def test_schema_json(self):
+        review = parse_review_response(json.dumps(REVIEW), PaperReview)
+
+        self.assertEqual(review.model_dump(), REVIEW)
+        self.assertEqual(reviewer.PARSE_STATS["schema"], 1)
+
+    def test_markdown_fallback(self):
+        content = f"Here is my review:\n```json\n{json.dumps(REVIEW)}\n```\nThanks."
+        review = parse_review_response(content, PaperReview)
+
+        self.assertEqual(review.overall_score, 7)
+        self.assertEqual(reviewer.PARSE_STATS["fallback"], 1)
+
+    def test_reflection_defaults_to_not_done(self):
+        self.assertFalse(parse_review_response(json.dumps(REVIEW), PaperReflection).is_done)
+        self.assertTrue(parse_review_response(json.dumps({**REVIEW, "is_done": True}), PaperReflection).is_done)
+
+    def test_out_of_range_score_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_review_response(json.dumps({**REVIEW, "overall_score": 11}), PaperReview)
+        self.assertEqual(reviewer.PARSE_STATS["failed"], 1)
+
+    def test_missing_field_rejected(self):
+        content = json.dumps({key: value for key, value in REVIEW.items() if key != "confidence"})
+
+        with self.assertRaises(ValueError):
+            parse_review_response(content, PaperReview)
+
+    def test_empty_response_rejected(self):
+        for content in (None, "", "I am done"):
+            with self.subTest(content=content):
+                with self.assertRaises(ValueError):
+                    parse_review_response(content, PaperReview)
+
+
+class ResponseFormatTest(unittest.TestCase):
+    def test_strict_schema(self):
+        response_format = response_format_for(PaperReflection)
+        schema = response_format["json_schema"]["schema"]
+
+        self.assertEqual(response_format["type"], "json_schema")
+        self.assertTrue(response_format["json_schema"]["strict"])
+        self.assertEqual(response_format["json_schema"]["name"], "PaperReflection")
+        self.assertFalse(schema["additionalProperties"])
+        self.assertEqual(set(schema["required"]), set(REVIEW) | {"is_done"})
+        self.assertNotIn("default", schema["properties"]["is_done"])
+
+
+class ReviewsConvergedTest(unittest.TestCase):
+    def test_same_decision(self):
+        self.assertTrue(reviews_converged(REVIEW, {**REVIEW, "content": "Reworded review."}))
+        # 점수 형식(7, 7.0, "7")과 추천 대소문자/공백은 무시
+        self.assertTrue(reviews_converged(REVIEW, {**REVIEW, "overall_score": "7.0", "recommendation": " accept "}))
+
+    def test_changed_decision(self):
+        self.assertFalse(reviews_converged(REVIEW, {**REVIEW, "overall_score": 6}))
+        self.assertFalse(reviews_converged(REVIEW, {**REVIEW, "recommendation": "Weak Accept"}))
+
+    def test_missing_score(self):
+        review = {key: value for key, value in REVIEW.items() if key != "overall_score"}
+
+        self.assertTrue(reviews_converged(review, {**review, "overall_score": "n/a"}))
+        self.assertFalse(reviews_converged(review, REVIEW))
+
+
+if __name__ == "__main__":
+    unittest.main()
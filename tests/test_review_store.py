@@ -0,0 +1,123 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import review_store
+import reviewer
+from review_store import ReviewStore, paper_key_from_id, paper_key_from_text
+
+REVIEW = {"content": "Summary.", "recommendation": "Accept", "overall_score": 7, "confidence": 4}
+KEY = ("arxiv:2401.12345v1", "gpt-4o-mini", "prompt-v1", 1)
+
+
+class PaperKeyTest(unittest.TestCase):
+    def test_versioned_id_only(self):
+        self.assertEqual(paper_key_from_id("2401.12345v2"), "arxiv:2401.12345v2")
+        self.assertEqual(paper_key_from_id("cs/0112017v1"), "arxiv:cs/0112017v1")
+        self.assertIsNone(paper_key_from_id("2401.12345"))
+        self.assertIsNone(paper_key_from_id(None))
+
+    def test_text_hash(self):
+        self.assertEqual(paper_key_from_text("paper text"), paper_key_from_text("paper text"))
+        self.assertNotEqual(paper_key_from_text("paper text"), paper_key_from_text("paper text."))
+        self.assertTrue(paper_key_from_text("paper text").startswith("sha256:"))
+
+
+class ReviewStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = str(Path(tmp.name) / "nested" / "reviews.sqlite3")
+        self.store = ReviewStore(self.db_path)
+
+    def test_round_trip(self):
+        self.store.put(*KEY, REVIEW)
+
+        self.assertEqual(self.store.get(*KEY), REVIEW)
+        # 다른 인스턴스(다음 실행)에서도 조회
+        self.assertEqual(ReviewStore(self.db_path).get(*KEY), REVIEW)
+
+    def test_miss_when_key_changes(self):
+        self.store.put(*KEY, REVIEW)
+        paper_key, model, prompt_version, reflection = KEY
+
+        self.assertIsNone(self.store.get(paper_key, model, "prompt-v2", reflection))
+        self.assertIsNone(self.store.get(paper_key, "gpt-4o", prompt_version, reflection))
+        self.assertIsNone(self.store.get(paper_key, model, prompt_version, 2))
+        self.assertIsNone(self.store.get("arxiv:2401.12345v2", model, prompt_version, reflection))
+
+    def test_put_overwrites(self):
+        self.store.put(*KEY, REVIEW)
+        self.store.put(*KEY, {**REVIEW, "recommendation": "Reject"})
+
+        self.assertEqual(self.store.get(*KEY)["recommendation"], "Reject")
+        self.assertEqual(self.store.stats(), {"prompt-v1": 1})
+
+    def test_invalidate_other_prompt_versions(self):
+        paper_key, model, _, reflection = KEY
+        for prompt_version in ("prompt-v1", "prompt-v2"):
+            self.store.put(paper_key, model, prompt_version, reflection, REVIEW)
+
+        self.assertEqual(self.store.invalidate(keep_prompt_version="prompt-v2"), 1)
+        self.assertIsNone(self.store.get(*KEY))
+        self.assertEqual(self.store.stats(), {"prompt-v2": 1})
+
+    def test_invalidate_paper(self):
+        self.store.put(*KEY, REVIEW)
+        self.store.put("arxiv:2401.00001v1", *KEY[1:], REVIEW)
+
+        self.assertEqual(self.store.invalidate(paper_key=KEY[0]), 1)
+        self.assertIsNone(self.store.get(*KEY))
+        self.assertEqual(self.store.get("arxiv:2401.00001v1", *KEY[1:]), REVIEW)
+        self.assertEqual(self.store.invalidate(), 1)
+        self.assertEqual(self.store.stats(), {})
+
+
+class InvalidateCliTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = str(Path(tmp.name) / "reviews.sqlite3")
+        self.store = ReviewStore(self.db_path)
+        for paper_key in ("arxiv:2401.00001v1", "arxiv:2401.00002v1"):
+            for prompt_version in ("prompt-old", "prompt-current"):
+                self.store.put(paper_key, "gpt-4o-mini", prompt_version, 1, REVIEW)
+
+        patches = [
+            mock.patch.object(review_store, "REVIEW_CACHE_PATH", self.db_path),
+            mock.patch.object(reviewer, "compute_prompt_version", return_value="prompt-current"),
+            mock.patch("builtins.print"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _run(self, *args: str) -> None:
+        with mock.patch("sys.argv", ["review_store.py", *args]):
+            review_store.main()
+
+    def test_invalidate_keeps_current_prompt_version(self):
+        self._run("--invalidate")
+
+        self.assertEqual(self.store.stats(), {"prompt-current": 2})
+
+    def test_invalidate_paper(self):
+        self._run("--invalidate", "--paper", "2401.00001v1")
+
+        self.assertEqual(self.store.stats(), {"prompt-old": 1, "prompt-current": 1})
+        self.assertIsNone(self.store.get("arxiv:2401.00001v1", "gpt-4o-mini", "prompt-current", 1))
+
+    def test_invalidate_all(self):
+        self._run("--invalidate", "--all")
+
+        self.assertEqual(self.store.stats(), {})
+
+    def test_unversioned_paper_id_ignored(self):
+        self._run("--invalidate", "--paper", "2401.00001")
+
+        self.assertEqual(sum(self.store.stats().values()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
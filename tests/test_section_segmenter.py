@@ -0,0 +1,114 @@
+import unittest
+
+from section_segmenter import build_review_view, classify_heading, segment_paper
+
+PAPER = """Efficient Transformers: A Survey
+Alice Kim, Bob Lee
+Somewhere University
+alice@example.com
+
+Abstract
+We survey efficient transformers and compare their trade-offs.
+
+1 Introduction
+Transformers are widely used. We make three contributions:
+1 We categorize methods.
+2 We compare them.
+
+2 Related Work
+Prior surveys exist.
+
+3 Method
+Our taxonomy groups methods by mechanism.
+
+4 Experiments
+We evaluate on long-range benchmarks.
+
+5 Conclusion
+Efficient transformers remain an open problem.
+
+Acknowledgments
+We thank our funders.
+
+References
+[1] A. Author. Attention is all you need. 2017.
+[2] B. Author. Longformer. 2020.
+
+A Additional Results
+More tables.
+"""
+
+
+class ClassifyHeadingTest(unittest.TestCase):
+    def test_kinds(self):
+        self.assertEqual(classify_heading("Introduction"), "introduction")
+        self.assertEqual(classify_heading("Experimental Results and Discussion"), "experiments")
+        self.assertEqual(classify_heading("Conclusions and Future Work"), "conclusion")
+        self.assertEqual(classify_heading("Bibliography"), "references")
+        self.assertEqual(classify_heading("Proposed   Approach"), "method")
+        self.assertEqual(classify_heading("Notation"), "other")
+
+
+class SegmentPaperTest(unittest.TestCase):
+    def test_sections_in_order(self):
+        sections = segment_paper(PAPER)
+
+        self.assertEqual(
+            [section["kind"] for section in sections],
+            ["front", "abstract", "introduction", "related_work", "method", "experiments",
+             "conclusion", "acknowledgments", "references", "appendix"],
+        )
+        self.assertEqual(sections[-1]["title"], "Additional Results")
+
+    def test_sections_cover_text(self):
+        self.assertEqual("".join(section["text"] for section in segment_paper(PAPER)), PAPER)
+
+    def test_numbered_list_not_heading(self):
+        titles = [section["title"] for section in segment_paper(PAPER)]
+
+        self.assertNotIn("We categorize methods.", titles)
+        self.assertNotIn("We compare them.", titles)
+
+    def test_inline_abstract(self):
+        text = "A Paper Title\nAuthor Name\n\nAbstract—We propose a method.\n\n1 Introduction\nText.\n"
+        kinds = [section["kind"] for section in segment_paper(text)]
+
+        self.assertEqual(kinds, ["front", "abstract", "introduction"])
+
+    def test_references_mentioned_early_ignored(self):
+        text = "References\nsee below\n" + "Body text. " * 200 + "\n\nReferences\n[1] A.\n"
+        sections = segment_paper(text)
+
+        self.assertEqual([section["kind"] for section in sections], ["front", "references"])
+
+    def test_no_headings(self):
+        text = "just some extracted text without any headings at all"
+
+        self.assertEqual(segment_paper(text), [{"kind": "front", "title": "", "text": text}])
+
+
+class BuildReviewViewTest(unittest.TestCase):
+    def test_drops_authors_references_and_appendix(self):
+        view, dropped = build_review_view(PAPER)
+
+        self.assertTrue(view.startswith("Efficient Transformers: A Survey\n\nAbstract"))
+        self.assertNotIn("alice@example.com", view)
+        self.assertNotIn("Attention is all you need", view)
+        self.assertNotIn("We thank our funders", view)
+        self.assertNotIn("More tables", view)
+        self.assertIn("Efficient transformers remain an open problem.", view)
+        self.assertEqual(dropped, ["acknowledgments", "references", "appendix"])
+
+    def test_front_kept_without_abstract(self):
+        text = PAPER.replace("Abstract\n", "")
+        view, _ = build_review_view(text)
+
+        self.assertIn("We survey efficient transformers", view)
+        self.assertIn("Alice Kim", view)
+
+    def test_unsegmented_text_unchanged(self):
+        self.assertEqual(build_review_view("plain text"), ("plain text", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
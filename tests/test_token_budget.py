@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+import token_budget
+from token_budget import FALLBACK_CHARS_PER_TOKEN, TRUNCATION_MARKER, TokenBudget
+
+PAPER = (
+    "Title: A paper\n\n"
+    "1 Introduction\n" + "intro text. " * 200 + "\n\n"
+    "2 Method\n" + "method text. " * 200 + "\n\n"
+    "3 Conclusion\n" + "we conclude. " * 50 + "\n\n"
+    "References\n" + "[1] A. Author. Some paper. 2020.\n" * 200
+)
+
+
+class FallbackTokenBudgetTest(unittest.TestCase):
+    """tiktoken을 쓸 수 없을 때의 근사 계산"""
+
+    def setUp(self):
+        with mock.patch.object(token_budget, "_load_encoding", return_value=None):
+            self.budget = TokenBudget("gpt-4o-mini")
+
+    def test_count_leaves_safety_margin(self):
+        self.assertFalse(self.budget.exact)
+        self.assertEqual(FALLBACK_CHARS_PER_TOKEN, 3)
+        self.assertEqual(self.budget.count("a" * 300), 100)
+        self.assertEqual(self.budget.count("a" * 301), 101)
+
+    def test_truncate(self):
+        self.assertEqual(self.budget.truncate("a" * 10, 5), "a" * 10)
+        self.assertEqual(self.budget.truncate("a" * 30, 5), "a" * 15)
+
+    def test_fit_paper_drops_references_first(self):
+        max_tokens = self.budget.count(PAPER) - 1000
+        fitted, original_tokens = self.budget.fit_paper(PAPER, max_tokens)
+
+        self.assertEqual(original_tokens, self.budget.count(PAPER))
+        self.assertLessEqual(self.budget.count(fitted), max_tokens)
+        self.assertIn("we conclude.", fitted)
+        self.assertTrue(fitted.endswith(TRUNCATION_MARKER))
+
+    def test_fit_paper_keeps_conclusion_when_body_overflows(self):
+        fitted, _ = self.budget.fit_paper(PAPER, 500)
+
+        self.assertLessEqual(self.budget.count(fitted), 500)
+        self.assertTrue(fitted.startswith("Title: A paper"))
+        self.assertIn("3 Conclusion", fitted)
+        self.assertNotIn("References", fitted)
+
+    def test_short_paper_unchanged(self):
+        self.assertEqual(self.budget.fit_paper("short", 100), ("short", 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import ai_service
+import backend_service
+from pdf_buffer import PdfBuffer
+
+PAPER = {"paperId": "2610.00001v1", "title": "paper", "pdfUrl": "http://arxiv.org/pdf/2610.00001v1"}
+
+
+class UploadStreamTest(unittest.TestCase):
+    """PDF 스트림은 요청 직전에 열고 요청이 끝나거나 실패하면 닫는지"""
+
+    def setUp(self):
+        self.buffer = PdfBuffer.from_bytes(b"%PDF-1.7")
+        self.streams = []
+        self.sent_files = []
+        self.client = mock.Mock()
+        self.client.post = mock.AsyncMock(side_effect=self._post)
+        patches = [
+            mock.patch.object(self.buffer, "open", side_effect=self._open),
+            mock.patch.object(backend_service, "get_http_client", return_value=self.client),
+            mock.patch.object(backend_service, "load_thumbnail", return_value=None),
+            mock.patch.object(backend_service, "rate_limit", mock.AsyncMock()),
+            mock.patch.object(ai_service, "get_http_client", return_value=self.client),
+            mock.patch.object(ai_service, "rate_limit", mock.AsyncMock()),
+            mock.patch("builtins.print"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _open(self):
+        stream = PdfBuffer.open(self.buffer)
+        self.streams.append(stream)
+        return stream
+
+    async def _post(self, url, files, **kwargs):
+        self.sent_files.append([(name, not file[1].closed) for name, file in files.items()])
+        return mock.Mock(status_code=500, text="error")
+
+    def test_upload_closes_stream(self):
+        self.assertFalse(asyncio.run(backend_service.upload_paper_to_backend(PAPER, self.buffer, None)))
+
+        self.assertEqual(self.sent_files, [[("pdf", True)]])
+        self.assertEqual(len(self.streams), 1)
+        self.assertTrue(self.streams[0].closed)
+
+    def test_upload_rate_limit_failure_opens_nothing(self):
+        with mock.patch.object(backend_service, "rate_limit", mock.AsyncMock(side_effect=RuntimeError("limit"))):
+            self.assertFalse(asyncio.run(backend_service.upload_paper_to_backend(PAPER, self.buffer, None)))
+
+        self.assertEqual(self.streams, [])
+
+    def test_summarize_closes_stream(self):
+        self.assertIsNone(asyncio.run(ai_service.summarize_paper_with_ai(self.buffer, [{"userId": 1}], PAPER["paperId"])))
+
+        self.assertEqual(self.sent_files, [[("file", True)]])
+        self.assertEqual(len(self.streams), 1)
+        self.assertTrue(self.streams[0].closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+토큰 예산 모듈
+
+리뷰어 입력을 문자 수 대신 토큰 수로 제한하기 위한 모듈.
+모델의 토크나이저(tiktoken, requirements.txt에 포함)로 정확히 세고, tiktoken을 쓸 수 없으면
+컨텍스트 윈도우를 넘지 않도록 여유를 두어 3문자 = 1토큰으로 근사함.
+예산을 넘는 논문은 뒤에서부터 자르지 않고 섹션 우선순위가 낮은 구간(참고문헌 → 부록 → 본문 중간)부터 잘라냄
+"""
+
+import importlib.util
+from typing import List, Tuple
+
+from logger import setup_logger
+from section_segmenter import DROPPED_SECTION_KINDS, segment_paper
+
+logger = setup_logger("token_budget")
+
+
+# 모델별 컨텍스트 윈도우 (토큰, 접두사 일치 - 긴 접두사 우선)
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4.1": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "gpt-5": 272000,
+    "o1": 200000,
+    "o3": 200000,
+    "o4-mini": 200000,
+}
+DEFAULT_CONTEXT_WINDOW = 128000
+
+# 요청 전 예산 예약(TPM)용 토큰당 문자 수 근사값 (실제 사용량으로 다시 맞춰짐)
+CHARS_PER_TOKEN = 4
+
+# tiktoken이 없을 때 토큰 예산 계산용 토큰당 문자 수 (수식/비영어 텍스트는 토큰당 문자 수가 적으므로 보수적으로)
+FALLBACK_CHARS_PER_TOKEN = 3
+
+# 메시지 하나당 추가되는 포맷 토큰 (role, 구분자)
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+# 잘라낸 위치 표시
+TRUNCATION_MARKER = "\n[...]\n"
+
+
+def estimate_message_tokens(messages: List[dict]) -> int:
+    """
+    메시지 리스트의 입력 토큰 수 근사값 (토크나이저 없이 문자 수로 계산, 요청 전 예산 예약용)
+
+    Args:
+        messages: 대화 메시지 리스트
+
+    Returns:
+        근사 토큰 수
+    """
+    chars = sum(len(message["content"]) for message in messages)
+    return (chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN + TOKENS_PER_MESSAGE * len(messages) + TOKENS_PER_REPLY
+
+
+def context_window_for(model: str) -> int:
+    """
+    모델의 컨텍스트 윈도우 크기
+
+    Args:
+        model: 모델 이름
+
+    Returns:
+        컨텍스트 윈도우 (토큰)
+    """
+    for prefix in sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_CONTEXT_WINDOWS[prefix]
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def _load_encoding(model: str):
+    """모델의 tiktoken 인코딩 (tiktoken이 없거나 로드에 실패하면 None)"""
+    if importlib.util.find_spec("tiktoken") is None:
+        logger.warning(
+            f"tiktoken 패키지가 없어 토큰 수를 문자 수로 근사합니다 ({FALLBACK_CHARS_PER_TOKEN}문자 = 1토큰). "
+            "(pip install -r requirements.txt)"
+        )
+        return None
+
+    import tiktoken
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩 로드 실패, 토큰 수를 문자 수로 근사합니다: {e}")
+        return None
+
+
+class TokenBudget:
+    """
+    모델 토크나이저 기반 토큰 계산 및 텍스트 자르기
+    """
+
+    def __init__(self, model: str, context_tokens: int = 0):
+        """
+        Args:
+            model: 모델 이름 (토크나이저와 기본 컨텍스트 윈도우 결정)
+            context_tokens: 컨텍스트 윈도우 (0 이하이면 모델 기본값)
+        """
+        self.model = model
+        self.context_tokens = context_tokens if context_tokens > 0 else context_window_for(model)
+        self.encoding = _load_encoding(model)
+
+    @property
+    def exact(self) -> bool:
+        """토크나이저로 정확히 세는지 여부"""
+        return self.encoding is not None
+
+    def count(self, text: str) -> int:
+        """
+        텍스트의 토큰 수
+
+        Args:
+            text: 텍스트
+
+        Returns:
+            토큰 수
+        """
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return (len(text) + FALLBACK_CHARS_PER_TOKEN - 1) // FALLBACK_CHARS_PER_TOKEN
+
+    def count_messages(self, messages: List[dict]) -> int:
+        """
+        Chat Completion 메시지 리스트의 입력 토큰 수
+
+        Args:
+            messages: 대화 메시지 리스트
+
+        Returns:
+            토큰 수 (메시지 포맷 토큰 포함)
+        """
+        return sum(TOKENS_PER_MESSAGE + self.count(message["content"]) for message in messages) + TOKENS_PER_REPLY
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        텍스트를 최대 토큰 수로 자르기
+
+        Args:
+            text: 텍스트
+            max_tokens: 최대 토큰 수
+
+        Returns:
+            잘린 텍스트
+        """
+        if max_tokens <= 0:
+            return ""
+
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            return self.encoding.decode(tokens[:max_tokens])
+
+        max_chars = max_tokens * FALLBACK_CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        return text[:max_chars]
+
+    def fit_paper(self, text: str, max_tokens: int) -> Tuple[str, int]:
+        """
+        논문 텍스트를 최대 토큰 수에 맞춤
+
+        우선순위가 낮은 구간부터 잘라냄:
+        1) 참고문헌/감사의 글, 2) 부록, 3) 본문 중간 (앞부분과 결론은 최대한 유지)
+
+        Args:
+            text: 논문 텍스트
+            max_tokens: 최대 토큰 수
+
+        Returns:
+            (맞춘 텍스트, 원래 토큰 수)
+        """
+        original_tokens = self.count(text)
+        if original_tokens <= max_tokens:
+            return text, original_tokens
+
+        sections = segment_paper(text)
+        references = "".join(section["text"] for section in sections if section["kind"] in ("references", "acknowledgments"))
+        appendix = "".join(section["text"] for section in sections if section["kind"] == "appendix")
+        body_sections = [section for section in sections if section["kind"] not in DROPPED_SECTION_KINDS]
+        body = "".join(section["text"] for section in body_sections)
+        marker_tokens = self.count(TRUNCATION_MARKER)
+
+        # 1) 참고문헌, 2) 부록 순으로 잘라냄
+        for kept, tail in ((body + appendix, references), (body, appendix)):
+            remaining = max_tokens - self.count(kept) - marker_tokens
+            if tail and remaining >= 0:
+                return kept + self.truncate(tail, remaining) + TRUNCATION_MARKER, original_tokens
+
+        # 3) 본문만으로도 넘치면 결론 구간을 남기고 중간을 잘라냄
+        head = "".join(section["text"] for section in body_sections if section["kind"] != "conclusion")
+        conclusion = "".join(section["text"] for section in body_sections if section["kind"] == "conclusion")
+        conclusion_budget = min(self.count(conclusion), max_tokens // 5)
+        conclusion = self.truncate(conclusion, conclusion_budget)
+        head_budget = max_tokens - conclusion_budget - marker_tokens
+        return self.truncate(head, head_budget) + TRUNCATION_MARKER + conclusion, original_tokens